@@ -17,18 +17,9 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from typing import Optional
-from pathlib import Path
-import json
 import configuration as config
 from utilitaires.logger import creer_logger
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# ║ 📁 CONFIGURATION DES FICHIERS
-# ╚══════════════════════════════════════════════════════════════════════════════
-
-DONNEES_DIR = Path("donnees")
-CONFIG_FILE = DONNEES_DIR / "bienvenue_config.json"
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # ║ ⚙️ COG PRINCIPAL - CommandesBienvenue
 # ╚══════════════════════════════════════════════════════════════════════════════
@@ -40,28 +31,8 @@ class CommandesBienvenue(commands.Cog):
         self.bot = bot
         self.logger = creer_logger("commandes_bienvenue", config.NIVEAU_LOG)
 
-    # ═══════════════════════════════════════════════════════════════════════════
-    # ║ 📂 GESTION DE LA CONFIGURATION
-    # ╚══════════════════════════════════════════════════════════════════════════
-
-    def charger_config(self):
-        """Charge la configuration depuis le fichier JSON"""
-        try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Erreur chargement config: {e}")
-            return None
-
-    def sauvegarder_config(self, config_data):
-        """Sauvegarde la configuration"""
-        try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=4, ensure_ascii=False)
-            return True
-        except Exception as e:
-            self.logger.error(f"Erreur sauvegarde config: {e}")
-            return False
+        # Configuration par serveur partagée avec le listener bienvenue/départ
+        self.gestionnaire = bot.gestionnaire_bienvenue
 
     # ═══════════════════════════════════════════════════════════════════════════
     # ║ 🎉 GROUPE DE COMMANDES : /bienvenue
@@ -83,15 +54,6 @@ class CommandesBienvenue(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def bienvenue_status(self, interaction: discord.Interaction):
         """Affiche la configuration actuelle"""
-        conf = self.charger_config()
-
-        if not conf or "bienvenue" not in conf or "depart" not in conf:
-            await interaction.response.send_message(
-                "❌ Erreur lors du chargement de la configuration",
-                ephemeral=True
-            )
-            return
-
         # Création de l'embed
         embed = discord.Embed(
             title="⚙️ Configuration Bienvenue/Départ",
@@ -100,7 +62,7 @@ class CommandesBienvenue(commands.Cog):
         )
 
         # Section Bienvenue
-        bienvenue = conf["bienvenue"]
+        bienvenue = self.gestionnaire.obtenir(interaction.guild_id, "bienvenue")
         statut_bienvenue = "🟢 Activé" if bienvenue.get("active") else "🔴 Désactivé"
         salon_bienvenue = f"<#{bienvenue['salon_id']}>" if bienvenue.get('salon_id') else "Non configuré"
         role_auto = f"<@&{bienvenue['role_auto_id']}>" if bienvenue.get('role_auto_id') else "Aucun"
@@ -118,7 +80,7 @@ class CommandesBienvenue(commands.Cog):
         )
 
         # Section Départ
-        depart = conf["depart"]
+        depart = self.gestionnaire.obtenir(interaction.guild_id, "depart")
         statut_depart = "🟢 Activé" if depart.get("active") else "🔴 Désactivé"
         salon_depart = f"<#{depart['salon_id']}>" if depart.get('salon_id') else "Non configuré"
         message_dep = depart.get('message', '')[:50] if depart.get('message') else 'Non défini'
@@ -153,20 +115,9 @@ class CommandesBienvenue(commands.Cog):
         salon: discord.TextChannel
     ):
         """Active le système de bienvenue"""
-        conf = self.charger_config()
-
-        if not conf or "bienvenue" not in conf:
-            await interaction.response.send_message(
-                "❌ Erreur lors du chargement de la configuration",
-                ephemeral=True
-            )
-            return
-
         # Mise à jour de la config
-        conf["bienvenue"]["active"] = True
-        conf["bienvenue"]["salon_id"] = salon.id
-
-        if self.sauvegarder_config(conf):
+        if self.gestionnaire.modifier(interaction.guild_id, "bienvenue", active=True, salon_id=salon.id):
+            message = self.gestionnaire.obtenir(interaction.guild_id, "bienvenue")["message"]
             embed = discord.Embed(
                 title="✅ Système de bienvenue activé",
                 description=(
@@ -174,7 +125,7 @@ class CommandesBienvenue(commands.Cog):
                     f"**Configuration :**\n"
                     f"• Salon : {salon.mention}\n"
                     f"• Embed : Oui\n"
-                    f"• Message : `{conf['bienvenue'].get('message', 'Message par défaut')}`"
+                    f"• Message : `{message}`"
                 ),
                 color=config.COULEUR_SUCCES
             )
@@ -197,18 +148,7 @@ class CommandesBienvenue(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def bienvenue_desactiver(self, interaction: discord.Interaction):
         """Désactive le système de bienvenue"""
-        conf = self.charger_config()
-
-        if not conf or "bienvenue" not in conf:
-            await interaction.response.send_message(
-                "❌ Erreur lors du chargement de la configuration",
-                ephemeral=True
-            )
-            return
-
-        conf["bienvenue"]["active"] = False
-
-        if self.sauvegarder_config(conf):
+        if self.gestionnaire.modifier(interaction.guild_id, "bienvenue", active=False):
             embed = discord.Embed(
                 title="🔴 Système de bienvenue désactivé",
                 description="Les messages de bienvenue ne seront plus envoyés.",
@@ -238,18 +178,15 @@ class CommandesBienvenue(commands.Cog):
         message: str
     ):
         """Personnalise le message de bienvenue"""
-        conf = self.charger_config()
-
-        if not conf or "bienvenue" not in conf:
+        inconnues = self.gestionnaire.valider_modele("bienvenue", message)
+        if inconnues:
             await interaction.response.send_message(
-                "❌ Erreur lors du chargement de la configuration",
+                "❌ Variables inconnues : " + ", ".join(f"`{{{nom}}}`" for nom in inconnues),
                 ephemeral=True
             )
             return
 
-        conf["bienvenue"]["message"] = message
-
-        if self.sauvegarder_config(conf):
+        if self.gestionnaire.modifier(interaction.guild_id, "bienvenue", message=message):
             embed = discord.Embed(
                 title="✅ Message de bienvenue modifié",
                 description=f"**Nouveau message :**\n{message}",
@@ -291,27 +228,18 @@ class CommandesBienvenue(commands.Cog):
         role: Optional[discord.Role] = None
     ):
         """Configure le rôle automatique"""
-        conf = self.charger_config()
-
-        if not conf or "bienvenue" not in conf:
-            await interaction.response.send_message(
-                "❌ Erreur lors du chargement de la configuration",
-                ephemeral=True
-            )
-            return
-
         if role:
-            conf["bienvenue"]["role_auto_id"] = role.id
+            role_auto_id = role.id
             description = f"Le rôle {role.mention} sera attribué automatiquement aux nouveaux membres."
             titre = "✅ Rôle automatique configuré"
             couleur = config.COULEUR_SUCCES
         else:
-            conf["bienvenue"]["role_auto_id"] = None
+            role_auto_id = None
             description = "Le rôle automatique a été désactivé."
             titre = "🔴 Rôle automatique désactivé"
             couleur = config.COULEUR_AVERTISSEMENT
 
-        if self.sauvegarder_config(conf):
+        if self.gestionnaire.modifier(interaction.guild_id, "bienvenue", role_auto_id=role_auto_id):
             embed = discord.Embed(
                 title=titre,
                 description=description,
@@ -350,19 +278,7 @@ class CommandesBienvenue(commands.Cog):
         salon: discord.TextChannel
     ):
         """Active le système de départ"""
-        conf = self.charger_config()
-
-        if not conf or "depart" not in conf:
-            await interaction.response.send_message(
-                "❌ Erreur lors du chargement de la configuration",
-                ephemeral=True
-            )
-            return
-
-        conf["depart"]["active"] = True
-        conf["depart"]["salon_id"] = salon.id
-
-        if self.sauvegarder_config(conf):
+        if self.gestionnaire.modifier(interaction.guild_id, "depart", active=True, salon_id=salon.id):
             embed = discord.Embed(
                 title="✅ Système de départ activé",
                 description=f"Les messages de départ seront envoyés dans {salon.mention}",
@@ -387,18 +303,7 @@ class CommandesBienvenue(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def depart_desactiver(self, interaction: discord.Interaction):
         """Désactive le système de départ"""
-        conf = self.charger_config()
-
-        if not conf or "depart" not in conf:
-            await interaction.response.send_message(
-                "❌ Erreur lors du chargement de la configuration",
-                ephemeral=True
-            )
-            return
-
-        conf["depart"]["active"] = False
-
-        if self.sauvegarder_config(conf):
+        if self.gestionnaire.modifier(interaction.guild_id, "depart", active=False):
             embed = discord.Embed(
                 title="🔴 Système de départ désactivé",
                 description="Les messages de départ ne seront plus envoyés.",
@@ -428,18 +333,15 @@ class CommandesBienvenue(commands.Cog):
         message: str
     ):
         """Personnalise le message de départ"""
-        conf = self.charger_config()
-
-        if not conf or "depart" not in conf:
+        inconnues = self.gestionnaire.valider_modele("depart", message)
+        if inconnues:
             await interaction.response.send_message(
-                "❌ Erreur lors du chargement de la configuration",
+                "❌ Variables inconnues : " + ", ".join(f"`{{{nom}}}`" for nom in inconnues),
                 ephemeral=True
             )
             return
 
-        conf["depart"]["message"] = message
-
-        if self.sauvegarder_config(conf):
+        if self.gestionnaire.modifier(interaction.guild_id, "depart", message=message):
             embed = discord.Embed(
                 title="✅ Message de départ modifié",
                 description=f"**Nouveau message :**\n{message}",
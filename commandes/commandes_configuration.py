@@ -30,6 +30,8 @@ from utilitaires.embeds_interactifs import (
     creer_embed_menu_principal,
     VueMenuPrincipal
 )
+from utilitaires.expediteur_logs import CLE_WEBHOOK_LOGS
+from noyau.gestionnaire_configuration import CLE_ROLES_ADMIN, CLE_ROLES_MODERATEUR
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ║ ⚙️ CLASSE : CommandesConfiguration
@@ -116,6 +118,9 @@ class CommandesConfiguration(commands.Cog):
             guild_id = interaction.guild_id
             config = self.config_manager.obtenir_configuration(guild_id)
 
+            # Le jeton du webhook de logs ne doit pas sortir du bot
+            config.pop(CLE_WEBHOOK_LOGS, None)
+
             # Créer le fichier JSON
             nom_fichier = f"config_{interaction.guild.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             chemin_fichier = Path("temp") / nom_fichier
@@ -206,11 +211,25 @@ class CommandesConfiguration(commands.Cog):
                 )
                 return
 
+            # Valider l'ensemble du contenu avant de proposer l'import
+            erreurs = self.config_manager.valider_configuration(config_importee)
+            if erreurs:
+                await interaction.followup.send(
+                    "❌ Configuration invalide :\n" + "\n".join(f"• {erreur}" for erreur in erreurs[:10]),
+                    ephemeral=True
+                )
+                return
+
             guild_id = interaction.guild_id
 
             # Sauvegarder l'ancienne configuration (backup)
             config_actuelle = self.config_manager.obtenir_configuration(guild_id)
 
+            # Le webhook de logs n'est jamais importé : celui du serveur est conservé
+            config_importee.pop(CLE_WEBHOOK_LOGS, None)
+            if CLE_WEBHOOK_LOGS in config_actuelle:
+                config_importee[CLE_WEBHOOK_LOGS] = config_actuelle[CLE_WEBHOOK_LOGS]
+
             # Créer l'embed de confirmation
             embed = discord.Embed(
                 title="⚠️ Confirmation d'Import",
@@ -424,6 +443,80 @@ class CommandesConfiguration(commands.Cog):
                 ephemeral=True
             )
 
+    # ╔═════════════════════════════════════════════════════════════════════════
+    # ║ 🛡️ FONCTION 05 – /config-roles
+    # ║ 🛡️ Rôles donnant le niveau administrateur ou modérateur sur ce serveur
+    # ╚═════════════════════════════════════════════════════════════════════════
+
+    @app_commands.command(name="config-roles", description="🛡️ Ajouter ou retirer un rôle administrateur/modérateur")
+    @app_commands.describe(
+        niveau="Niveau de permission donné par le rôle",
+        role="Rôle concerné",
+        retirer="Retirer le rôle au lieu de l'ajouter"
+    )
+    @app_commands.choices(niveau=[
+        app_commands.Choice(name="Administrateur", value=CLE_ROLES_ADMIN),
+        app_commands.Choice(name="Modérateur", value=CLE_ROLES_MODERATEUR)
+    ])
+    @app_commands.checks.has_permissions(administrator=True)
+    async def config_roles(
+        self,
+        interaction: discord.Interaction,
+        niveau: app_commands.Choice[str],
+        role: discord.Role,
+        retirer: bool = False
+    ):
+        """Ajoute ou retire un rôle administrateur/modérateur du serveur"""
+        try:
+            # Vérifier que guild_id et guild existent
+            if not interaction.guild_id or not interaction.guild:
+                await interaction.response.send_message(
+                    "❌ Cette commande ne peut être utilisée qu'en serveur.",
+                    ephemeral=True
+                )
+                return
+
+            guild_id = interaction.guild_id
+
+            # Mettre à jour la liste (le cache des permissions est invalidé par la configuration)
+            modifie = self.config_manager.modifier_roles_permission(guild_id, niveau.value, role.id, retirer)
+            roles = self.config_manager.obtenir_roles_permission(guild_id) or {}
+
+            def lister(cle: str) -> str:
+                return ", ".join(f"<@&{role_id}>" for role_id in roles.get(cle, [])) or "*Aucun*"
+
+            # Créer l'embed de confirmation
+            action = "retiré du" if retirer else "ajouté au"
+            if modifie:
+                description = f"Le rôle {role.mention} a été {action} niveau **{niveau.name}**."
+            else:
+                etat = "n'était pas" if retirer else "est déjà"
+                description = f"Le rôle {role.mention} {etat} au niveau **{niveau.name}**."
+
+            embed = discord.Embed(
+                title="✅ Rôles de permission mis à jour" if modifie else "ℹ️ Aucun changement",
+                description=description,
+                color=COULEUR_SUCCES if modifie else COULEUR_PRINCIPALE,
+                timestamp=datetime.now()
+            )
+            embed.add_field(name="🛡️ Administrateurs", value=lister(CLE_ROLES_ADMIN), inline=False)
+            embed.add_field(name="⚔️ Modérateurs", value=lister(CLE_ROLES_MODERATEUR), inline=False)
+
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
+            if modifie:
+                self.logger.info(
+                    f"🛡️ Rôle {role.name} {action} niveau {niveau.name} par {interaction.user} "
+                    f"sur {interaction.guild.name}"
+                )
+
+        except Exception as e:
+            self.logger.error(f"❌ Erreur dans /config-roles : {e}")
+            await interaction.response.send_message(
+                f"❌ Une erreur est survenue : {e}",
+                ephemeral=True
+            )
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ║ 🔘 CLASSE : ConfirmationImportView
@@ -448,9 +541,13 @@ class ConfirmationImportView(discord.ui.View):
     ):
         """✅ Confirme l'import de la configuration"""
         try:
-            # Sauvegarder la nouvelle configuration
-            for cle, valeur in self.config_importee.items():
-                self.config_manager.definir(self.guild_id, cle, valeur)
+            # Appliquer toute la configuration en une seule transaction
+            if not await self.config_manager.appliquer_configuration(self.guild_id, self.config_importee):
+                await interaction.response.send_message(
+                    "❌ La sauvegarde a échoué : la configuration précédente a été restaurée.",
+                    ephemeral=True
+                )
+                return
 
             # Créer l'embed de succès
             embed = discord.Embed(
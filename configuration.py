@@ -64,6 +64,7 @@ DEBUG_MODE = os.getenv('DEBUG_MODE', 'False').lower() == 'true'
 # ╚══════════════════════════════════════════════════════════════════════════════
 
 # IDs des rôles (à configurer dans secrets.env)
+# Utilisés par défaut pour les serveurs sans rôles configurés via /config-roles
 ROLE_ADMIN_ID = int(os.getenv('ROLE_ADMIN_ID', 0))
 ROLE_MODERATEUR_ID = int(os.getenv('ROLE_MODERATEUR_ID', 0))
 
@@ -103,6 +104,23 @@ DOSSIER_LOGS = 'logs'
 FORMAT_LOG = '[%(asctime)s] [%(levelname)s] %(message)s'
 FORMAT_DATE_LOG = '%d/%m/%Y %H:%M:%S'
 
+# Écriture des logs (formatage, fichier, rotation) dans un thread dédié :
+# les loggers ne font que déposer les enregistrements dans une file
+LOGS_ASYNCHRONES = os.getenv('LOGS_ASYNCHRONES', 'True').lower() == 'true'
+
+# Fichier JSON-lines complémentaire (champs stables : event, guild_id,
+# channel_id, user_id, latency_ms), interrogeable avec utilitaires.requete_logs
+LOGS_JSON = os.getenv('LOGS_JSON', 'False').lower() == 'true'
+
+# Sauvegardes de rotation compressées (gzip) en arrière-plan
+LOGS_COMPRESSION = os.getenv('LOGS_COMPRESSION', 'True').lower() == 'true'
+
+# Rétention : âge maximum (jours) et budget total du dossier (Mo),
+# appliqués périodiquement (secondes)
+LOGS_RETENTION_JOURS = int(os.getenv('LOGS_RETENTION_JOURS', '30'))
+LOGS_TAILLE_MAX_MO = int(os.getenv('LOGS_TAILLE_MAX_MO', '500'))
+LOGS_RETENTION_INTERVALLE = int(os.getenv('LOGS_RETENTION_INTERVALLE', '21600'))
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ║ 🔧 SECTION 06 – PARAMÈTRES AVANCÉS
 # ║ ⚙️ Intents Discord et limites système
@@ -166,6 +184,114 @@ MESSAGE_DEPART_DEFAUT = "**{username}** a quitté le serveur après {jours} jour
 COULEUR_BIENVENUE = 0x57F287  # Vert
 COULEUR_DEPART = 0xED4245     # Rouge
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ 💾 SECTION 10 – PERSISTANCE DE LA CONFIGURATION
+# ║ 🗄️ Backend de stockage et écriture différée de la configuration des serveurs
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+# Backend de stockage : 'json' (fichier unique) ou 'sqlite' (une ligne par serveur et par clé)
+CONFIG_STOCKAGE = os.getenv('CONFIG_STOCKAGE', 'json').lower()
+
+# Intervalle maximum (en secondes) entre deux sauvegardes des modifications en attente
+CONFIG_INTERVALLE_SAUVEGARDE = float(os.getenv('CONFIG_INTERVALLE_SAUVEGARDE', '5'))
+
+# Nombre de serveurs modifiés déclenchant une sauvegarde immédiate
+CONFIG_SEUIL_SAUVEGARDE = int(os.getenv('CONFIG_SEUIL_SAUVEGARDE', '50'))
+
+# Nombre d'entrées du journal (backend JSON) déclenchant une compaction
+CONFIG_SEUIL_COMPACTION = int(os.getenv('CONFIG_SEUIL_COMPACTION', '1000'))
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ 🌊 SECTION 11 – AFFLUX D'ARRIVÉES
+# ║ 🚦 Regroupement des messages de bienvenue et des logs lors d'arrivées massives
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+# Nombre d'arrivées dans la fenêtre déclenchant le mode afflux
+AFFLUX_SEUIL = int(os.getenv('AFFLUX_SEUIL', '10'))
+
+# Durée (en secondes) de la fenêtre de mesure du débit d'arrivées
+AFFLUX_FENETRE = float(os.getenv('AFFLUX_FENETRE', '10'))
+
+# Délai (en secondes) entre deux résumés pendant un afflux
+AFFLUX_INTERVALLE_RESUME = float(os.getenv('AFFLUX_INTERVALLE_RESUME', '15'))
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ 🎭 SECTION 12 – RÔLES AUTOMATIQUES
+# ║ 🚦 File d'attribution du rôle automatique et limitation de débit
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+# Nombre maximum d'attributions en attente (au-delà, les nouvelles sont ignorées)
+ROLE_AUTO_TAILLE_FILE = int(os.getenv('ROLE_AUTO_TAILLE_FILE', '5000'))
+
+# Nombre de workers d'attribution
+ROLE_AUTO_WORKERS = int(os.getenv('ROLE_AUTO_WORKERS', '2'))
+
+# Attributions en rafale puis attributions par seconde, par serveur
+ROLE_AUTO_CAPACITE = int(os.getenv('ROLE_AUTO_CAPACITE', '5'))
+ROLE_AUTO_DEBIT = float(os.getenv('ROLE_AUTO_DEBIT', '1'))
+
+# Nombre maximum de tentatives par attribution (429 / erreurs serveur)
+ROLE_AUTO_ESSAIS = int(os.getenv('ROLE_AUTO_ESSAIS', '5'))
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ 📮 SECTION 13 – ENVOI DES LOGS DISCORD
+# ║ 📦 Files de priorité et regroupement des embeds de logs par salon
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+# Attente maximale (en secondes) avant l'envoi d'un lot de logs incomplet
+LOGS_DELAI_ENVOI = float(os.getenv('LOGS_DELAI_ENVOI', '2'))
+
+# Envoi des logs par un webhook créé automatiquement sur chaque salon de logs
+# (limites de débit séparées de celles des commandes du bot)
+LOGS_MODE_WEBHOOK = os.getenv('LOGS_MODE_WEBHOOK', 'False').lower() == 'true'
+
+# Nombre de lots en cours d'envoi au-delà duquel les nouveaux logs restent en file
+LOGS_ENVOIS_SIMULTANES = int(os.getenv('LOGS_ENVOIS_SIMULTANES', '4'))
+
+# Taille des files de logs par priorité (haute : modération, moyenne : membres/salons, basse : messages)
+LOGS_FILE_HAUTE = int(os.getenv('LOGS_FILE_HAUTE', '1000'))
+LOGS_FILE_MOYENNE = int(os.getenv('LOGS_FILE_MOYENNE', '1000'))
+LOGS_FILE_BASSE = int(os.getenv('LOGS_FILE_BASSE', '500'))
+
+# Politique quand une file est pleine : 'ancien' (abandonne le plus ancien),
+# 'nouveau' (refuse le nouveau) ou 'fusionner' (remplace un log en attente du même message)
+LOGS_POLITIQUE_HAUTE = os.getenv('LOGS_POLITIQUE_HAUTE', 'ancien')
+LOGS_POLITIQUE_MOYENNE = os.getenv('LOGS_POLITIQUE_MOYENNE', 'ancien')
+LOGS_POLITIQUE_BASSE = os.getenv('LOGS_POLITIQUE_BASSE', 'fusionner')
+
+# Logs non livrés (panne Discord, salon inaccessible) conservés sur disque :
+# nombre maximum d'embeds gardés et intervalle (en secondes) entre deux tentatives de renvoi
+LOGS_SPOOL_TAILLE_MAX = int(os.getenv('LOGS_SPOOL_TAILLE_MAX', '5000'))
+LOGS_SPOOL_INTERVALLE = float(os.getenv('LOGS_SPOOL_INTERVALLE', '30'))
+
+# Durée (en secondes) pendant laquelle les modifications d'un même message
+# sont regroupées en un seul log (première et dernière version)
+LOGS_FENETRE_MODIFICATIONS = float(os.getenv('LOGS_FENETRE_MODIFICATIONS', '30'))
+
+# Durée (en secondes) pendant laquelle les changements de rôles d'un même membre
+# sont regroupés en un seul log (bilan net des ajouts et retraits)
+LOGS_FENETRE_ROLES = float(os.getenv('LOGS_FENETRE_ROLES', '5'))
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ 📡 SECTION 14 – RÉPARTITION DES ÉVÉNEMENTS
+# ║ 📦 Listener unique par événement Discord et mesure des gestionnaires
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+# Durée (en secondes) au-delà de laquelle un gestionnaire d'événement est signalé comme lent
+EVENEMENTS_SEUIL_LENT = float(os.getenv('EVENEMENTS_SEUIL_LENT', '1'))
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ 🧠 SECTION 15 – MÉMOIRE DES MESSAGES
+# ║ 📦 Contenu des messages récents pour les suppressions/modifications hors cache
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+# Nombre maximum de messages conservés par serveur (les plus anciens sont oubliés)
+MEMOIRE_MESSAGES_TAILLE = int(os.getenv('MEMOIRE_MESSAGES_TAILLE', '5000'))
+
+# Compression zlib des contenus d'au moins MEMOIRE_MESSAGES_SEUIL_COMPRESSION octets
+MEMOIRE_MESSAGES_COMPRESSION = os.getenv('MEMOIRE_MESSAGES_COMPRESSION', 'True').lower() == 'true'
+MEMOIRE_MESSAGES_SEUIL_COMPRESSION = int(os.getenv('MEMOIRE_MESSAGES_SEUIL_COMPRESSION', '200'))
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ║ ✅ FIN DU FICHIER – Configuration chargée
 # ║ 📦 Toutes les variables sont maintenant disponibles globalement
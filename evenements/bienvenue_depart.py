@@ -16,18 +16,10 @@
 import discord
 from discord.ext import commands
 from datetime import datetime, timezone
-import json
-import os
-from pathlib import Path
 import configuration as config
 from utilitaires.logger import creer_logger
-
-# ═══════════════════════════════════════════════════════════════════════════════
-# ║ 📁 CONFIGURATION DES FICHIERS
-# ╚══════════════════════════════════════════════════════════════════════════════
-
-DONNEES_DIR = Path("donnees")
-CONFIG_FILE = DONNEES_DIR / "bienvenue_config.json"
+from utilitaires.afflux import formater_liste_membres
+from noyau.repartiteur_evenements import MEMBRE_ARRIVE, MEMBRE_PARTI, ContexteEvenement
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ║ 🎉 COG PRINCIPAL - BienvenueDepart
@@ -39,73 +31,44 @@ class BienvenueDepart(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.logger = creer_logger("bienvenue_depart", config.NIVEAU_LOG)
-        self.config = self.charger_config()
 
-        # Créer le dossier donnees si nécessaire
-        DONNEES_DIR.mkdir(exist_ok=True)
+        # Configuration par serveur partagée avec les commandes /bienvenue et /depart
+        self.gestionnaire = bot.gestionnaire_bienvenue
 
-    # ═══════════════════════════════════════════════════════════════════════════
-    # ║ 📂 GESTION DE LA CONFIGURATION
-    # ╚══════════════════════════════════════════════════════════════════════════
-
-    def charger_config(self):
-        """Charge la configuration depuis le fichier JSON"""
-        config_par_defaut = {
-            "bienvenue": {
-                "active": False,
-                "salon_id": None,
-                "message": "Bienvenue {mention} sur **{serveur}** ! 🎉",
-                "embed_actif": True,
-                "couleur": 0x57F287,  # Vert
-                "role_auto_id": None
-            },
-            "depart": {
-                "active": False,
-                "salon_id": None,
-                "message": "**{username}** a quitté le serveur. 👋",
-                "embed_actif": True,
-                "couleur": 0xED4245  # Rouge
-            }
-        }
+    async def cog_load(self):
+        """S'inscrit aux arrivées/départs et aux résumés d'afflux"""
+        self.bot.repartiteur_evenements.inscrire(MEMBRE_ARRIVE, self.membre_arrive)
+        self.bot.repartiteur_evenements.inscrire(MEMBRE_PARTI, self.membre_parti)
+        self.bot.afflux.abonner(self._envoyer_resume_afflux)
 
-        if not CONFIG_FILE.exists():
-            self.sauvegarder_config(config_par_defaut)
-            return config_par_defaut
-
-        try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Erreur lors du chargement de la config: {e}")
-            return config_par_defaut
-
-    def sauvegarder_config(self, config_data=None):
-        """Sauvegarde la configuration dans le fichier JSON"""
-        if config_data is None:
-            config_data = self.config
-
-        try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=4, ensure_ascii=False)
-            self.logger.info("Configuration sauvegardée")
-            return True
-        except Exception as e:
-            self.logger.error(f"Erreur lors de la sauvegarde: {e}")
-            return False
+    async def cog_unload(self):
+        """Se désinscrit des arrivées/départs et publie les bienvenues encore en attente"""
+        self.bot.repartiteur_evenements.desinscrire(MEMBRE_ARRIVE, self.membre_arrive)
+        self.bot.repartiteur_evenements.desinscrire(MEMBRE_PARTI, self.membre_parti)
+        await self.bot.afflux.desabonner(self._envoyer_resume_afflux)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # ║ 🎉 ÉVÉNEMENT : Arrivée d'un nouveau membre
     # ╚══════════════════════════════════════════════════════════════════════════
 
-    @commands.Cog.listener()
-    async def on_member_join(self, member: discord.Member):
-        """Déclenché quand un nouveau membre rejoint le serveur"""
-        conf = self.config["bienvenue"]
+    async def membre_arrive(self, contexte: ContexteEvenement, member: discord.Member):
+        """Appelé par le répartiteur quand un nouveau membre rejoint le serveur"""
+        # Arrivée comptée une seule fois, même si d'autres cogs la reçoivent
+        en_afflux = contexte.partage(("afflux", member.id), lambda: self.bot.afflux.ajouter(member))
+
+        conf = contexte.partage(
+            ("bienvenue", member.guild.id), lambda: self.gestionnaire.obtenir(member.guild.id, "bienvenue")
+        )
 
         # Vérifier si le système est activé
         if not conf["active"] or not conf["salon_id"]:
             return
 
+        # Afflux : le membre sera accueilli dans le prochain résumé
+        if en_afflux:
+            self._attribuer_role_auto(member, conf)
+            return
+
         try:
             # Récupérer le salon de bienvenue
             salon = self.bot.get_channel(conf["salon_id"])
@@ -115,17 +78,18 @@ class BienvenueDepart(commands.Cog):
 
             # Variables de remplacement
             variables = {
-                "{mention}": member.mention,
-                "{username}": member.name,
-                "{serveur}": member.guild.name,
-                "{compteur}": str(member.guild.member_count)
+                "mention": member.mention,
+                "username": member.name,
+                "serveur": member.guild.name,
+                "compteur": str(member.guild.member_count)
             }
+            message = self.gestionnaire.rendre(member.guild.id, "bienvenue", variables)
 
             # Message de bienvenue
             if conf["embed_actif"]:
                 embed = discord.Embed(
                     title="🎉 Nouveau membre !",
-                    description=self._remplacer_variables(conf["message"], variables),
+                    description=message,
                     color=conf["couleur"],
                     timestamp=datetime.now(timezone.utc)
                 )
@@ -136,28 +100,57 @@ class BienvenueDepart(commands.Cog):
                 )
                 await salon.send(embed=embed)
             else:
-                await salon.send(self._remplacer_variables(conf["message"], variables))
-
-            # Attribution automatique du rôle
-            if conf["role_auto_id"]:
-                role = member.guild.get_role(conf["role_auto_id"])
-                if role:
-                    await member.add_roles(role, reason="Attribution automatique")
-                    self.logger.info(f"Rôle {role.name} attribué à {member.name}")
+                await salon.send(message)
 
             self.logger.info(f"Bienvenue envoyée pour {member.name}")
 
         except Exception as e:
             self.logger.error(f"Erreur lors de l'envoi du message de bienvenue: {e}")
 
+        self._attribuer_role_auto(member, conf)
+
+    def _attribuer_role_auto(self, member: discord.Member, conf: dict):
+        """Confie l'attribution du rôle automatique au worker dédié (sans attendre l'API)"""
+        if conf["role_auto_id"]:
+            self.bot.roles_auto.ajouter(member, conf["role_auto_id"])
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # ║ 🌊 RÉSUMÉ D'AFFLUX
+    # ╚══════════════════════════════════════════════════════════════════════════
+
+    async def _envoyer_resume_afflux(self, guild: discord.Guild, membres: list):
+        """Accueille en un seul message les membres arrivés pendant un afflux"""
+        conf = self.gestionnaire.obtenir(guild.id, "bienvenue")
+        if not conf["active"] or not conf["salon_id"]:
+            return
+
+        salon = self.bot.get_channel(conf["salon_id"])
+        if not salon:
+            self.logger.warning(f"Salon de bienvenue introuvable: {conf['salon_id']}")
+            return
+
+        embed = discord.Embed(
+            title=f"🎉 {len(membres)} nouveaux membres !",
+            description=formater_liste_membres(membres),
+            color=conf["couleur"],
+            timestamp=datetime.now(timezone.utc)
+        )
+        embed.set_footer(
+            text=f"Bienvenue sur {guild.name} • {guild.member_count} membres",
+            icon_url=guild.icon.url if guild.icon else None
+        )
+        await salon.send(embed=embed)
+        self.logger.info(f"Résumé de bienvenue envoyé pour {len(membres)} membre(s)")
+
     # ═══════════════════════════════════════════════════════════════════════════
     # ║ 👋 ÉVÉNEMENT : Départ d'un membre
     # ╚══════════════════════════════════════════════════════════════════════════
 
-    @commands.Cog.listener()
-    async def on_member_remove(self, member: discord.Member):
-        """Déclenché quand un membre quitte le serveur"""
-        conf = self.config["depart"]
+    async def membre_parti(self, contexte: ContexteEvenement, member: discord.Member):
+        """Appelé par le répartiteur quand un membre quitte le serveur"""
+        conf = contexte.partage(
+            ("depart", member.guild.id), lambda: self.gestionnaire.obtenir(member.guild.id, "depart")
+        )
 
         # Vérifier si le système est activé
         if not conf["active"] or not conf["salon_id"]:
@@ -176,17 +169,18 @@ class BienvenueDepart(commands.Cog):
 
             # Variables de remplacement
             variables = {
-                "{username}": member.name,
-                "{serveur}": member.guild.name,
-                "{jours}": str(jours),
-                "{compteur}": str(member.guild.member_count)
+                "username": member.name,
+                "serveur": member.guild.name,
+                "jours": str(jours),
+                "compteur": str(member.guild.member_count)
             }
+            message = self.gestionnaire.rendre(member.guild.id, "depart", variables)
 
             # Message de départ
             if conf["embed_actif"]:
                 embed = discord.Embed(
                     title="👋 Membre parti",
-                    description=self._remplacer_variables(conf["message"], variables),
+                    description=message,
                     color=conf["couleur"],
                     timestamp=datetime.now(timezone.utc)
                 )
@@ -204,23 +198,13 @@ class BienvenueDepart(commands.Cog):
                 embed.set_footer(text=f"ID: {member.id}")
                 await salon.send(embed=embed)
             else:
-                await salon.send(self._remplacer_variables(conf["message"], variables))
+                await salon.send(message)
 
             self.logger.info(f"Message de départ envoyé pour {member.name}")
 
         except Exception as e:
             self.logger.error(f"Erreur lors de l'envoi du message de départ: {e}")
 
-    # ═══════════════════════════════════════════════════════════════════════════
-    # ║ 🔧 UTILITAIRES
-    # ╚══════════════════════════════════════════════════════════════════════════
-
-    def _remplacer_variables(self, texte: str, variables: dict) -> str:
-        """Remplace les variables dans un texte"""
-        for cle, valeur in variables.items():
-            texte = texte.replace(cle, valeur)
-        return texte
-
 # ══════════════════════════════════════════════════════════════════════════
 # ║ ⚙️ SETUP DU COG
 # ══════════════════════════════════════════════════════════════════════════
@@ -21,6 +21,9 @@
 import discord
 from discord.ext import commands
 from utilitaires import logs_discord
+from utilitaires.fenetre_roles import FenetreRoles, difference_roles
+from noyau.gestionnaire_permissions import cache_niveaux
+from noyau.repartiteur_evenements import MEMBRE_ARRIVE, MEMBRE_PARTI, ContexteEvenement
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
 # ║ 📦 CLASSE 01 – EventsMembres
@@ -38,19 +41,58 @@ class EventsMembres(commands.Cog):
             bot: Instance du bot Discord
         """
         self.bot = bot
+
+        # Changements de rôles successifs d'un membre regroupés en un seul log
+        self.roles = FenetreRoles(self._publier_roles, self.bot.logger)
+
         self.bot.logger.info("👥 Module EventsMembres chargé")
 
+    async def cog_load(self):
+        """S'inscrit auprès du répartiteur des événements et aux résumés d'afflux"""
+        self.bot.repartiteur_evenements.inscrire(MEMBRE_ARRIVE, self.membre_arrive)
+        self.bot.repartiteur_evenements.inscrire(MEMBRE_PARTI, self.membre_parti)
+        self.bot.afflux.abonner(self._envoyer_resume_afflux)
+
+    async def cog_unload(self):
+        """Se désinscrit du répartiteur et publie les arrivées d'afflux et les rôles en attente"""
+        self.bot.repartiteur_evenements.desinscrire(MEMBRE_ARRIVE, self.membre_arrive)
+        self.bot.repartiteur_evenements.desinscrire(MEMBRE_PARTI, self.membre_parti)
+        await self.bot.afflux.desabonner(self._envoyer_resume_afflux)
+        await self.roles.arreter()
+
+    async def _envoyer_resume_afflux(self, guild: discord.Guild, membres: list):
+        """Envoie le log groupé des arrivées d'un afflux"""
+        await logs_discord.log_member_join_afflux(self.bot, guild, membres)
+
+    async def _publier_roles(self, membre: discord.Member, ajoutes: list, retires: list):
+        """Log console et Discord du bilan des changements de rôles d'un membre"""
+        if ajoutes:
+            self.bot.logger.info(
+                f"🎭 Rôle(s) ajouté(s) | "
+                f"Membre: {membre} | "
+                f"Rôle(s): {', '.join(role.name for role in ajoutes)}"
+            )
+
+        if retires:
+            self.bot.logger.info(
+                f"🎭 Rôle(s) retiré(s) | "
+                f"Membre: {membre} | "
+                f"Rôle(s): {', '.join(role.name for role in retires)}"
+            )
+
+        await logs_discord.log_member_roles_update(self.bot, membre, ajoutes, retires)
+
     # ╔═══════════════════════════════════════════════════════════════════════════════
-    # ║ 👋 FONCTION 01 – on_member_join
-    # ║ 📝 Événement déclenché quand un membre rejoint le serveur
+    # ║ 👋 FONCTION 01 – membre_arrive
+    # ║ 📝 Appelé par le répartiteur quand un membre rejoint le serveur
     # ╚═══════════════════════════════════════════════════════════════════════════════
 
-    @commands.Cog.listener()
-    async def on_member_join(self, membre: discord.Member):
+    async def membre_arrive(self, contexte: ContexteEvenement, membre: discord.Member):
         """
-        Événement déclenché quand un membre rejoint le serveur
+        Arrivée d'un membre sur le serveur
 
         Args:
+            contexte: Contexte partagé de l'événement
             membre: Membre qui a rejoint le serveur
         """
         try:
@@ -63,25 +105,31 @@ class EventsMembres(commands.Cog):
                 f"Serveur: {membre.guild.name}"
             )
 
-            # ── 🔹 ÉTAPE 2 : Log Discord
-            # Envoyer un embed dans le salon de logs Discord
-            await logs_discord.log_member_join(self.bot, membre)
+            # ── 🔹 ÉTAPE 2 : Regroupement en cas d'afflux
+            # Le membre sera listé dans le prochain résumé (arrivée comptée une seule fois par événement)
+            if contexte.partage(("afflux", membre.id), lambda: self.bot.afflux.ajouter(membre)):
+                return
+
+            # ── 🔹 ÉTAPE 3 : Log Discord
+            # Envoyer un embed dans le salon de logs Discord (s'il est configuré)
+            if contexte.salon_logs():
+                await logs_discord.log_member_join(self.bot, membre)
 
         except Exception as e:
             # ── ⚠️ Gestion des erreurs
-            self.bot.logger.error(f"❌ Erreur dans on_member_join : {e}")
+            self.bot.logger.error(f"❌ Erreur dans membre_arrive : {e}")
 
     # ╔═══════════════════════════════════════════════════════════════════════════════
-    # ║ 👋 FONCTION 02 – on_member_remove
-    # ║ 📝 Événement déclenché quand un membre quitte le serveur
+    # ║ 👋 FONCTION 02 – membre_parti
+    # ║ 📝 Appelé par le répartiteur quand un membre quitte le serveur
     # ╚═══════════════════════════════════════════════════════════════════════════════
 
-    @commands.Cog.listener()
-    async def on_member_remove(self, membre: discord.Member):
+    async def membre_parti(self, contexte: ContexteEvenement, membre: discord.Member):
         """
-        Événement déclenché quand un membre quitte le serveur
+        Départ d'un membre du serveur
 
         Args:
+            contexte: Contexte partagé de l'événement
             membre: Membre qui a quitté le serveur
         """
         try:
@@ -94,13 +142,17 @@ class EventsMembres(commands.Cog):
                 f"Serveur: {membre.guild.name}"
             )
 
-            # ── 🔹 ÉTAPE 2 : Log Discord
-            # Envoyer un embed dans le salon de logs Discord
-            await logs_discord.log_member_leave(self.bot, membre)
+            # ── 🔹 ÉTAPE 2 : Niveau de permission oublié
+            cache_niveaux.invalider_membre(membre.guild.id, membre.id)
+
+            # ── 🔹 ÉTAPE 3 : Log Discord
+            # Envoyer un embed dans le salon de logs Discord (s'il est configuré)
+            if contexte.salon_logs():
+                await logs_discord.log_member_leave(self.bot, membre)
 
         except Exception as e:
             # ── ⚠️ Gestion des erreurs
-            self.bot.logger.error(f"❌ Erreur dans on_member_remove : {e}")
+            self.bot.logger.error(f"❌ Erreur dans membre_parti : {e}")
 
     # ╔═══════════════════════════════════════════════════════════════════════════════
     # ║ 🎭 FONCTION 03 – on_member_update
@@ -118,33 +170,14 @@ class EventsMembres(commands.Cog):
         """
         try:
             # ── 🔹 ÉTAPE 1 : Vérification des rôles
-            # Détection des changements de rôles uniquement
-            roles_added = [role for role in after.roles if role not in before.roles]
-            roles_removed = [role for role in before.roles if role not in after.roles]
+            # Différence calculée une seule fois, par ensembles d'IDs
+            roles_added, roles_removed = difference_roles(before, after)
 
             # ── 🔹 ÉTAPE 2 : Si des rôles ont changé
+            # Logs console et Discord publiés à la fermeture de la fenêtre du membre
             if roles_added or roles_removed:
-                # ── 🔹 ÉTAPE 3 : Log console
-                # Afficher l'information dans la console du bot
-                if roles_added:
-                    roles_text = ", ".join([role.name for role in roles_added])
-                    self.bot.logger.info(
-                        f"🎭 Rôle(s) ajouté(s) | "
-                        f"Membre: {after} | "
-                        f"Rôle(s): {roles_text}"
-                    )
-
-                if roles_removed:
-                    roles_text = ", ".join([role.name for role in roles_removed])
-                    self.bot.logger.info(
-                        f"🎭 Rôle(s) retiré(s) | "
-                        f"Membre: {after} | "
-                        f"Rôle(s): {roles_text}"
-                    )
-
-                # ── 🔹 ÉTAPE 4 : Log Discord
-                # Envoyer un embed dans le salon de logs Discord
-                await logs_discord.log_member_roles_update(self.bot, before, after)
+                cache_niveaux.invalider_membre(after.guild.id, after.id)
+                self.roles.ajouter(after, roles_added, roles_removed)
 
         except Exception as e:
             # ── ⚠️ Gestion des erreurs
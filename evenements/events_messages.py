@@ -21,6 +21,8 @@
 import discord
 from discord.ext import commands
 from utilitaires import logs_discord
+from utilitaires.fenetre_modifications import FenetreModifications
+from noyau.repartiteur_evenements import MESSAGE_MODIFIE, MESSAGE_SUPPRIME, ContexteEvenement
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
 # ║ 📦 CLASSE 01 – EventsMessages
@@ -38,37 +40,48 @@ class EventsMessages(commands.Cog):
             bot: Instance du bot Discord
         """
         self.bot = bot
+
+        # Modifications successives d'un message regroupées en un seul log
+        self.modifications = FenetreModifications(self._publier_modifications, self.bot.logger)
+
         self.bot.logger.info("📨 Module EventsMessages chargé")
 
+    async def cog_load(self):
+        """S'inscrit auprès du répartiteur des événements"""
+        self.bot.repartiteur_evenements.inscrire(MESSAGE_SUPPRIME, self.message_supprime)
+        self.bot.repartiteur_evenements.inscrire(MESSAGE_MODIFIE, self.message_modifie)
+
+    async def cog_unload(self):
+        """Se désinscrit du répartiteur et publie les modifications encore en attente"""
+        self.bot.repartiteur_evenements.desinscrire(MESSAGE_SUPPRIME, self.message_supprime)
+        self.bot.repartiteur_evenements.desinscrire(MESSAGE_MODIFIE, self.message_modifie)
+        await self.modifications.arreter()
+
+    async def _publier_modifications(self, before: discord.Message, after: discord.Message, nombre: int):
+        """Envoie le log regroupé des modifications d'un message"""
+        await logs_discord.log_message_edit(self.bot, before, after, modifications=nombre)
+
     # ╔═══════════════════════════════════════════════════════════════════════════════
-    # ║ 🗑️ FONCTION 01 – on_message_delete
-    # ║ 📝 Événement déclenché lors de la suppression d'un message
+    # ║ 🗑️ FONCTION 01 – message_supprime
+    # ║ 📝 Appelé par le répartiteur lors de la suppression d'un message
     # ╚═══════════════════════════════════════════════════════════════════════════════
 
-    @commands.Cog.listener()
-    async def on_message_delete(self, message: discord.Message):
+    async def message_supprime(self, contexte: ContexteEvenement, message: discord.Message):
         """
-        Événement déclenché lors de la suppression d'un message
+        Suppression d'un message de serveur
+        (messages privés et messages des bots déjà filtrés par le répartiteur)
 
         Args:
+            contexte: Contexte partagé de l'événement
             message: Message supprimé
         """
         try:
-            # ── 🔹 ÉTAPE 1 : Vérification du contexte
-            # Ignorer les messages en MP (pas de serveur)
-            if not message.guild:
-                return
-
-            # ── 🔹 ÉTAPE 2 : Filtrage des bots
-            # Ignorer les messages des bots pour éviter le spam de logs
-            if message.author.bot:
-                return
+            # ── 🔹 ÉTAPE 1 : Log Discord
+            # Envoyer un embed dans le salon de logs Discord (s'il est configuré)
+            if contexte.salon_logs():
+                await logs_discord.log_message_delete(self.bot, message)
 
-            # ── 🔹 ÉTAPE 3 : Log Discord
-            # Envoyer un embed dans le salon de logs Discord
-            await logs_discord.log_message_delete(self.bot, message)
-
-            # ── 🔹 ÉTAPE 4 : Log console
+            # ── 🔹 ÉTAPE 2 : Log console
             # Afficher l'information dans la console du bot
             channel_name = getattr(message.channel, 'name', 'Inconnu')
             contenu_apercu = message.content[:50] if message.content else "Aucun contenu"
@@ -82,44 +95,31 @@ class EventsMessages(commands.Cog):
 
         except Exception as e:
             # ── ⚠️ Gestion des erreurs
-            self.bot.logger.error(f"❌ Erreur dans on_message_delete : {e}")
+            self.bot.logger.error(f"❌ Erreur dans message_supprime : {e}")
 
     # ╔═══════════════════════════════════════════════════════════════════════════════
-    # ║ ✏️ FONCTION 02 – on_message_edit
-    # ║ 📝 Événement déclenché lors de la modification d'un message
+    # ║ ✏️ FONCTION 02 – message_modifie
+    # ║ 📝 Appelé par le répartiteur lors de la modification d'un message
     # ╚═══════════════════════════════════════════════════════════════════════════════
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message):
+    async def message_modifie(self, contexte: ContexteEvenement, before: discord.Message, after: discord.Message):
         """
-        Événement déclenché lors de la modification d'un message
+        Modification d'un message de serveur
+        (messages privés, bots et contenus inchangés déjà filtrés par le répartiteur)
 
         Args:
+            contexte: Contexte partagé de l'événement
             before: Message avant modification
             after: Message après modification
         """
         try:
-            # ── 🔹 ÉTAPE 1 : Vérification du contexte
-            # Ignorer les messages en MP (pas de serveur)
-            if not after.guild:
-                return
-
-            # ── 🔹 ÉTAPE 2 : Filtrage des bots
-            # Ignorer les messages des bots pour éviter le spam de logs
-            if after.author.bot:
-                return
-
-            # ── 🔹 ÉTAPE 3 : Vérification du contenu
-            # Ignorer si le contenu n'a pas changé
-            # (Discord envoie parfois cet événement pour les embeds auto, etc.)
-            if before.content == after.content:
-                return
-
-            # ── 🔹 ÉTAPE 4 : Log Discord
-            # Envoyer un embed dans le salon de logs Discord
-            await logs_discord.log_message_edit(self.bot, before, after)
-
-            # ── 🔹 ÉTAPE 5 : Log console
+            # ── 🔹 ÉTAPE 1 : Log Discord
+            # Regroupé par message : un seul embed à la fermeture de la fenêtre
+            # (aucune fenêtre ouverte sans salon de logs configuré)
+            if contexte.salon_logs():
+                self.modifications.ajouter(before, after)
+
+            # ── 🔹 ÉTAPE 2 : Log console
             # Afficher l'information dans la console du bot
             channel_name = getattr(after.channel, 'name', 'Inconnu')
 
@@ -131,7 +131,7 @@ class EventsMessages(commands.Cog):
 
         except Exception as e:
             # ── ⚠️ Gestion des erreurs
-            self.bot.logger.error(f"❌ Erreur dans on_message_edit : {e}")
+            self.bot.logger.error(f"❌ Erreur dans message_modifie : {e}")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 
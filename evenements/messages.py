@@ -14,6 +14,10 @@ from datetime import datetime
 # Importation de la configuration
 import configuration as config
 from utilitaires.helpers import formater_date
+from utilitaires import logs_discord
+from utilitaires.fenetre_modifications import FenetreModificationsMemorisees
+from utilitaires.logger import journaliser_evenement
+from noyau.repartiteur_evenements import MESSAGE_MODIFIE, MESSAGE_SUPPRIME, ContexteEvenement
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
 # ║ 📦 CLASSE 01 – Messages
@@ -30,6 +34,24 @@ class Messages(commands.Cog):
         self.messages_supprimes = 0
         self.messages_modifies = 0
 
+        # Modifications successives d'un message hors cache regroupées en un seul log
+        self.modifications = FenetreModificationsMemorisees(self._publier_modifications, self.bot.logger)
+
+    async def cog_load(self):
+        """S'inscrit auprès du répartiteur (messages privés compris)"""
+        self.bot.repartiteur_evenements.inscrire(MESSAGE_SUPPRIME, self.message_supprime, hors_serveur=True)
+        self.bot.repartiteur_evenements.inscrire(MESSAGE_MODIFIE, self.message_modifie, hors_serveur=True)
+
+    async def cog_unload(self):
+        """Se désinscrit du répartiteur et publie les modifications hors cache encore en attente"""
+        self.bot.repartiteur_evenements.desinscrire(MESSAGE_SUPPRIME, self.message_supprime)
+        self.bot.repartiteur_evenements.desinscrire(MESSAGE_MODIFIE, self.message_modifie)
+        await self.modifications.arreter()
+
+    async def _publier_modifications(self, guild, enregistrement, avant: str, apres: str, nombre: int):
+        """Envoie le log regroupé des modifications d'un message hors cache"""
+        await logs_discord.log_message_edit_memorise(self.bot, guild, enregistrement, avant, apres, modifications=nombre)
+
     # ╔═══════════════════════════════════════════════════════════════════════════════
     # ║ 📝 FONCTION 01 – on_message
     # ║ 📝 Événement déclenché à chaque nouveau message reçu
@@ -46,6 +68,10 @@ class Messages(commands.Cog):
         # ── 🔹 Incrémentation du compteur
         self.messages_traites += 1
 
+        # ── 🔹 Conservation du contenu (logs des suppressions hors cache)
+        if message.guild:
+            self.bot.memoire_messages.memoriser(message)
+
         # ── 🔹 Log si mode debug activé
         if config.DEBUG_MODE:
             info = (
@@ -95,17 +121,12 @@ class Messages(commands.Cog):
             self.bot.logger.warning(f"⚠️ Impossible de répondre à {message.author}")
 
     # ╔═══════════════════════════════════════════════════════════════════════════════
-    # ║ 🗑️ FONCTION 03 – on_message_delete
-    # ║ 📝 Événement déclenché quand un message est supprimé
+    # ║ 🗑️ FONCTION 03 – message_supprime
+    # ║ 📝 Appelé par le répartiteur quand un message est supprimé
     # ╚═══════════════════════════════════════════════════════════════════════════════
 
-    @commands.Cog.listener()
-    async def on_message_delete(self, message: discord.Message):
-        """Événement déclenché quand un message est supprimé"""
-
-        # ── 🔹 Ignorer les messages du bot
-        if message.author.bot:
-            return
+    async def message_supprime(self, contexte: ContexteEvenement, message: discord.Message):
+        """Suppression d'un message (messages des bots déjà filtrés par le répartiteur)"""
 
         # ── 🔹 Incrémentation du compteur
         self.messages_supprimes += 1
@@ -124,21 +145,12 @@ class Messages(commands.Cog):
         # Exemple : envoyer la suppression dans un salon de logs
 
     # ╔═══════════════════════════════════════════════════════════════════════════════
-    # ║ ✏️ FONCTION 04 – on_message_edit
-    # ║ 📝 Événement déclenché quand un message est modifié
+    # ║ ✏️ FONCTION 04 – message_modifie
+    # ║ 📝 Appelé par le répartiteur quand un message est modifié
     # ╚═══════════════════════════════════════════════════════════════════════════════
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, avant: discord.Message, apres: discord.Message):
-        """Événement déclenché quand un message est modifié"""
-
-        # ── 🔹 Ignorer les messages du bot
-        if avant.author.bot:
-            return
-
-        # ── 🔹 Ignorer si le contenu n'a pas changé (edit d'embed par exemple)
-        if avant.content == apres.content:
-            return
+    async def message_modifie(self, contexte: ContexteEvenement, avant: discord.Message, apres: discord.Message):
+        """Modification d'un message (bots et contenus inchangés déjà filtrés par le répartiteur)"""
 
         # ── 🔹 Incrémentation du compteur
         self.messages_modifies += 1
@@ -179,14 +191,39 @@ class Messages(commands.Cog):
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
         """Événement pour messages supprimés non en cache"""
 
+        if payload.guild_id is None:
+            return
+
+        # ── 🔹 Le message est oublié dans tous les cas
+        enregistrement = self.bot.memoire_messages.retirer(payload.guild_id, payload.message_id)
+
+        # ── 🔹 Message en cache : déjà loggé par on_message_delete
+        if payload.cached_message is not None:
+            return
+
         # ── 🔹 Log de la suppression
         if config.DEBUG_MODE:
             self.bot.logger.debug(
                 f"🗑️ Message supprimé (non en cache) | "
                 f"ID: {payload.message_id} | "
-                f"Canal: {payload.channel_id}"
+                f"Canal: {payload.channel_id} | "
+                f"Contenu conservé: {'oui' if enregistrement else 'non'}"
             )
 
+        journaliser_evenement(
+            self.bot.logger,
+            MESSAGE_SUPPRIME,
+            guild_id=payload.guild_id,
+            channel_id=payload.channel_id,
+            user_id=enregistrement.auteur_id if enregistrement else None,
+            message=f"Message {payload.message_id} supprimé (hors cache)"
+        )
+
+        # ── 🔹 Contenu retrouvé dans la mémoire des messages (aucun appel API)
+        guild = self.bot.get_guild(payload.guild_id)
+        if enregistrement is not None and guild is not None:
+            await logs_discord.log_message_delete_memorise(self.bot, guild, enregistrement)
+
     # ╔═══════════════════════════════════════════════════════════════════════════════
     # ║ 🔍 FONCTION 07 – on_raw_message_edit
     # ║ 📝 Traite les modifications de messages non en cache
@@ -196,14 +233,41 @@ class Messages(commands.Cog):
     async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
         """Événement pour messages modifiés non en cache"""
 
+        if payload.guild_id is None or 'content' not in payload.data:
+            return
+
+        # ── 🔹 Mise à jour de la mémoire (message en cache ou non)
+        contenu = payload.data['content']
+        precedent = self.bot.memoire_messages.mettre_a_jour(payload.guild_id, payload.message_id, contenu)
+
+        # ── 🔹 Message en cache : déjà loggé par on_message_edit
+        if payload.cached_message is not None:
+            return
+
         # ── 🔹 Log de la modification
-        if config.DEBUG_MODE and 'content' in payload.data:
+        if config.DEBUG_MODE:
             self.bot.logger.debug(
                 f"✏️ Message modifié (non en cache) | "
                 f"ID: {payload.message_id} | "
                 f"Canal: {payload.channel_id}"
             )
 
+        enregistrement = self.bot.memoire_messages.obtenir(payload.guild_id, payload.message_id)
+        journaliser_evenement(
+            self.bot.logger,
+            MESSAGE_MODIFIE,
+            guild_id=payload.guild_id,
+            channel_id=payload.channel_id,
+            user_id=enregistrement.auteur_id if enregistrement else None,
+            message=f"Message {payload.message_id} modifié (hors cache)"
+        )
+
+        # ── 🔹 Contenu précédent retrouvé dans la mémoire des messages (aucun appel API)
+        # Regroupé par message : un seul embed à la fermeture de la fenêtre (première et dernière version)
+        guild = self.bot.get_guild(payload.guild_id)
+        if precedent is not None and guild is not None and enregistrement is not None:
+            self.modifications.ajouter(guild, enregistrement, precedent, contenu)
+
     # ╔═══════════════════════════════════════════════════════════════════════════════
     # ║ 🔇 FONCTION 08 – on_raw_bulk_message_delete
     # ║ 📝 Événement déclenché lors de suppressions en masse de messages
@@ -221,6 +285,42 @@ class Messages(commands.Cog):
             f"🗑️ Suppression en masse de {nombre_messages} messages | "
             f"Canal: {payload.channel_id}"
         )
+        journaliser_evenement(
+            self.bot.logger,
+            "message_bulk_delete",
+            guild_id=payload.guild_id,
+            channel_id=payload.channel_id,
+            message=f"{nombre_messages} messages supprimés"
+        )
+
+        guild = self.bot.get_guild(payload.guild_id) if payload.guild_id else None
+        if guild is None:
+            return
+
+        # ── 🔹 Contenu retrouvé : cache de discord.py, sinon mémoire des messages
+        en_cache = {message.id: message for message in payload.cached_messages}
+        messages = [
+            (
+                message.id,
+                str(message.author),
+                message.author.id,
+                message.content,
+                tuple(piece.url for piece in message.attachments)
+            )
+            for message in en_cache.values()
+        ]
+        for enregistrement in self.bot.memoire_messages.retirer_plusieurs(guild.id, payload.message_ids):
+            if enregistrement.message_id not in en_cache:
+                messages.append((
+                    enregistrement.message_id,
+                    enregistrement.auteur_nom,
+                    enregistrement.auteur_id,
+                    enregistrement.contenu,
+                    tuple(url for _, url in enregistrement.pieces_jointes)
+                ))
+
+        # ── 🔹 Un seul log, transcription jointe
+        await logs_discord.log_bulk_delete(self.bot, guild, payload.channel_id, nombre_messages, messages)
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
 # ║ 🔌 FONCTION SETUP – setup
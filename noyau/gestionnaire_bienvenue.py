@@ -0,0 +1,332 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🎉 LA LOYAUTÉ - GESTIONNAIRE BIENVENUE/DÉPART
+# ║ Discord Bot | Configuration par serveur des messages d'arrivée et de départ
+# ║ Développé par Latury
+# ║ Version 0.3.0
+# ║
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🎉 FICHIER : gestionnaire_bienvenue.py
+# ║ 📦 MODULE : noyau
+# ║ 📝 DESCRIPTION : Source unique, en mémoire et par serveur, de la configuration bienvenue/départ
+# ║ 👤 AUTEUR : Latury
+# ║ 📅 DATE : 18 octobre 2026
+# ║ 🔖 VERSION : 0.3.0
+# ║
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+import copy
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import configuration as config
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 📁 CONSTANTES
+# ║ 📝 Valeurs par défaut et ancien fichier global
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+ANCIEN_FICHIER_BIENVENUE = "donnees/bienvenue_config.json"
+
+SECTIONS = ("bienvenue", "depart")
+
+# Variables utilisables dans les messages de chaque section
+VARIABLES_AUTORISEES = {
+    "bienvenue": frozenset({"mention", "username", "serveur", "compteur"}),
+    "depart": frozenset({"username", "serveur", "jours", "compteur"})
+}
+
+MOTIF_VARIABLE = re.compile(r"\{(\w+)\}")
+
+CONFIG_PAR_DEFAUT = {
+    "bienvenue": {
+        "active": False,
+        "salon_id": None,
+        "message": "Bienvenue {mention} sur **{serveur}** ! 🎉",
+        "embed_actif": True,
+        "couleur": config.COULEUR_BIENVENUE,
+        "role_auto_id": None
+    },
+    "depart": {
+        "active": False,
+        "salon_id": None,
+        "message": "**{username}** a quitté le serveur. 👋",
+        "embed_actif": True,
+        "couleur": config.COULEUR_DEPART
+    }
+}
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 🧩 FONCTION 01 – compiler_modele
+# ║ 🎯 Découpe un message en segments (texte fixe / variable) une seule fois
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+def compiler_modele(texte: str, autorisees) -> Tuple[List[Tuple[str, Optional[str]]], List[str]]:
+    """
+    Compile un message en liste de segments
+
+    Chaque segment est un couple (texte, variable) : variable vaut None pour
+    un texte fixe. Une variable inconnue est conservée telle quelle comme
+    texte fixe et signalée dans la liste des inconnues.
+
+    Args:
+        texte: Message avec des variables {nom}
+        autorisees: Noms de variables acceptés
+
+    Returns:
+        (segments, variables inconnues)
+    """
+    segments = []
+    inconnues = []
+    position = 0
+
+    for correspondance in MOTIF_VARIABLE.finditer(texte):
+        nom = correspondance.group(1)
+        if nom not in autorisees:
+            inconnues.append(nom)
+            continue
+
+        if correspondance.start() > position:
+            segments.append((texte[position:correspondance.start()], None))
+        segments.append(("", nom))
+        position = correspondance.end()
+
+    if position < len(texte):
+        segments.append((texte[position:], None))
+
+    return segments, inconnues
+
+
+def rendre_modele(segments: List[Tuple[str, Optional[str]]], variables: Dict[str, str]) -> str:
+    """
+    Produit le message final en une seule concaténation
+
+    Args:
+        segments: Résultat de compiler_modele
+        variables: Valeurs des variables (nom sans accolades → texte)
+
+    Returns:
+        Message avec les variables remplacées
+    """
+    return "".join(variables[nom] if nom else texte for texte, nom in segments)
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 📦 CLASSE 01 – GestionnaireBienvenue
+# ║ 🎯 Service partagé par le listener et les commandes /bienvenue et /depart
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+class GestionnaireBienvenue:
+    """Configuration bienvenue/départ par serveur, stockée dans la configuration des serveurs"""
+
+    def __init__(self, config_manager, logger):
+        """
+        Initialise le gestionnaire bienvenue/départ
+
+        Args:
+            config_manager: GestionnaireConfiguration (persistance par serveur)
+            logger: Instance du logger pour les logs
+        """
+        self.config_manager = config_manager
+        self.logger = logger
+
+        # ── 🔹 Sections fusionnées avec les valeurs par défaut : (guild_id, section) → dict
+        self._cache: Dict[tuple, Dict[str, Any]] = {}
+
+        # ── 🔹 Messages compilés : (guild_id, section) → segments
+        self._modeles: Dict[tuple, List[Tuple[str, Optional[str]]]] = {}
+
+        # ── 🔹 Toute écriture de la configuration d'un serveur (commandes, /config-import) vide ses caches
+        config_manager.abonner(self._invalider_serveur)
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 🔍 FONCTION 01 – obtenir
+    # ║ 📝 Lecture en mémoire d'une section pour un serveur
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def obtenir(self, guild_id: int, section: str) -> Dict[str, Any]:
+        """
+        Obtient la configuration d'une section pour un serveur (aucun accès disque)
+
+        Args:
+            guild_id: ID du serveur Discord
+            section: 'bienvenue' ou 'depart'
+
+        Returns:
+            Dictionnaire de la section (à ne pas modifier directement)
+        """
+        cle_cache = (guild_id, section)
+        valeurs = self._cache.get(cle_cache)
+
+        if valeurs is None:
+            valeurs = copy.deepcopy(CONFIG_PAR_DEFAUT[section])
+            stockees = self.config_manager.config.get(str(guild_id), {}).get(section)
+            if stockees and self.config_manager.valider_configuration({section: stockees}):
+                # Section invalide (fichier modifié à la main, ancien format) : valeurs par défaut
+                self.logger.warning(f"⚠️ Section {section} invalide pour le serveur {guild_id}, ignorée")
+            elif stockees:
+                valeurs.update(stockees)
+            self._cache[cle_cache] = valeurs
+
+        return valeurs
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ ✏️ FONCTION 02 – modifier
+    # ║ 📝 Met à jour une section du serveur
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def modifier(self, guild_id: int, section: str, **valeurs) -> bool:
+        """
+        Modifie une ou plusieurs valeurs d'une section pour un serveur
+
+        Args:
+            guild_id: ID du serveur Discord
+            section: 'bienvenue' ou 'depart'
+            **valeurs: Clés à modifier (ex: active=True, salon_id=123)
+
+        Returns:
+            True si succès, False sinon
+        """
+        if section not in SECTIONS:
+            self.logger.error(f"❌ Section bienvenue inconnue : {section}")
+            return False
+
+        if "message" in valeurs:
+            segments, inconnues = compiler_modele(valeurs["message"], VARIABLES_AUTORISEES[section])
+            if inconnues:
+                self.logger.error(f"❌ Message {section} refusé, variables inconnues : {', '.join(inconnues)}")
+                return False
+
+        nouvelle_section = dict(self.obtenir(guild_id, section))
+        nouvelle_section.update(valeurs)
+
+        if not self.config_manager.definir(guild_id, section, nouvelle_section):
+            return False
+
+        if "message" in valeurs:
+            self._modeles[(guild_id, section)] = segments
+
+        return True
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 🧩 FONCTION 02a – valider_modele / rendre
+    # ║ 📝 Validation et rendu des messages compilés
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def valider_modele(self, section: str, texte: str) -> List[str]:
+        """
+        Vérifie les variables d'un message avant son enregistrement
+
+        Args:
+            section: 'bienvenue' ou 'depart'
+            texte: Message à vérifier
+
+        Returns:
+            Liste des variables inconnues (vide si le message est valide)
+        """
+        return compiler_modele(texte, VARIABLES_AUTORISEES[section])[1]
+
+    def rendre(self, guild_id: int, section: str, variables: Dict[str, str]) -> str:
+        """
+        Rend le message d'une section avec le modèle compilé du serveur
+
+        Args:
+            guild_id: ID du serveur Discord
+            section: 'bienvenue' ou 'depart'
+            variables: Valeurs des variables (nom sans accolades → texte)
+
+        Returns:
+            Message prêt à être envoyé
+        """
+        cle_cache = (guild_id, section)
+        segments = self._modeles.get(cle_cache)
+
+        if segments is None:
+            # Message enregistré avant la compilation (migration, import) : compilé une fois ici
+            segments, inconnues = compiler_modele(
+                self.obtenir(guild_id, section)["message"], VARIABLES_AUTORISEES[section]
+            )
+            if inconnues:
+                self.logger.warning(
+                    f"⚠️ Variables inconnues dans le message {section} du serveur {guild_id} : {', '.join(inconnues)}"
+                )
+            self._modeles[cle_cache] = segments
+
+        return rendre_modele(segments, variables)
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 🧹 FONCTION 03 – _invalider_serveur
+    # ║ 📝 Appelé par le gestionnaire de configuration après chaque écriture
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def _invalider_serveur(self, guild_id: int):
+        """Oublie les sections et les modèles compilés d'un serveur"""
+        for section in SECTIONS:
+            self._cache.pop((guild_id, section), None)
+            self._modeles.pop((guild_id, section), None)
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 📦 FONCTION 04 – migrer_ancien_fichier
+    # ║ 📝 Importe une seule fois l'ancienne configuration globale
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def migrer_ancien_fichier(self, guild_id: int, chemin: str = ANCIEN_FICHIER_BIENVENUE):
+        """
+        Importe l'ancien fichier global bienvenue_config.json dans un serveur
+
+        L'ancienne configuration ne visait qu'un serveur (salons et rôle ont
+        des IDs propres à un serveur) : elle est attribuée au serveur principal.
+
+        Args:
+            guild_id: ID du serveur principal (GUILD_ID)
+            chemin: Chemin de l'ancien fichier
+        """
+        if not os.path.exists(chemin):
+            return
+
+        if not guild_id:
+            self.logger.warning(
+                f"⚠️ {chemin} non migré : GUILD_ID non configuré pour attribuer l'ancienne configuration"
+            )
+            return
+
+        try:
+            with open(chemin, 'r', encoding='utf-8') as f:
+                ancienne_config = json.load(f)
+
+            refusees = []
+            for section in SECTIONS:
+                if section in ancienne_config and not self.config_manager.config.get(str(guild_id), {}).get(section):
+                    if not self.config_manager.definir(guild_id, section, ancienne_config[section]):
+                        refusees.append(section)
+
+            # ── 🔹 Section refusée par la validation : fichier conservé pour une correction manuelle
+            if refusees:
+                self.logger.error(
+                    f"❌ {chemin} non migré : section(s) invalide(s) {', '.join(refusees)}, "
+                    f"valeurs par défaut utilisées en attendant sa correction"
+                )
+                return
+
+            os.replace(chemin, chemin + ".migre")
+            self.logger.info(f"📦 Configuration bienvenue/départ migrée vers le serveur {guild_id}")
+
+        except Exception as e:
+            self.logger.error(f"❌ Erreur lors de la migration de {chemin} : {e}")
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║  FIN DU FICHIER gestionnaire_bienvenue.py
+# ╚══════════════════════════════════════════════════════════════════════════════
@@ -14,11 +14,21 @@
 Classe principale du bot Discord avec gestion des événements
 """
 
+import asyncio
 import discord
 from discord.ext import commands
 from typing import Optional
 import configuration as config
 from noyau.gestionnaire_configuration import GestionnaireConfiguration
+from noyau.gestionnaire_bienvenue import GestionnaireBienvenue
+from noyau.gestionnaire_roles_auto import GestionnaireRolesAuto
+from noyau.repartiteur_evenements import RepartiteurEvenements
+from noyau.memoire_messages import MemoireMessages
+from utilitaires.afflux import AgregateurAfflux
+from noyau.gestionnaire_permissions import cache_niveaux
+from utilitaires.expediteur_logs import ExpediteurLogs
+from utilitaires.logger import boucle_retention
+from utilitaires.repartiteur_logs import RepartiteurLogs
 
 # ═══════════════════════════════════════════════════════════════
 # 🤖 CLASSE PRINCIPALE - LoyauteBot
@@ -44,10 +54,40 @@ class LoyauteBot(commands.Bot):
 
         # ── 🔹 Initialisation du gestionnaire de configuration
         self.config_manager = GestionnaireConfiguration(self.logger)
+
+        # ── 🔹 Rôles administrateur / modérateur lus dans la configuration de chaque serveur
+        cache_niveaux.configurer(self.config_manager)
         self.logger.info("⚙️ Gestionnaire de configuration initialisé")
 
+        # ── 🔹 Configuration bienvenue/départ par serveur (partagée par les cogs)
+        self.gestionnaire_bienvenue = GestionnaireBienvenue(self.config_manager, self.logger)
+        self.gestionnaire_bienvenue.migrer_ancien_fichier(config.GUILD_ID)
+
+        # ── 🔹 Attribution des rôles automatiques (worker démarré dans setup_hook)
+        self.roles_auto = GestionnaireRolesAuto(self.logger)
+
+        # ── 🔹 Détection des afflux d'arrivées, partagée par les cogs bienvenue et logs membres
+        self.afflux = AgregateurAfflux(self.logger)
+
+        # ── 🔹 Envoi groupé des logs Discord par salon (file disque pendant les pannes)
+        self.expediteur_logs = ExpediteurLogs(
+            self.logger,
+            config_manager=self.config_manager,
+            resoudre_salon=self.get_channel
+        )
+
+        # ── 🔹 Files de priorité des logs Discord (traitées en tâche de fond)
+        self.repartiteur_logs = RepartiteurLogs(self.logger, self.expediteur_logs)
+
+        # ── 🔹 Listener unique par événement, distribué aux cogs inscrits
+        self.repartiteur_evenements = RepartiteurEvenements(self, self.logger)
+
+        # ── 🔹 Derniers messages de chaque serveur (logs des suppressions hors cache)
+        self.memoire_messages = MemoireMessages()
+
         # ── 🔹 Variables d'état
         self.ready_called = False
+        self.tache_retention_logs: Optional[asyncio.Task] = None
 
     # ═══════════════════════════════════════════════════════════
     # 🔧 FONCTION 01 – setup_hook
@@ -60,6 +100,20 @@ class LoyauteBot(commands.Bot):
         """
         try:
             self.logger.info("🔧 Exécution du setup_hook...")
+
+            # ── 🔹 Démarrage de la sauvegarde différée de la configuration
+            self.config_manager.demarrer_sauvegarde_differee()
+
+            # ── 🔹 Démarrage du worker des rôles automatiques
+            self.roles_auto.demarrer()
+
+            # ── 🔹 Démarrage du répartiteur des logs Discord
+            self.repartiteur_logs.demarrer()
+            self.expediteur_logs.demarrer_relecture()
+
+            # ── 🔹 Rétention des fichiers de logs (âge et taille du dossier)
+            self.tache_retention_logs = asyncio.create_task(boucle_retention(), name="retention_logs")
+
             self.logger.info("🔄 Synchronisation des commandes slash en cours...")
 
             # Récupérer GUILD_ID depuis la configuration
@@ -177,6 +231,57 @@ class LoyauteBot(commands.Bot):
     async def on_guild_remove(self, guild: discord.Guild):
         """Événement déclenché quand le bot quitte un serveur"""
         self.logger.info(f"➖ Bot retiré du serveur : {guild.name} (ID: {guild.id})")
+        self.memoire_messages.oublier_serveur(guild.id)
+        cache_niveaux.invalider_serveur(guild.id)
+
+    # ═══════════════════════════════════════════════════════════
+    # 🎭 FONCTION 07b – on_guild_role_update / on_guild_role_delete
+    # ═══════════════════════════════════════════════════════════
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Permissions d'un rôle modifiées : niveaux de permission du serveur recalculés"""
+        if before.permissions != after.permissions:
+            cache_niveaux.invalider_serveur(after.guild.id)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Rôle supprimé : niveaux de permission du serveur recalculés"""
+        cache_niveaux.invalider_serveur(role.guild.id)
+
+    # ═══════════════════════════════════════════════════════════
+    # ⏹️ FONCTION 08 – close
+    # ═══════════════════════════════════════════════════════════
+
+    async def close(self):
+        """Arrête le bot en écrivant les modifications de configuration en attente"""
+        # ── 🔹 Cogs déchargés en premier : leurs fenêtres de logs en attente (cog_unload)
+        # passent encore par le répartiteur et l'expéditeur, arrêtés juste après
+        for extension in tuple(self.extensions):
+            try:
+                await self.unload_extension(extension)
+            except Exception as e:
+                self.logger.error(f"❌ Erreur lors du déchargement de {extension} : {e}")
+        for nom in tuple(self.cogs):
+            try:
+                await self.remove_cog(nom)
+            except Exception as e:
+                self.logger.error(f"❌ Erreur lors du retrait du cog {nom} : {e}")
+
+        # ── 🔹 Producteurs de logs arrêtés avant le pipeline des logs Discord
+        await self.afflux.arreter()
+        await self.roles_auto.arreter()
+        await self.repartiteur_logs.arreter()
+        await self.expediteur_logs.fermer()
+        if self.tache_retention_logs is not None:
+            self.tache_retention_logs.cancel()
+        self.logger.info(f"⏱️ Gestionnaires d'événements : {self.repartiteur_evenements.obtenir_metriques()}")
+
+        try:
+            await self.config_manager.flush(arreter=True)
+            self.logger.info("💾 Configuration sauvegardée avant l'arrêt")
+        except Exception as e:
+            self.logger.error(f"❌ Erreur lors de la sauvegarde finale de la configuration : {e}")
+
+        await super().close()
 
 # ═══════════════════════════════════════════════════════════════
 # ✅ FIN DU FICHIER
@@ -18,11 +18,17 @@
 # ║
 # ╚═══════════════════════════════════════════════════════════════════════════════
 
+import asyncio
+import copy
 import json
 import os
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 import discord
 
+import configuration as config
+from noyau.stockage_configuration import StockageJSON, StockageSQLite
+from utilitaires.persistance import executer_sous_verrou
+
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
 # ║ 📁 CONSTANTES
@@ -30,8 +36,47 @@ import discord
 # ╚═══════════════════════════════════════════════════════════════════════════════
 
 FICHIER_CONFIG = "donnees/config_serveurs.json"
+FICHIER_CONFIG_SQLITE = "donnees/config_serveurs.db"
 DOSSIER_DONNEES = "donnees"
 
+# Rôles donnant le niveau administrateur / modérateur sur un serveur (listes d'IDs)
+CLE_ROLES_ADMIN = "roles_admin"
+CLE_ROLES_MODERATEUR = "roles_moderateur"
+
+
+def _est_id(valeur: Any) -> bool:
+    """Vrai pour un ID Discord (entier, booléens exclus)"""
+    return isinstance(valeur, int) and not isinstance(valeur, bool)
+
+
+# Champs des sections bienvenue / départ et types acceptés
+CHAMPS_DEPART = {
+    "active": lambda v: isinstance(v, bool),
+    "salon_id": lambda v: v is None or _est_id(v),
+    "message": lambda v: isinstance(v, str),
+    "embed_actif": lambda v: isinstance(v, bool),
+    "couleur": _est_id,
+}
+CHAMPS_BIENVENUE = dict(CHAMPS_DEPART, role_auto_id=lambda v: v is None or _est_id(v))
+
+
+def _section_valide(valeur: Any, champs: Dict[str, Callable[[Any], bool]]) -> bool:
+    """Vrai pour un objet ne contenant que des champs connus, chacun du bon type"""
+    return isinstance(valeur, dict) and all(
+        cle in champs and champs[cle](v) for cle, v in valeur.items()
+    )
+
+
+# Validation des clés connues (les autres clés doivent seulement être sérialisables en JSON)
+VALIDATEURS_CLES = {
+    "bienvenue": lambda v: _section_valide(v, CHAMPS_BIENVENUE),
+    "depart": lambda v: _section_valide(v, CHAMPS_DEPART),
+    "logs_channel_id": lambda v: v is None or _est_id(v),
+    "logs_webhook": lambda v: v is None or (isinstance(v, dict) and {"salon_id", "id", "token"} <= v.keys()),
+    CLE_ROLES_ADMIN: lambda v: isinstance(v, list) and all(_est_id(i) for i in v),
+    CLE_ROLES_MODERATEUR: lambda v: isinstance(v, list) and all(_est_id(i) for i in v),
+}
+
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
 # ║ 📦 CLASSE 01 – GestionnaireConfiguration
@@ -41,41 +86,65 @@ DOSSIER_DONNEES = "donnees"
 class GestionnaireConfiguration:
     """Gère la configuration des serveurs Discord"""
 
-    def __init__(self, logger):
+    def __init__(
+        self,
+        logger,
+        intervalle_sauvegarde: float = config.CONFIG_INTERVALLE_SAUVEGARDE,
+        seuil_sauvegarde: int = config.CONFIG_SEUIL_SAUVEGARDE
+    ):
         """
         Initialise le gestionnaire de configuration
 
         Args:
             logger: Instance du logger pour les logs
+            intervalle_sauvegarde: Délai maximum (secondes) avant l'écriture des modifications
+            seuil_sauvegarde: Nombre de serveurs modifiés déclenchant une écriture immédiate
         """
         self.logger = logger
         self.config = {}
+
+        # ── 🔹 Écriture différée : serveurs modifiés en attente de sauvegarde
+        self.intervalle_sauvegarde = intervalle_sauvegarde
+        self.seuil_sauvegarde = seuil_sauvegarde
+        self._serveurs_modifies: Set[str] = set()
+        self._tache_sauvegarde: Optional[asyncio.Task] = None
+        self._evenement_seuil = asyncio.Event()
+
+        # ── 🔹 Fonctions appelées avec l'ID du serveur après chaque modification
+        self._abonnes: List[Callable[[int], None]] = []
+
+        self._stockage = None
         self._charger_configuration()
 
 
     # ╔═══════════════════════════════════════════════════════════════════════════════
     # ║ 📂 FONCTION 01 – _charger_configuration
-    # ║ 📝 Charge la configuration depuis le fichier JSON
+    # ║ 📝 Charge la configuration depuis le backend de stockage
     # ╚═══════════════════════════════════════════════════════════════════════════════
 
     def _charger_configuration(self):
-        """Charge la configuration depuis le fichier JSON"""
+        """Charge la configuration depuis le backend de stockage (JSON ou SQLite)"""
         try:
             # ── 🔹 ÉTAPE 1 : Vérifier si le dossier existe
             if not os.path.exists(DOSSIER_DONNEES):
                 os.makedirs(DOSSIER_DONNEES)
                 self.logger.info(f"📁 Dossier '{DOSSIER_DONNEES}' créé")
 
-            # ── 🔹 ÉTAPE 2 : Vérifier si le fichier existe
-            if os.path.exists(FICHIER_CONFIG):
-                with open(FICHIER_CONFIG, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
-                self.logger.info(f"✅ Configuration chargée : {len(self.config)} serveur(s)")
+            # ── 🔹 ÉTAPE 2 : Sélection du backend
+            if config.CONFIG_STOCKAGE == "sqlite":
+                self._stockage = StockageSQLite(
+                    FICHIER_CONFIG_SQLITE,
+                    self.logger,
+                    fichier_json_migration=FICHIER_CONFIG
+                )
             else:
-                # ── 🔹 ÉTAPE 3 : Créer un fichier vide si inexistant
-                self.config = {}
-                self._sauvegarder_configuration()
-                self.logger.info(f"📝 Fichier de configuration créé : {FICHIER_CONFIG}")
+                self._stockage = StockageJSON(FICHIER_CONFIG, self.logger)
+
+            # ── 🔹 ÉTAPE 3 : Chargement
+            self.config = self._stockage.charger()
+            self.logger.info(
+                f"✅ Configuration chargée ({config.CONFIG_STOCKAGE}) : {len(self.config)} serveur(s)"
+            )
 
         except Exception as e:
             self.logger.error(f"❌ Erreur lors du chargement de la configuration : {e}")
@@ -84,17 +153,165 @@ class GestionnaireConfiguration:
 
     # ╔═══════════════════════════════════════════════════════════════════════════════
     # ║ 💾 FONCTION 02 – _sauvegarder_configuration
-    # ║ 📝 Sauvegarde la configuration dans le fichier JSON
+    # ║ 📝 Sauvegarde la configuration via le backend de stockage
     # ╚═══════════════════════════════════════════════════════════════════════════════
 
     def _sauvegarder_configuration(self):
-        """Sauvegarde la configuration dans le fichier JSON"""
+        """Sauvegarde les serveurs modifiés via le backend de stockage"""
+        if self._stockage is None:
+            return
+
+        try:
+            self._stockage.preparer_sauvegarde()
+            self._stockage.sauvegarder(self.config, self._serveurs_modifies)
+            nombre_modifies = len(self._serveurs_modifies)
+            self._serveurs_modifies.clear()
+            self.logger.debug(f"💾 Configuration sauvegardée ({nombre_modifies} serveur(s) modifié(s))")
+        except Exception as e:
+            self.logger.error(f"❌ Erreur lors de la sauvegarde de la configuration : {e}")
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 💾 FONCTION 02a – sauvegarder
+    # ║ 📝 Sauvegarde asynchrone exécutée hors de la boucle asyncio
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    async def sauvegarder(self) -> bool:
+        """
+        Sauvegarde les serveurs modifiés sans bloquer la boucle asyncio
+
+        Un instantané est pris sur la boucle, puis la sérialisation et l'écriture
+        disque s'exécutent dans un thread, une seule écriture à la fois par fichier.
+
+        Returns:
+            True si succès (ou rien à sauvegarder), False sinon
+        """
+        if self._stockage is None or not self._serveurs_modifies:
+            return True
+
+        # ── 🔹 ÉTAPE 1 : Instantané des modifications en attente
+        # (le journal est mis de côté au même instant que l'instantané)
+        self._stockage.preparer_sauvegarde()
+        modifies = set(self._serveurs_modifies)
+        self._serveurs_modifies.clear()
+
+        if self._stockage.ecriture_complete:
+            instantane = copy.deepcopy(self.config)
+        else:
+            instantane = {
+                guild_id: copy.deepcopy(self.config[guild_id])
+                for guild_id in modifies
+                if guild_id in self.config
+            }
+
+        # ── 🔹 ÉTAPE 2 : Écriture hors boucle
         try:
-            with open(FICHIER_CONFIG, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-            self.logger.debug(f"💾 Configuration sauvegardée")
+            await executer_sous_verrou(
+                self._stockage.chemin,
+                self._stockage.sauvegarder,
+                instantane,
+                modifies
+            )
+            self.logger.debug(f"💾 Configuration sauvegardée ({len(modifies)} serveur(s) modifié(s))")
+            return True
+
         except Exception as e:
+            # ── 🔹 Les serveurs restent marqués pour la prochaine tentative
+            self._serveurs_modifies.update(modifies)
             self.logger.error(f"❌ Erreur lors de la sauvegarde de la configuration : {e}")
+            return False
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 🕒 FONCTION 02b – _marquer_modifie
+    # ║ 📝 Enregistre un serveur modifié pour la prochaine sauvegarde différée
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def _marquer_modifie(self, guild_id_str: str, entree_journal: dict):
+        """
+        Journalise une modification et l'ajoute aux modifications en attente
+
+        La modification est d'abord ajoutée au journal (une ligne) : elle survit
+        à un arrêt brutal avant la prochaine sauvegarde. Sans tâche de sauvegarde
+        active (hors boucle asyncio), l'écriture reste immédiate.
+
+        Args:
+            guild_id_str: ID du serveur modifié (clé de la configuration)
+            entree_journal: Description de la modification (voir appliquer_entree_journal)
+        """
+        self._serveurs_modifies.add(guild_id_str)
+        self._notifier(int(guild_id_str))
+
+        try:
+            self._stockage.journaliser(entree_journal)
+        except Exception as e:
+            self.logger.error(f"❌ Erreur lors de l'écriture du journal de configuration : {e}")
+
+        if self._tache_sauvegarde is None or self._tache_sauvegarde.done():
+            self._sauvegarder_configuration()
+            return
+
+        if (
+            len(self._serveurs_modifies) >= self.seuil_sauvegarde
+            or self._stockage.taille_journal >= config.CONFIG_SEUIL_COMPACTION
+        ):
+            self._evenement_seuil.set()
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ ▶️ FONCTION 02c – demarrer_sauvegarde_differee
+    # ║ 📝 Lance la tâche de fond qui écrit les modifications en attente
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def demarrer_sauvegarde_differee(self):
+        """Démarre la tâche de sauvegarde différée (à appeler depuis la boucle asyncio)"""
+        if self._tache_sauvegarde is not None and not self._tache_sauvegarde.done():
+            return
+
+        self._tache_sauvegarde = asyncio.create_task(self._boucle_sauvegarde())
+        self.logger.info(
+            f"💾 Sauvegarde différée activée (intervalle : {self.intervalle_sauvegarde}s, "
+            f"seuil : {self.seuil_sauvegarde} serveur(s))"
+        )
+
+    async def _boucle_sauvegarde(self):
+        """Écrit les modifications en attente à intervalle régulier ou au seuil atteint"""
+        while True:
+            try:
+                await asyncio.wait_for(self._evenement_seuil.wait(), timeout=self.intervalle_sauvegarde)
+            except asyncio.TimeoutError:
+                pass
+
+            self._evenement_seuil.clear()
+
+            if self._serveurs_modifies:
+                await self.sauvegarder()
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 🚿 FONCTION 02d – flush
+    # ║ 📝 Force l'écriture immédiate des modifications en attente
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    async def flush(self, arreter: bool = False):
+        """
+        Écrit immédiatement toutes les modifications en attente
+
+        Args:
+            arreter: Arrête également la tâche de sauvegarde différée (arrêt du bot)
+        """
+        if arreter and self._tache_sauvegarde is not None:
+            self._tache_sauvegarde.cancel()
+            try:
+                await self._tache_sauvegarde
+            except asyncio.CancelledError:
+                pass
+            self._tache_sauvegarde = None
+
+        await self.sauvegarder()
+
+        if arreter and self._stockage is not None:
+            self._stockage.fermer()
 
 
     # ╔═══════════════════════════════════════════════════════════════════════════════
@@ -146,8 +363,11 @@ class GestionnaireConfiguration:
             # ── 🔹 ÉTAPE 2 : Définir le salon de logs
             self.config[guild_id_str]["logs_channel_id"] = channel_id
 
-            # ── 🔹 ÉTAPE 3 : Sauvegarder
-            self._sauvegarder_configuration()
+            # ── 🔹 ÉTAPE 3 : Journaliser et planifier la sauvegarde
+            self._marquer_modifie(
+                guild_id_str,
+                {"op": "definir", "g": guild_id_str, "c": "logs_channel_id", "v": channel_id}
+            )
 
             self.logger.info(f"✅ Salon de logs défini : Serveur {guild_id} → Salon {channel_id}")
             return True
@@ -185,8 +405,11 @@ class GestionnaireConfiguration:
                     if not self.config[guild_id_str]:
                         del self.config[guild_id_str]
 
-                    # ── 🔹 ÉTAPE 4 : Sauvegarder
-                    self._sauvegarder_configuration()
+                    # ── 🔹 ÉTAPE 4 : Journaliser et planifier la sauvegarde
+                    self._marquer_modifie(
+                        guild_id_str,
+                        {"op": "supprimer", "g": guild_id_str, "c": "logs_channel_id"}
+                    )
 
                     self.logger.info(f"✅ Salon de logs réinitialisé pour le serveur {guild_id}")
                     return True
@@ -198,6 +421,239 @@ class GestionnaireConfiguration:
             return False
 
 
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 📋 FONCTION 06 – obtenir_configuration
+    # ║ 📝 Retourne une copie de la configuration complète d'un serveur
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def obtenir_configuration(self, guild_id: int) -> Dict[str, Any]:
+        """
+        Obtient la configuration complète d'un serveur
+
+        Args:
+            guild_id: ID du serveur Discord
+
+        Returns:
+            Copie indépendante de la configuration (dictionnaire vide si aucune)
+        """
+        return copy.deepcopy(self.config.get(str(guild_id), {}))
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ ✏️ FONCTION 07 – definir
+    # ║ 📝 Définit une clé de configuration pour un serveur
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def definir(self, guild_id: int, cle: str, valeur: Any) -> bool:
+        """
+        Définit une valeur de configuration pour un serveur
+
+        Args:
+            guild_id: ID du serveur Discord
+            cle: Nom de la clé
+            valeur: Valeur sérialisable en JSON
+
+        Returns:
+            True si succès, False sinon
+        """
+        erreurs = self.valider_configuration({cle: valeur})
+        if erreurs:
+            self.logger.error(f"❌ Valeur de configuration refusée : {', '.join(erreurs)}")
+            return False
+
+        guild_id_str = str(guild_id)
+        self.config.setdefault(guild_id_str, {})[cle] = copy.deepcopy(valeur)
+        self._marquer_modifie(
+            guild_id_str,
+            {"op": "definir", "g": guild_id_str, "c": cle, "v": valeur}
+        )
+        return True
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 🔎 FONCTION 08 – valider_configuration
+    # ║ 📝 Valide un ensemble de clés avant application
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def valider_configuration(self, donnees: Dict[str, Any]) -> List[str]:
+        """
+        Valide une configuration complète sans la modifier
+
+        Args:
+            donnees: Dictionnaire clé → valeur à valider
+
+        Returns:
+            Liste des erreurs (vide si la configuration est valide)
+        """
+        if not isinstance(donnees, dict):
+            return ["la configuration doit être un objet JSON"]
+
+        erreurs = []
+        for cle, valeur in donnees.items():
+            if not isinstance(cle, str) or not cle:
+                erreurs.append(f"clé invalide : {cle!r}")
+                continue
+
+            validateur = VALIDATEURS_CLES.get(cle)
+            if validateur is not None and not validateur(valeur):
+                erreurs.append(f"valeur invalide pour `{cle}` : {valeur!r}")
+                continue
+
+            try:
+                json.dumps(valeur)
+            except (TypeError, ValueError):
+                erreurs.append(f"valeur non sérialisable pour `{cle}`")
+
+        return erreurs
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 📥 FONCTION 09 – appliquer_configuration
+    # ║ 📝 Remplace la configuration d'un serveur en une seule transaction
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    async def appliquer_configuration(self, guild_id: int, donnees: Dict[str, Any]) -> bool:
+        """
+        Remplace toute la configuration d'un serveur de manière transactionnelle
+
+        Le contenu est validé en entier avant toute modification, appliqué en
+        mémoire, journalisé en une seule entrée puis écrit en une seule sauvegarde.
+        En cas d'échec de l'écriture, l'ancienne configuration est restaurée.
+
+        Args:
+            guild_id: ID du serveur Discord
+            donnees: Nouvelle configuration complète (clé → valeur)
+
+        Returns:
+            True si la configuration a été appliquée et sauvegardée
+
+        Raises:
+            ValueError: Si la configuration est invalide (aucune modification effectuée)
+        """
+        # ── 🔹 ÉTAPE 1 : Validation complète
+        erreurs = self.valider_configuration(donnees)
+        if erreurs:
+            raise ValueError("Configuration invalide : " + " ; ".join(erreurs))
+
+        guild_id_str = str(guild_id)
+        ancienne = self.config.get(guild_id_str)
+        nouvelle = copy.deepcopy(donnees)
+
+        # ── 🔹 ÉTAPE 2 : Application en mémoire + une seule entrée de journal
+        if nouvelle:
+            self.config[guild_id_str] = nouvelle
+        else:
+            self.config.pop(guild_id_str, None)
+        self._serveurs_modifies.add(guild_id_str)
+        self._notifier(guild_id)
+
+        # ── 🔹 ÉTAPE 3 : Une seule écriture
+        try:
+            self._stockage.journaliser({"op": "remplacer", "g": guild_id_str, "v": nouvelle})
+            succes = await self.sauvegarder()
+        except Exception as e:
+            self.logger.error(f"❌ Erreur lors de l'application de la configuration : {e}")
+            succes = False
+
+        if succes:
+            self.logger.info(
+                f"📥 Configuration appliquée : Serveur {guild_id} ({len(nouvelle)} paramètre(s))"
+            )
+            return True
+
+        # ── 🔹 ÉTAPE 4 : Retour arrière
+        if ancienne is not None:
+            self.config[guild_id_str] = ancienne
+        else:
+            self.config.pop(guild_id_str, None)
+        self._serveurs_modifies.add(guild_id_str)
+        self._notifier(guild_id)
+
+        try:
+            self._stockage.journaliser({"op": "remplacer", "g": guild_id_str, "v": ancienne})
+        except Exception as e:
+            self.logger.error(f"❌ Erreur lors de l'écriture du journal de configuration : {e}")
+
+        self.logger.warning(f"↩️ Import annulé, configuration restaurée : Serveur {guild_id}")
+        return False
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 🛡️ FONCTION 10 – obtenir_roles_permission / modifier_roles_permission
+    # ║ 📝 Rôles administrateur et modérateur propres à chaque serveur
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def obtenir_roles_permission(self, guild_id: int) -> Optional[Dict[str, List[int]]]:
+        """
+        Obtient les rôles administrateur et modérateur configurés pour un serveur
+
+        Args:
+            guild_id: ID du serveur Discord
+
+        Returns:
+            {CLE_ROLES_ADMIN: [...], CLE_ROLES_MODERATEUR: [...]}, ou None si le
+            serveur n'en configure aucun (rôles globaux de configuration.py)
+        """
+        donnees = self.config.get(str(guild_id), {})
+        if CLE_ROLES_ADMIN not in donnees and CLE_ROLES_MODERATEUR not in donnees:
+            return None
+
+        return {
+            CLE_ROLES_ADMIN: list(donnees.get(CLE_ROLES_ADMIN, [])),
+            CLE_ROLES_MODERATEUR: list(donnees.get(CLE_ROLES_MODERATEUR, []))
+        }
+
+    def modifier_roles_permission(self, guild_id: int, cle: str, role_id: int, retirer: bool = False) -> bool:
+        """
+        Ajoute ou retire un rôle administrateur / modérateur d'un serveur
+
+        Args:
+            guild_id: ID du serveur Discord
+            cle: CLE_ROLES_ADMIN ou CLE_ROLES_MODERATEUR
+            role_id: ID du rôle
+            retirer: Retire le rôle au lieu de l'ajouter
+
+        Returns:
+            True si la liste a changé
+        """
+        roles = list(self.config.get(str(guild_id), {}).get(cle, []))
+
+        if retirer:
+            if role_id not in roles:
+                return False
+            roles.remove(role_id)
+        else:
+            if role_id in roles:
+                return False
+            roles.append(role_id)
+
+        return self.definir(guild_id, cle, roles)
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 🔔 FONCTION 11 – abonner / _notifier
+    # ║ 📝 Notification des modifications (invalidation des caches dérivés)
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def abonner(self, callback: Callable[[int], None]):
+        """Enregistre une fonction appelée avec l'ID du serveur après chaque modification"""
+        if callback not in self._abonnes:
+            self._abonnes.append(callback)
+
+    def desabonner(self, callback: Callable[[int], None]):
+        """Retire une fonction de notification"""
+        if callback in self._abonnes:
+            self._abonnes.remove(callback)
+
+    def _notifier(self, guild_id: int):
+        """Appelle chaque abonné (une erreur d'abonné n'interrompt pas les autres)"""
+        for callback in list(self._abonnes):
+            try:
+                callback(guild_id)
+            except Exception as e:
+                self.logger.error(f"❌ Erreur dans un abonné de la configuration : {e}")
+
+
 # ╔══════════════════════════════════════════════════════════════════════════════
 # ║
 # ╚══════════════════════════════════════════════════════════════════════════════
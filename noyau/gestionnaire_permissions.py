@@ -9,10 +9,11 @@
 
 import discord
 from discord.ext import commands
-from typing import Union
+from typing import Dict, FrozenSet, Tuple, Union
 
 # Importation de la configuration
 import configuration as config
+from noyau.gestionnaire_configuration import CLE_ROLES_ADMIN, CLE_ROLES_MODERATEUR
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
 # ║ 🔐 FONCTION 01 – est_developpeur
@@ -23,22 +24,117 @@ def est_developpeur(user_id: int) -> bool:
     """Vérifie si l'utilisateur est un développeur"""
     return user_id in config.DEVELOPPEURS_IDS
 
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 🗃️ CLASSE 01 – CacheNiveaux
+# ║ 📝 Niveau de permission mis en cache par membre et par ensemble de rôles
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+NIVEAU_UTILISATEUR = 0
+NIVEAU_MODERATEUR = 1
+NIVEAU_ADMINISTRATEUR = 2
+
+
+def _calculer_niveau(member: discord.Member, ids_roles: FrozenSet[int], index: Dict[int, int]) -> int:
+    """Calcule le niveau d'un membre (rôles configurés du serveur puis permissions Discord)"""
+
+    # ── 🔹 Rôles configurés : intersection avec l'index rôle → niveau
+    niveau = max((index[role_id] for role_id in index.keys() & ids_roles), default=NIVEAU_UTILISATEUR)
+    if niveau == NIVEAU_ADMINISTRATEUR:
+        return niveau
+
+    # ── 🔹 Permissions Discord
+    permissions = member.guild_permissions
+    if permissions.administrator:
+        return NIVEAU_ADMINISTRATEUR
+
+    if permissions.kick_members or permissions.ban_members or permissions.manage_messages:
+        return NIVEAU_MODERATEUR
+
+    return niveau
+
+
+class CacheNiveaux:
+    """
+    Niveaux de permission en cache
+
+    Le niveau ne dépend que des rôles du membre : il est partagé par tous les
+    membres d'un serveur ayant le même ensemble de rôles. Le propriétaire du
+    serveur est traité à part (ses permissions ne viennent pas de ses rôles).
+    """
+
+    def __init__(self):
+        self.config_manager = None
+        self._index: Dict[int, Dict[int, int]] = {}
+        self._membres: Dict[Tuple[int, int], int] = {}
+        self._roles: Dict[Tuple[int, FrozenSet[int]], int] = {}
+
+    def configurer(self, config_manager):
+        """Lit les rôles de chaque serveur dans la configuration et suit ses modifications"""
+        if self.config_manager is not None:
+            self.config_manager.desabonner(self.invalider_serveur)
+
+        self.config_manager = config_manager
+        config_manager.abonner(self.invalider_serveur)
+        self._index.clear()
+        self._membres.clear()
+        self._roles.clear()
+
+    def index_serveur(self, guild_id: int) -> Dict[int, int]:
+        """Index rôle → niveau d'un serveur (rôles globaux si le serveur n'en configure aucun)"""
+        index = self._index.get(guild_id)
+        if index is not None:
+            return index
+
+        roles = self.config_manager.obtenir_roles_permission(guild_id) if self.config_manager else None
+        if roles is None:
+            ids_admin, ids_moderateur = [config.ROLE_ADMIN_ID], [config.ROLE_MODERATEUR_ID]
+        else:
+            ids_admin, ids_moderateur = roles[CLE_ROLES_ADMIN], roles[CLE_ROLES_MODERATEUR]
+
+        index = {role_id: NIVEAU_MODERATEUR for role_id in ids_moderateur if role_id}
+        index.update({role_id: NIVEAU_ADMINISTRATEUR for role_id in ids_admin if role_id})
+
+        self._index[guild_id] = index
+        return index
+
+    def obtenir(self, member: discord.Member) -> int:
+        """Retourne le niveau du membre (calculé au premier appel)"""
+        cle_membre = (member.guild.id, member.id)
+        niveau = self._membres.get(cle_membre)
+        if niveau is not None:
+            return niveau
+
+        ids_roles = frozenset(role.id for role in member.roles)
+        cle_roles = (member.guild.id, ids_roles)
+        niveau = self._roles.get(cle_roles)
+        if niveau is None:
+            index = self.index_serveur(member.guild.id)
+            niveau = self._roles[cle_roles] = _calculer_niveau(member, ids_roles, index)
+
+        self._membres[cle_membre] = niveau
+        return niveau
+
+    def invalider_membre(self, guild_id: int, member_id: int):
+        """Oublie le niveau d'un membre (rôles modifiés, départ)"""
+        self._membres.pop((guild_id, member_id), None)
+
+    def invalider_serveur(self, guild_id: int):
+        """Oublie tous les niveaux d'un serveur (rôle modifié ou supprimé, configuration modifiée)"""
+        self._index.pop(guild_id, None)
+        self._membres = {cle: niveau for cle, niveau in self._membres.items() if cle[0] != guild_id}
+        self._roles = {cle: niveau for cle, niveau in self._roles.items() if cle[0] != guild_id}
+
+
+cache_niveaux = CacheNiveaux()
+
 # ╔═══════════════════════════════════════════════════════════════════════════════
 # ║ 👑 FONCTION 02 – est_administrateur
 # ║ 📝 Vérifie si l'utilisateur est administrateur
 # ╚═══════════════════════════════════════════════════════════════════════════════
 
 def est_administrateur(member: discord.Member) -> bool:
-    """Vérifie si le membre est administrateur"""
-
-    # ── 🔹 Vérification du rôle admin configuré
-    if config.ROLE_ADMIN_ID != 0:
-        role_admin = discord.utils.get(member.roles, id=config.ROLE_ADMIN_ID)
-        if role_admin:
-            return True
-
-    # ── 🔹 Vérification des permissions Discord
-    return member.guild_permissions.administrator
+    """Vérifie si le membre est administrateur (rôle admin configuré ou permission Discord)"""
+    return est_proprietaire_serveur(member) or cache_niveaux.obtenir(member) >= NIVEAU_ADMINISTRATEUR
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
 # ║ 🛡️ FONCTION 03 – est_moderateur
@@ -46,24 +142,8 @@ def est_administrateur(member: discord.Member) -> bool:
 # ╚═══════════════════════════════════════════════════════════════════════════════
 
 def est_moderateur(member: discord.Member) -> bool:
-    """Vérifie si le membre est modérateur"""
-
-    # ── 🔹 Les admins sont aussi modérateurs
-    if est_administrateur(member):
-        return True
-
-    # ── 🔹 Vérification du rôle modérateur configuré
-    if config.ROLE_MODERATEUR_ID != 0:
-        role_moderateur = discord.utils.get(member.roles, id=config.ROLE_MODERATEUR_ID)
-        if role_moderateur:
-            return True
-
-    # ── 🔹 Vérification des permissions Discord
-    return (
-        member.guild_permissions.kick_members or
-        member.guild_permissions.ban_members or
-        member.guild_permissions.manage_messages
-    )
+    """Vérifie si le membre est modérateur (les admins sont aussi modérateurs)"""
+    return est_proprietaire_serveur(member) or cache_niveaux.obtenir(member) >= NIVEAU_MODERATEUR
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
 # ║ 🎯 FONCTION 04 – est_proprietaire_serveur
@@ -116,7 +196,7 @@ def verifier_permissions(member: discord.Member, niveau: str = "base") -> tuple[
     return True, "Utilisateur autorisé"
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
-# ║ 🎭 CLASSE 01 – Décorateurs pour les checks
+# ║ 🎭 CLASSE 02 – Décorateurs pour les checks
 # ║ 📝 Décorateurs personnalisés pour les commandes
 # ╚═══════════════════════════════════════════════════════════════════════════════
 
@@ -168,9 +248,12 @@ def obtenir_niveau_permission(member: discord.Member) -> str:
         return "👨‍💻 Développeur"
     elif est_proprietaire_serveur(member):
         return "👑 Propriétaire"
-    elif est_administrateur(member):
+
+    # ── 🔹 Un seul accès au cache pour les niveaux administrateur et modérateur
+    niveau = cache_niveaux.obtenir(member)
+    if niveau >= NIVEAU_ADMINISTRATEUR:
         return "🛡️ Administrateur"
-    elif est_moderateur(member):
+    elif niveau >= NIVEAU_MODERATEUR:
         return "⚔️ Modérateur"
     else:
         return "👤 Utilisateur"
@@ -0,0 +1,342 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🎭 LA LOYAUTÉ - GESTIONNAIRE DES RÔLES AUTOMATIQUES
+# ║ Discord Bot | Attribution différée du rôle automatique des nouveaux membres
+# ║ Développé par Latury
+# ║ Version 0.3.0
+# ║
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🎭 FICHIER : gestionnaire_roles_auto.py
+# ║ 📦 MODULE : noyau
+# ║ 📝 DESCRIPTION : Files par serveur bornées, limitation de débit par serveur et reprise sur 429
+# ║ 👤 AUTEUR : Latury
+# ║ 📅 DATE : 18 octobre 2026
+# ║ 🔖 VERSION : 0.3.0
+# ║
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, List, Set, Tuple
+
+import discord
+
+import configuration as config
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 🪣 CLASSE 01 – SeauJetons
+# ║ 🎯 Limitation de débit (token bucket) pour un serveur
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+class SeauJetons:
+    """Seau à jetons : `capacite` appels en rafale, puis `debit` appels par seconde"""
+
+    def __init__(self, capacite: int, debit: float):
+        self.capacite = capacite
+        self.debit = debit
+        self.jetons = float(capacite)
+        self.derniere_mise_a_jour = time.monotonic()
+
+    def _remplir(self):
+        """Ajoute les jetons accumulés depuis la dernière mise à jour"""
+        maintenant = time.monotonic()
+        self.jetons = min(self.capacite, self.jetons + (maintenant - self.derniere_mise_a_jour) * self.debit)
+        self.derniere_mise_a_jour = maintenant
+
+    def prendre(self) -> float:
+        """
+        Consomme un jeton s'il est disponible (sans jamais attendre)
+
+        Returns:
+            0 si le jeton est consommé, sinon le délai (en secondes) avant le prochain jeton
+        """
+        self._remplir()
+        if self.jetons < 1:
+            return (1 - self.jetons) / self.debit
+        self.jetons -= 1
+        return 0.0
+
+    def penaliser(self, delai: float):
+        """Vide le seau pour `delai` secondes (après un 429)"""
+        self._remplir()
+        self.jetons = min(self.jetons, 0) - delai * self.debit
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 📦 CLASSE 02 – GestionnaireRolesAuto
+# ║ 🎯 Worker d'attribution du rôle automatique hors du listener d'arrivée
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+class GestionnaireRolesAuto:
+    """
+    Attribue les rôles automatiques depuis des files par serveur, sans bloquer les listeners
+
+    Les workers ne dorment jamais sur un seau vide : un serveur limité est
+    reprogrammé à l'arrivée de son prochain jeton, et les workers passent aux
+    autres serveurs (un serveur en raid ne retarde pas les autres).
+    """
+
+    def __init__(
+        self,
+        logger,
+        taille_file: int = config.ROLE_AUTO_TAILLE_FILE,
+        nombre_workers: int = config.ROLE_AUTO_WORKERS,
+        capacite: int = config.ROLE_AUTO_CAPACITE,
+        debit: float = config.ROLE_AUTO_DEBIT,
+        essais: int = config.ROLE_AUTO_ESSAIS
+    ):
+        """
+        Initialise le gestionnaire des rôles automatiques
+
+        Args:
+            logger: Instance du logger pour les logs
+            taille_file: Nombre maximum d'attributions en attente (tous serveurs confondus)
+            nombre_workers: Nombre de tâches d'attribution en parallèle
+            capacite: Attributions en rafale autorisées par serveur
+            debit: Attributions par seconde et par serveur
+            essais: Nombre maximum de tentatives par attribution
+        """
+        self.logger = logger
+        self.nombre_workers = nombre_workers
+        self.capacite = capacite
+        self.debit = debit
+        self.essais = essais
+
+        self.taille_file = taille_file
+
+        # ── 🔹 Files par serveur : (guild, member_id, role_id, instant de mise en file, essai)
+        self._files: Dict[int, Deque[tuple]] = {}
+        self._en_attente: Set[Tuple[int, int]] = set()
+        self._seaux: Dict[int, SeauJetons] = {}
+        self._workers: List[asyncio.Task] = []
+
+        # ── 🔹 Serveurs prêts à être servis, et serveurs pris en charge (en file, en attente
+        # d'un jeton ou servis par un worker) : un seul worker à la fois par serveur
+        self._prets: asyncio.Queue = asyncio.Queue()
+        self._programmes: Set[int] = set()
+        self._reveils: Dict[int, asyncio.TimerHandle] = {}
+
+        # ── 🔹 Métriques
+        self.metriques = {
+            "attribues": 0,
+            "echecs": 0,
+            "ignores_partis": 0,
+            "rejetes_file_pleine": 0,
+            "reessais": 0,
+            "latence_moyenne": 0.0,
+            "latence_max": 0.0
+        }
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ ▶️ FONCTION 01 – demarrer / arreter
+    # ║ 📝 Cycle de vie des workers (setup_hook / close)
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def demarrer(self):
+        """Lance les workers d'attribution"""
+        if self._workers:
+            return
+
+        self._workers = [
+            asyncio.create_task(self._boucle_worker(), name=f"roles_auto_{numero}")
+            for numero in range(self.nombre_workers)
+        ]
+
+    async def arreter(self):
+        """Arrête les workers (les attributions encore en file sont abandonnées)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        for reveil in self._reveils.values():
+            reveil.cancel()
+        self._reveils.clear()
+
+        if self._en_attente:
+            self.logger.warning(f"⚠️ {len(self._en_attente)} rôle(s) automatique(s) non attribué(s) à l'arrêt")
+        self.logger.info(f"🎭 Rôles automatiques : {self.obtenir_metriques()}")
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ ➕ FONCTION 02 – ajouter
+    # ║ 📝 Met une attribution en file (appelé par le listener d'arrivée)
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def ajouter(self, membre: discord.Member, role_id: int) -> bool:
+        """
+        Met en file l'attribution d'un rôle (sans attendre)
+
+        Args:
+            membre: Nouveau membre
+            role_id: ID du rôle à attribuer
+
+        Returns:
+            True si l'attribution est en file (ou déjà en file), False si la file est pleine
+        """
+        cle = (membre.guild.id, membre.id)
+        if cle in self._en_attente:
+            return True
+
+        if len(self._en_attente) >= self.taille_file:
+            self.metriques["rejetes_file_pleine"] += 1
+            self.logger.warning(f"⚠️ File des rôles automatiques pleine : {membre} ignoré")
+            return False
+
+        guild_id = membre.guild.id
+        self._files.setdefault(guild_id, deque()).append((membre.guild, membre.id, role_id, time.monotonic(), 1))
+        self._en_attente.add(cle)
+        self._programmer(guild_id)
+        return True
+
+    def _programmer(self, guild_id: int):
+        """Signale aux workers un serveur ayant des attributions en file (sauf s'il est déjà pris en charge)"""
+        if guild_id in self._programmes:
+            return
+        self._programmes.add(guild_id)
+        self._planifier(guild_id)
+
+    def _planifier(self, guild_id: int, delai: float = 0.0):
+        """Remet un serveur pris en charge dans la file des serveurs prêts (immédiatement ou après `delai`)"""
+        if delai > 0:
+            self._reveils[guild_id] = asyncio.get_running_loop().call_later(delai, self._reveiller, guild_id)
+        else:
+            self._prets.put_nowait(guild_id)
+
+    def _reveiller(self, guild_id: int):
+        """Remet un serveur limité dans la file des serveurs prêts"""
+        self._reveils.pop(guild_id, None)
+        self._prets.put_nowait(guild_id)
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ ⚙️ FONCTION 03 – _boucle_worker / _attribuer
+    # ║ 📝 Traitement des files avec limitation de débit et reprise sur 429
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    async def _boucle_worker(self):
+        """Sert les serveurs prêts, une attribution à la fois, jusqu'à l'arrêt"""
+        while True:
+            # ── 🔹 Le serveur reste pris en charge (dans _programmes) jusqu'à la fin de son attribution :
+            # ajouter() ne peut pas le confier à un second worker, ni sa file disparaître entre-temps
+            guild_id = await self._prets.get()
+
+            file = self._files.get(guild_id)
+            if not file:
+                self._liberer(guild_id)
+                continue
+
+            seau = self._seaux.get(guild_id)
+            if seau is None:
+                seau = self._seaux[guild_id] = SeauJetons(self.capacite, self.debit)
+
+            # ── 🔹 Seau vide : serveur reprogrammé à l'arrivée du prochain jeton, le worker passe aux autres
+            delai = seau.prendre()
+            if delai > 0:
+                self._planifier(guild_id, delai)
+                continue
+
+            guild, member_id, role_id, instant, essai = file.popleft()
+            termine = True
+            try:
+                termine = await self._attribuer(guild, member_id, role_id, instant, essai)
+            except Exception as e:
+                self.metriques["echecs"] += 1
+                self.logger.error(f"❌ Erreur lors de l'attribution du rôle automatique : {e}")
+
+            if termine:
+                self._en_attente.discard((guild_id, member_id))
+            else:
+                # ── 🔹 Nouvel essai en tête de file, après la pénalité du seau
+                file.appendleft((guild, member_id, role_id, instant, essai + 1))
+
+            # ── 🔹 Au tour des autres serveurs : celui-ci repasse en fin de file s'il reste du travail
+            # (arrivées ajoutées pendant l'attribution comprises)
+            if file:
+                self._planifier(guild_id)
+            else:
+                self._liberer(guild_id)
+
+    def _liberer(self, guild_id: int):
+        """Serveur sans attribution en attente : file retirée, prochaine arrivée reprogrammée par ajouter()"""
+        self._files.pop(guild_id, None)
+        self._programmes.discard(guild_id)
+
+    async def _attribuer(self, guild: discord.Guild, member_id: int, role_id: int, instant: float, essai: int) -> bool:
+        """
+        Tente une attribution (le jeton du serveur est déjà consommé)
+
+        Returns:
+            False si l'attribution doit être retentée, True sinon
+        """
+        # ── 🔹 Membre parti entre-temps : rien à faire
+        membre = guild.get_member(member_id)
+        if membre is None:
+            self.metriques["ignores_partis"] += 1
+            return True
+
+        role = guild.get_role(role_id)
+        if role is None:
+            self.logger.warning(f"⚠️ Rôle automatique introuvable (ID: {role_id}) sur {guild.name}")
+            self.metriques["echecs"] += 1
+            return True
+
+        if role in membre.roles:
+            return True
+
+        try:
+            await membre.add_roles(role, reason="Attribution automatique")
+        except discord.HTTPException as e:
+            if (e.status == 429 or e.status >= 500) and essai < self.essais:
+                # ── 🔹 Attente exponentielle avec gigue, partagée par le serveur
+                delai = min(60.0, 2 ** essai) + random.uniform(0, 1)
+                self.metriques["reessais"] += 1
+                self._seaux[guild.id].penaliser(delai)
+                self.logger.warning(f"⚠️ Attribution de rôle limitée ({e.status}), nouvel essai dans {delai:.1f}s")
+                return False
+            raise
+
+        self._enregistrer_latence(time.monotonic() - instant)
+        self.logger.info(f"Rôle {role.name} attribué à {membre.name}")
+        return True
+
+    def _enregistrer_latence(self, latence: float):
+        """Met à jour les métriques de latence (moyenne glissante et maximum)"""
+        self.metriques["attribues"] += 1
+        if self.metriques["attribues"] == 1:
+            self.metriques["latence_moyenne"] = latence
+        else:
+            self.metriques["latence_moyenne"] = 0.9 * self.metriques["latence_moyenne"] + 0.1 * latence
+        self.metriques["latence_max"] = max(self.metriques["latence_max"], latence)
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 📊 FONCTION 04 – obtenir_metriques
+    # ║ 📝 Profondeur de file et statistiques d'attribution
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def obtenir_metriques(self) -> Dict[str, float]:
+        """
+        Retourne les métriques du worker
+
+        Returns:
+            Dictionnaire avec la profondeur de file, les compteurs et les latences (secondes)
+        """
+        metriques = dict(self.metriques)
+        metriques["profondeur_file"] = len(self._en_attente)
+        metriques["serveurs_en_file"] = len(self._files)
+        metriques["latence_moyenne"] = round(metriques["latence_moyenne"], 3)
+        metriques["latence_max"] = round(metriques["latence_max"], 3)
+        return metriques
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║  FIN DU FICHIER gestionnaire_roles_auto.py
+# ╚══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,223 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🧠 LA LOYAUTÉ - MÉMOIRE DES MESSAGES
+# ║ Discord Bot | Contenu des messages récents pour les événements bruts
+# ║ Développé par Latury
+# ║ Version 0.3.0
+# ║
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🧠 FICHIER : memoire_messages.py
+# ║ 📦 MODULE : noyau
+# ║ 📝 DESCRIPTION : Tampons circulaires par serveur (auteur, salon, contenu,
+# ║                  pièces jointes) consultés quand le cache de discord.py
+# ║                  ne contient plus le message supprimé ou modifié
+# ║ 👤 AUTEUR : Latury
+# ║ 📅 DATE : 18 octobre 2026
+# ║ 🔖 VERSION : 0.3.0
+# ║
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import discord
+
+import configuration as config
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 📝 CLASSE 01 – MessageMemorise
+# ║ 🎯 Enregistrement compact d'un message
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+class MessageMemorise:
+    """Auteur, salon, contenu (éventuellement compressé) et pièces jointes d'un message"""
+
+    __slots__ = (
+        "message_id", "guild_id", "salon_id", "auteur_id", "auteur_nom",
+        "_contenu", "pieces_jointes", "cree"
+    )
+
+    def __init__(
+        self,
+        message_id: int,
+        guild_id: int,
+        salon_id: int,
+        auteur_id: int,
+        auteur_nom: str,
+        contenu: bytes,
+        pieces_jointes: Tuple[Tuple[str, str], ...]
+    ):
+        self.message_id = message_id
+        self.guild_id = guild_id
+        self.salon_id = salon_id
+        self.auteur_id = auteur_id
+        self.auteur_nom = auteur_nom
+        self._contenu = contenu
+        self.pieces_jointes = pieces_jointes
+        self.cree = time.time()
+
+    @property
+    def contenu(self) -> str:
+        """Contenu texte du message (décompressé si nécessaire)"""
+        return _decoder(self._contenu)
+
+    @property
+    def lien(self) -> str:
+        """Lien vers le message"""
+        return f"https://discord.com/channels/{self.guild_id}/{self.salon_id}/{self.message_id}"
+
+
+# ── 🔹 Encodage du contenu : préfixe 1 octet (0 = brut, 1 = zlib)
+
+def _encoder(texte: str, compression: bool, seuil: int) -> bytes:
+    """Encode un contenu, compressé au-delà du seuil si la compression est active"""
+    brut = texte.encode("utf-8")
+    if compression and len(brut) >= seuil:
+        compresse = zlib.compress(brut)
+        if len(compresse) < len(brut):
+            return b"\x01" + compresse
+    return b"\x00" + brut
+
+
+def _decoder(donnees: bytes) -> str:
+    """Décode un contenu produit par _encoder"""
+    if donnees[:1] == b"\x01":
+        return zlib.decompress(donnees[1:]).decode("utf-8")
+    return donnees[1:].decode("utf-8")
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 🧠 CLASSE 02 – MemoireMessages
+# ║ 🎯 Tampon circulaire borné par serveur, indexé par ID de message
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+class MemoireMessages:
+    """Conserve les derniers messages de chaque serveur pour les logs des événements bruts"""
+
+    def __init__(
+        self,
+        taille: int = config.MEMOIRE_MESSAGES_TAILLE,
+        compression: bool = config.MEMOIRE_MESSAGES_COMPRESSION,
+        seuil_compression: int = config.MEMOIRE_MESSAGES_SEUIL_COMPRESSION
+    ):
+        """
+        Initialise la mémoire des messages
+
+        Args:
+            taille: Nombre maximum de messages conservés par serveur
+            compression: Compresse (zlib) les contenus longs
+            seuil_compression: Taille (en octets) à partir de laquelle un contenu est compressé
+        """
+        self.taille = taille
+        self.compression = compression
+        self.seuil_compression = seuil_compression
+
+        self._serveurs: Dict[int, "OrderedDict[int, MessageMemorise]"] = {}
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ ➕ FONCTION 01 – memoriser / mettre_a_jour
+    # ║ 📝 Ajout d'un nouveau message, suivi de ses modifications
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def memoriser(self, message: discord.Message):
+        """
+        Conserve un message de serveur (le plus ancien du serveur est oublié si plein)
+
+        Args:
+            message: Message reçu
+        """
+        messages = self._serveurs.get(message.guild.id)
+        if messages is None:
+            messages = self._serveurs[message.guild.id] = OrderedDict()
+
+        messages[message.id] = MessageMemorise(
+            message.id,
+            message.guild.id,
+            message.channel.id,
+            message.author.id,
+            str(message.author),
+            _encoder(message.content or "", self.compression, self.seuil_compression),
+            tuple((piece.filename, piece.url) for piece in message.attachments)
+        )
+
+        if len(messages) > self.taille:
+            messages.popitem(last=False)
+
+    def mettre_a_jour(self, guild_id: int, message_id: int, contenu: str) -> Optional[str]:
+        """
+        Remplace le contenu d'un message conservé
+
+        Returns:
+            Le contenu précédent, ou None si le message n'est pas conservé
+        """
+        enregistrement = self.obtenir(guild_id, message_id)
+        if enregistrement is None:
+            return None
+
+        precedent = enregistrement.contenu
+        enregistrement._contenu = _encoder(contenu, self.compression, self.seuil_compression)
+        return precedent
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 🔍 FONCTION 02 – obtenir / retirer
+    # ║ 📝 Consultation sans appel API
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def obtenir(self, guild_id: int, message_id: int) -> Optional[MessageMemorise]:
+        """Retourne le message conservé, ou None"""
+        messages = self._serveurs.get(guild_id)
+        return messages.get(message_id) if messages else None
+
+    def retirer(self, guild_id: int, message_id: int) -> Optional[MessageMemorise]:
+        """Oublie un message (supprimé) et le retourne s'il était conservé"""
+        messages = self._serveurs.get(guild_id)
+        return messages.pop(message_id, None) if messages else None
+
+    def retirer_plusieurs(self, guild_id: int, message_ids: Iterable[int]) -> List[MessageMemorise]:
+        """Oublie plusieurs messages et retourne ceux qui étaient conservés, du plus ancien au plus récent"""
+        messages = self._serveurs.get(guild_id)
+        if not messages:
+            return []
+
+        retires = [messages.pop(message_id, None) for message_id in sorted(message_ids)]
+        return [enregistrement for enregistrement in retires if enregistrement is not None]
+
+    def oublier_serveur(self, guild_id: int):
+        """Libère la mémoire d'un serveur quitté"""
+        self._serveurs.pop(guild_id, None)
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 📊 FONCTION 03 – obtenir_metriques
+    # ║ 📝 Occupation de la mémoire
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def obtenir_metriques(self) -> Dict[str, int]:
+        """
+        Retourne l'occupation de la mémoire
+
+        Returns:
+            Dictionnaire avec le nombre de serveurs, de messages et d'octets de contenu
+        """
+        return {
+            "serveurs": len(self._serveurs),
+            "messages": sum(len(messages) for messages in self._serveurs.values()),
+            "octets_contenu": sum(
+                len(enregistrement._contenu)
+                for messages in self._serveurs.values()
+                for enregistrement in messages.values()
+            )
+        }
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║  FIN DU FICHIER memoire_messages.py
+# ╚══════════════════════════════════════════════════════════════════════════════
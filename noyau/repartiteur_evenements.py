@@ -0,0 +1,267 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 📡 LA LOYAUTÉ - RÉPARTITEUR DES ÉVÉNEMENTS
+# ║ Discord Bot | Listener unique par événement et distribution aux cogs
+# ║ Développé par Latury
+# ║ Version 0.3.0
+# ║
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 📡 FICHIER : repartiteur_evenements.py
+# ║ 📦 MODULE : noyau
+# ║ 📝 DESCRIPTION : Filtres communs appliqués une fois, contexte partagé et
+# ║                  mesure du temps de chaque gestionnaire
+# ║ 👤 AUTEUR : Latury
+# ║ 📅 DATE : 18 octobre 2026
+# ║ 🔖 VERSION : 0.3.0
+# ║
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+import discord
+
+import configuration as config
+from utilitaires.logger import journaliser_evenement
+
+
+# ── 🔹 Événements distribués (un seul listener Discord chacun)
+MESSAGE_SUPPRIME = "message_delete"
+MESSAGE_MODIFIE = "message_edit"
+MEMBRE_ARRIVE = "member_join"
+MEMBRE_PARTI = "member_remove"
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 📋 CLASSE 01 – ContexteEvenement
+# ║ 🎯 Données partagées par tous les gestionnaires d'un même événement
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+class ContexteEvenement:
+    """Contexte d'un événement : serveur, instant de réception et valeurs calculées une seule fois"""
+
+    __slots__ = ("bot", "evenement", "guild", "debut", "_partage")
+
+    def __init__(self, bot, evenement: str, guild: Optional[discord.Guild]):
+        self.bot = bot
+        self.evenement = evenement
+        self.guild = guild
+        self.debut = time.monotonic()
+        self._partage: Dict[Hashable, Any] = {}
+
+    def partage(self, cle: Hashable, fabrique: Callable[[], Any]) -> Any:
+        """
+        Retourne une valeur commune aux gestionnaires (calculée au premier appel)
+
+        Args:
+            cle: Identifiant de la valeur (ex. ("bienvenue", guild_id))
+            fabrique: Fonction calculant la valeur
+
+        Returns:
+            La valeur partagée
+        """
+        if cle not in self._partage:
+            self._partage[cle] = fabrique()
+        return self._partage[cle]
+
+    def salon_logs(self) -> Optional[int]:
+        """
+        ID du salon de logs du serveur, lu une seule fois pour tous les gestionnaires
+
+        Returns:
+            ID du salon de logs ou None (aucun log Discord à préparer)
+        """
+        return self.partage(
+            ("salon_logs", self.guild.id),
+            lambda: self.bot.config_manager.obtenir_salon_logs(self.guild.id)
+        )
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ ⏱️ CLASSE 02 – AbonneEvenement
+# ║ 🎯 Gestionnaire inscrit et ses mesures de temps
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+class AbonneEvenement:
+    """Gestionnaire d'un événement avec ses compteurs d'appels, d'erreurs et de durée"""
+
+    __slots__ = ("fonction", "nom", "hors_serveur", "appels", "erreurs", "duree_totale", "duree_max")
+
+    def __init__(self, fonction: Callable[..., Awaitable[None]], nom: str, hors_serveur: bool):
+        self.fonction = fonction
+        self.nom = nom
+        self.hors_serveur = hors_serveur
+        self.appels = 0
+        self.erreurs = 0
+        self.duree_totale = 0.0
+        self.duree_max = 0.0
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 📡 CLASSE 03 – RepartiteurEvenements
+# ║ 🎯 Listener unique par événement, distribution aux gestionnaires inscrits
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+class RepartiteurEvenements:
+    """Reçoit chaque événement une seule fois et le distribue aux gestionnaires des cogs"""
+
+    def __init__(self, bot, logger, seuil_lent: float = config.EVENEMENTS_SEUIL_LENT):
+        """
+        Initialise le répartiteur et inscrit ses listeners auprès du bot
+
+        Args:
+            bot: Instance du bot Discord
+            logger: Instance du logger pour les logs
+            seuil_lent: Durée (en secondes) au-delà de laquelle un gestionnaire est signalé
+        """
+        self.bot = bot
+        self.logger = logger
+        self.seuil_lent = seuil_lent
+
+        self._abonnes: Dict[str, List[AbonneEvenement]] = {
+            MESSAGE_SUPPRIME: [],
+            MESSAGE_MODIFIE: [],
+            MEMBRE_ARRIVE: [],
+            MEMBRE_PARTI: []
+        }
+
+        bot.add_listener(self._message_supprime, "on_message_delete")
+        bot.add_listener(self._message_modifie, "on_message_edit")
+        bot.add_listener(self._membre_arrive, "on_member_join")
+        bot.add_listener(self._membre_parti, "on_member_remove")
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ ➕ FONCTION 01 – inscrire / desinscrire
+    # ║ 📝 Appelés par les cogs dans cog_load / cog_unload
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def inscrire(
+        self,
+        evenement: str,
+        fonction: Callable[..., Awaitable[None]],
+        hors_serveur: bool = False
+    ):
+        """
+        Inscrit un gestionnaire, appelé avec (contexte, *arguments de l'événement)
+
+        Args:
+            evenement: MESSAGE_SUPPRIME, MESSAGE_MODIFIE, MEMBRE_ARRIVE ou MEMBRE_PARTI
+            fonction: Coroutine du gestionnaire
+            hors_serveur: Reçoit aussi les événements hors serveur (messages privés)
+        """
+        nom = getattr(fonction, "__qualname__", repr(fonction))
+        self._abonnes[evenement].append(AbonneEvenement(fonction, nom, hors_serveur))
+
+    def desinscrire(self, evenement: str, fonction: Callable[..., Awaitable[None]]):
+        """Retire un gestionnaire inscrit"""
+        self._abonnes[evenement] = [
+            abonne for abonne in self._abonnes[evenement] if abonne.fonction != fonction
+        ]
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 🛡️ FONCTION 02 – Listeners Discord
+    # ║ 📝 Filtres communs appliqués une seule fois par événement
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    async def _message_supprime(self, message: discord.Message):
+        """Suppression d'un message (messages des bots ignorés)"""
+        if message.author.bot:
+            return
+        await self._distribuer(MESSAGE_SUPPRIME, message.guild, message)
+
+    async def _message_modifie(self, before: discord.Message, after: discord.Message):
+        """Modification d'un message (bots et modifications sans changement de contenu ignorés)"""
+        if after.author.bot or before.content == after.content:
+            return
+        await self._distribuer(MESSAGE_MODIFIE, after.guild, before, after)
+
+    async def _membre_arrive(self, membre: discord.Member):
+        """Arrivée d'un membre"""
+        await self._distribuer(MEMBRE_ARRIVE, membre.guild, membre)
+
+    async def _membre_parti(self, membre: discord.Member):
+        """Départ d'un membre"""
+        await self._distribuer(MEMBRE_PARTI, membre.guild, membre)
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 📡 FONCTION 03 – _distribuer / _executer
+    # ║ 📝 Exécution des gestionnaires en parallèle avec mesure du temps
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    async def _distribuer(self, evenement: str, guild: Optional[discord.Guild], *arguments):
+        """Exécute les gestionnaires concernés avec un contexte partagé"""
+        abonnes = [
+            abonne for abonne in self._abonnes[evenement]
+            if guild is not None or abonne.hors_serveur
+        ]
+        if not abonnes:
+            return
+
+        contexte = ContexteEvenement(self.bot, evenement, guild)
+        await asyncio.gather(*(self._executer(abonne, contexte, arguments) for abonne in abonnes))
+
+        # ── 🔹 Ligne JSON structurée (durée totale de traitement de l'événement)
+        sujet = arguments[-1]
+        salon = getattr(sujet, "channel", None)
+        auteur = getattr(sujet, "author", sujet)
+        journaliser_evenement(
+            self.logger,
+            evenement,
+            guild_id=guild.id if guild else None,
+            channel_id=salon.id if salon else None,
+            user_id=auteur.id,
+            latency_ms=round((time.monotonic() - contexte.debut) * 1000, 2)
+        )
+
+    async def _executer(self, abonne: AbonneEvenement, contexte: ContexteEvenement, arguments: tuple):
+        """Exécute un gestionnaire ; une erreur n'interrompt pas les autres"""
+        debut = time.perf_counter()
+        try:
+            await abonne.fonction(contexte, *arguments)
+        except Exception as e:
+            abonne.erreurs += 1
+            self.logger.error(f"❌ Erreur dans {abonne.nom} ({contexte.evenement}) : {e}")
+        finally:
+            duree = time.perf_counter() - debut
+            abonne.appels += 1
+            abonne.duree_totale += duree
+            abonne.duree_max = max(abonne.duree_max, duree)
+
+            if duree > self.seuil_lent:
+                self.logger.warning(f"🐢 {abonne.nom} a mis {duree:.2f}s à traiter {contexte.evenement}")
+
+
+    # ╔═══════════════════════════════════════════════════════════════════════════════
+    # ║ 📊 FONCTION 04 – obtenir_metriques
+    # ║ 📝 Temps de traitement par gestionnaire
+    # ╚═══════════════════════════════════════════════════════════════════════════════
+
+    def obtenir_metriques(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retourne les mesures de chaque gestionnaire inscrit
+
+        Returns:
+            Dictionnaire {"événement:gestionnaire": {appels, erreurs, duree_moyenne_ms, duree_max_ms}}
+        """
+        return {
+            f"{evenement}:{abonne.nom}": {
+                "appels": abonne.appels,
+                "erreurs": abonne.erreurs,
+                "duree_moyenne_ms": round(abonne.duree_totale / abonne.appels * 1000, 2) if abonne.appels else 0.0,
+                "duree_max_ms": round(abonne.duree_max * 1000, 2)
+            }
+            for evenement, abonnes in self._abonnes.items()
+            for abonne in abonnes
+        }
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║  FIN DU FICHIER repartiteur_evenements.py
+# ╚══════════════════════════════════════════════════════════════════════════════
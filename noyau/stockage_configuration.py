@@ -0,0 +1,289 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🗄️ LA LOYAUTÉ - STOCKAGE DE LA CONFIGURATION
+# ║ Discord Bot | Backends de persistance de la configuration des serveurs
+# ║ Développé par Latury
+# ║ Version 0.3.0
+# ║
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🗄️ FICHIER : stockage_configuration.py
+# ║ 📦 MODULE : noyau
+# ║ 📝 DESCRIPTION : Backends JSON et SQLite utilisés par GestionnaireConfiguration
+# ║ 👤 AUTEUR : Latury
+# ║ 📅 DATE : 18 octobre 2026
+# ║ 🔖 VERSION : 0.3.0
+# ║
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable
+
+from utilitaires.persistance import ecrire_json, JournalModifications
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 📜 FONCTION 01 – appliquer_entree_journal
+# ║ 🎯 Rejoue une modification du journal sur la configuration en mémoire
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+def appliquer_entree_journal(config: Dict[str, dict], entree: dict):
+    """
+    Applique une entrée de journal (opérations idempotentes)
+
+    Args:
+        config: Configuration à modifier
+        entree: {"op": "definir"|"supprimer"|"remplacer", "g": guild_id, "c": clé, "v": valeur}
+    """
+    operation = entree.get("op")
+    guild_id = entree["g"]
+
+    if operation == "definir":
+        config.setdefault(guild_id, {})[entree["c"]] = entree["v"]
+
+    elif operation == "supprimer":
+        valeurs = config.get(guild_id)
+        if valeurs is not None:
+            valeurs.pop(entree["c"], None)
+            if not valeurs:
+                del config[guild_id]
+
+    elif operation == "remplacer":
+        if entree.get("v"):
+            config[guild_id] = entree["v"]
+        else:
+            config.pop(guild_id, None)
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 📄 CLASSE 01 – StockageJSON
+# ║ 🎯 Instantané JSON unique + journal des modifications
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+class StockageJSON:
+    """Stocke toute la configuration dans un fichier JSON unique"""
+
+    # Chaque sauvegarde a besoin de la configuration complète
+    ecriture_complete = True
+
+    def __init__(self, chemin: str, logger):
+        """
+        Initialise le stockage JSON
+
+        Args:
+            chemin: Chemin du fichier JSON (instantané)
+            logger: Instance du logger pour les logs
+        """
+        self.chemin = chemin
+        self.logger = logger
+        self.journal = JournalModifications(chemin + ".journal")
+
+    @property
+    def taille_journal(self) -> int:
+        """Nombre d'entrées accumulées depuis la dernière compaction"""
+        return self.journal.nombre_entrees
+
+    def charger(self) -> Dict[str, dict]:
+        """Charge l'instantané puis rejoue le journal des modifications"""
+        config = self._lire_instantane()
+
+        # ── 🔹 Rejeu du journal (modifications postérieures à l'instantané)
+        entrees = self.journal.lire()
+        for entree in entrees:
+            try:
+                appliquer_entree_journal(config, entree)
+            except (KeyError, TypeError, AttributeError):
+                self.logger.warning(f"⚠️ Entrée de journal ignorée : {entree}")
+
+        if entrees:
+            self.logger.info(f"♻️ {len(entrees)} modification(s) rejouée(s) depuis le journal")
+        elif not os.path.exists(self.chemin):
+            ecrire_json(self.chemin, {})
+            self.logger.info(f"📝 Fichier de configuration créé : {self.chemin}")
+
+        return config
+
+    def _lire_instantane(self) -> Dict[str, dict]:
+        """Lit l'instantané ; un fichier illisible est mis de côté au lieu d'être écrasé"""
+        if not os.path.exists(self.chemin):
+            return {}
+
+        try:
+            with open(self.chemin, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            chemin_corrompu = self.chemin + ".corrompu"
+            os.replace(self.chemin, chemin_corrompu)
+            self.logger.error(
+                f"❌ Configuration illisible ({e}) : mise de côté dans {chemin_corrompu}, "
+                f"reconstruction depuis le journal"
+            )
+            return {}
+
+    def journaliser(self, entree: dict):
+        """Ajoute une modification au journal (une ligne, sans réécriture du fichier)"""
+        self.journal.ajouter(entree)
+
+    def preparer_sauvegarde(self):
+        """Met le journal courant de côté avant la prise de l'instantané (sur la boucle)"""
+        self.journal.commencer_compaction()
+
+    def sauvegarder(self, config: Dict[str, dict], serveurs_modifies: Iterable[str]):
+        """
+        Compacte : écrit l'instantané complet de façon atomique puis purge le journal
+
+        Args:
+            config: Configuration complète en mémoire
+            serveurs_modifies: Serveurs modifiés (ignoré : l'instantané est complet)
+        """
+        ecrire_json(self.chemin, config)
+        self.journal.terminer_compaction()
+
+    def fermer(self):
+        """Ferme le journal"""
+        self.journal.fermer()
+
+
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 🗃️ CLASSE 02 – StockageSQLite
+# ║ 🎯 Base SQLite (mode WAL) avec une ligne par serveur et par clé
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+class StockageSQLite:
+    """Stocke la configuration dans SQLite, une ligne par (serveur, clé)"""
+
+    # Seuls les serveurs modifiés sont nécessaires à une sauvegarde
+    ecriture_complete = False
+
+    def __init__(self, chemin: str, logger, fichier_json_migration: str = None):
+        """
+        Initialise le stockage SQLite
+
+        Args:
+            chemin: Chemin de la base SQLite
+            logger: Instance du logger pour les logs
+            fichier_json_migration: Ancien fichier JSON à importer lors du premier chargement
+        """
+        self.chemin = chemin
+        self.logger = logger
+        self.fichier_json_migration = fichier_json_migration
+
+        # ── 🔹 Connexion partagée (utilisable depuis un thread d'exécution)
+        self.connexion = sqlite3.connect(chemin, check_same_thread=False)
+        self.connexion.execute("PRAGMA journal_mode=WAL")
+        self.connexion.execute("PRAGMA synchronous=NORMAL")
+
+        # ── 🔹 Schéma : la clé primaire (guild_id, cle) sert d'index de recherche
+        self.connexion.execute(
+            """
+            CREATE TABLE IF NOT EXISTS config_serveurs (
+                guild_id TEXT NOT NULL,
+                cle      TEXT NOT NULL,
+                valeur   TEXT,
+                PRIMARY KEY (guild_id, cle)
+            ) WITHOUT ROWID
+            """
+        )
+        self.connexion.commit()
+
+    # ── 🔹 Chargement ───────────────────────────────────────────────────────────
+
+    def charger(self) -> Dict[str, dict]:
+        """Charge la configuration complète (migre l'ancien JSON si la base est vide)"""
+        nombre_lignes = self.connexion.execute("SELECT COUNT(*) FROM config_serveurs").fetchone()[0]
+
+        if nombre_lignes == 0:
+            self._migrer_depuis_json()
+
+        config: Dict[str, dict] = {}
+        for guild_id, cle, valeur in self.connexion.execute(
+            "SELECT guild_id, cle, valeur FROM config_serveurs"
+        ):
+            config.setdefault(guild_id, {})[cle] = json.loads(valeur)
+
+        return config
+
+    def _migrer_depuis_json(self):
+        """Importe une seule fois l'ancien fichier JSON puis le renomme"""
+        if not self.fichier_json_migration or not os.path.exists(self.fichier_json_migration):
+            return
+
+        with open(self.fichier_json_migration, 'r', encoding='utf-8') as f:
+            ancienne_config = json.load(f)
+
+        with self.connexion:
+            self.connexion.executemany(
+                "INSERT OR REPLACE INTO config_serveurs (guild_id, cle, valeur) VALUES (?, ?, ?)",
+                [
+                    (guild_id, cle, json.dumps(valeur, ensure_ascii=False))
+                    for guild_id, valeurs in ancienne_config.items()
+                    for cle, valeur in valeurs.items()
+                ]
+            )
+
+        os.replace(self.fichier_json_migration, self.fichier_json_migration + ".migre")
+        self.logger.info(
+            f"📦 Migration JSON → SQLite terminée : {len(ancienne_config)} serveur(s) importé(s)"
+        )
+
+    # ── 🔹 Sauvegarde ───────────────────────────────────────────────────────────
+
+    # SQLite garantit lui-même la durabilité (WAL) : pas de journal applicatif
+    taille_journal = 0
+
+    def journaliser(self, entree: dict):
+        """Sans effet : chaque sauvegarde est déjà une petite transaction"""
+
+    def preparer_sauvegarde(self):
+        """Sans effet pour SQLite"""
+
+    def sauvegarder(self, config: Dict[str, dict], serveurs_modifies: Iterable[str]):
+        """
+        Écrit uniquement les serveurs modifiés dans une seule transaction
+
+        Args:
+            config: Configuration en mémoire (au minimum les serveurs modifiés ;
+                un serveur absent est supprimé de la base)
+            serveurs_modifies: IDs (str) des serveurs à synchroniser
+        """
+        with self.connexion:
+            for guild_id in serveurs_modifies:
+                valeurs = config.get(guild_id, {})
+
+                # ── 🔹 Suppression des clés retirées (ou du serveur entier)
+                if valeurs:
+                    marqueurs = ",".join("?" * len(valeurs))
+                    self.connexion.execute(
+                        f"DELETE FROM config_serveurs WHERE guild_id = ? AND cle NOT IN ({marqueurs})",
+                        (guild_id, *valeurs.keys())
+                    )
+                else:
+                    self.connexion.execute(
+                        "DELETE FROM config_serveurs WHERE guild_id = ?",
+                        (guild_id,)
+                    )
+
+                # ── 🔹 Insertion / mise à jour des clés présentes
+                self.connexion.executemany(
+                    """
+                    INSERT INTO config_serveurs (guild_id, cle, valeur) VALUES (?, ?, ?)
+                    ON CONFLICT (guild_id, cle) DO UPDATE SET valeur = excluded.valeur
+                    """,
+                    [
+                        (guild_id, cle, json.dumps(valeur, ensure_ascii=False))
+                        for cle, valeur in valeurs.items()
+                    ]
+                )
+
+    def fermer(self):
+        """Ferme la connexion SQLite"""
+        self.connexion.close()
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║  FIN DU FICHIER stockage_configuration.py
+# ╚══════════════════════════════════════════════════════════════════════════════
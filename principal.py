@@ -36,7 +36,7 @@ from datetime import datetime
 
 import configuration as config
 from noyau.gestionnaire_bot import LoyauteBot
-from utilitaires.logger import creer_logger
+from utilitaires.logger import creer_logger, arreter_logs
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ║ 🛠️ FONCTION 01 – initialiser_logger
@@ -142,6 +142,10 @@ async def demarrer_bot(bot, logger):
     except Exception as e:
         logger.error(f"❌ Erreur critique lors du démarrage: {e}")
         return False
+    finally:
+        # Fermeture propre : sauvegarde la configuration en attente
+        if not bot.is_closed():
+            await bot.close()
 
     return True
 
@@ -197,3 +201,6 @@ if __name__ == "__main__":
         print("\n⏹️ Arrêt du bot demandé par l'utilisateur")
     except Exception as e:
         print(f"💥 Erreur fatale: {e}")
+    finally:
+        # Écriture des derniers logs encore en file
+        arreter_logs()
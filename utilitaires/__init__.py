@@ -23,9 +23,11 @@ Initialisation du package utilitaires avec exports publics
 
 from .logger import (
     creer_logger,
+    arreter_logs,
     nettoyer_anciens_logs,
     obtenir_stats_logs,
-    lire_dernieres_lignes
+    lire_dernieres_lignes,
+    suivre_logs
 )
 
 # ╔═══════════════════════════════════════════════════════════════════════════════
@@ -58,6 +60,17 @@ from .embeds_interactifs import (
     VueMenuPrincipal
 )
 
+# ╔═══════════════════════════════════════════════════════════════════════════════
+# ║ 💾 SECTION 04 – PERSISTANCE
+# ║ 🗄️ Imports de la lecture/écriture asynchrone des fichiers de données
+# ╚═══════════════════════════════════════════════════════════════════════════════
+
+from .persistance import (
+    lire_json_async,
+    ecrire_json_async,
+    executer_sous_verrou
+)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ║ 📦 EXPORTS PUBLICS
 # ║ 🔗 Tous les exports disponibles du package utilitaires
@@ -66,9 +79,11 @@ from .embeds_interactifs import (
 __all__ = [
     # Logger
     'creer_logger',
+    'arreter_logs',
     'nettoyer_anciens_logs',
     'obtenir_stats_logs',
     'lire_dernieres_lignes',
+    'suivre_logs',
 
     # Helpers
     'formater_date',
@@ -87,6 +102,11 @@ __all__ = [
     # Embeds Interactifs
     'creer_embed_menu_principal',
     'VueMenuPrincipal',
+
+    # Persistance
+    'lire_json_async',
+    'ecrire_json_async',
+    'executer_sous_verrou',
 ]
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,195 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🦁 LA LOYAUTÉ - afflux.py
+# ║
+# ║ 🌊 Bot Discord privé développé en Python
+# ║ 👨‍💻 Développé par Latury
+# ║ 📦 Version : 0.3.0
+# ║
+# ═══════════════════════════════════════════════════════════════════════════════
+
+"""
+🦁 LA LOYAUTÉ - Regroupement des arrivées massives
+══════════════════════════════════════════════════════════════════════════════
+Au-delà d'un certain débit d'arrivées, les messages individuels sont remplacés
+par un résumé périodique listant les nouveaux membres
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, List
+
+import configuration as config
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🌊 Classe 01 – AgregateurAfflux
+# ║ Description : Suivi du débit d'arrivées et envoi de résumés par serveur
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class AgregateurAfflux:
+    """Bascule un serveur en mode afflux quand le débit d'arrivées dépasse un seuil"""
+
+    def __init__(self, logger, seuil: int = None, fenetre: float = None, intervalle: float = None):
+        """
+        Initialise l'agrégateur (une seule instance, partagée par les cogs via bot.afflux)
+
+        Args:
+            logger: Instance du logger pour les logs
+            seuil: Nombre d'arrivées dans la fenêtre déclenchant le mode afflux
+            fenetre: Durée (en secondes) de la fenêtre de mesure du débit
+            intervalle: Délai (en secondes) entre deux résumés
+        """
+        self.logger = logger
+        self.seuil = seuil or config.AFFLUX_SEUIL
+        self.fenetre = fenetre or config.AFFLUX_FENETRE
+        self.intervalle = intervalle or config.AFFLUX_INTERVALLE_RESUME
+
+        # ── 🔹 Sortie du mode afflux sous la moitié du seuil (évite les oscillations)
+        self.seuil_sortie = max(1, self.seuil // 2)
+
+        # ── 🔹 État par serveur
+        self._arrivees: Dict[int, deque] = {}
+        self._en_attente: Dict[int, list] = {}
+        self._taches: Dict[int, asyncio.Task] = {}
+
+        # ── 🔹 Coroutines appelées avec (guild, membres) pour chaque résumé
+        self._abonnes: List[Callable[[object, List[object]], Awaitable[None]]] = []
+
+    def abonner(self, envoyer_resume: Callable[[object, List[object]], Awaitable[None]]):
+        """Inscrit un destinataire des résumés (chargement d'un cog)"""
+        if envoyer_resume not in self._abonnes:
+            self._abonnes.append(envoyer_resume)
+
+    async def desabonner(self, envoyer_resume: Callable[[object, List[object]], Awaitable[None]]):
+        """
+        Désinscrit un destinataire après lui avoir publié les arrivées en attente (déchargement d'un cog)
+
+        Les arrivées restent en attente pour les autres destinataires.
+        """
+        if envoyer_resume not in self._abonnes:
+            return
+        self._abonnes.remove(envoyer_resume)
+
+        for membres in list(self._en_attente.values()):
+            if membres:
+                await self._publier(envoyer_resume, membres[0].guild, list(membres))
+
+    async def _publier(self, envoyer_resume, guild, membres: list):
+        """Envoie un résumé à un destinataire sans propager ses erreurs"""
+        try:
+            await envoyer_resume(guild, membres)
+        except Exception as e:
+            self.logger.error(f"❌ Erreur lors de l'envoi du résumé d'arrivées : {e}")
+
+    async def _diffuser(self, guild, membres: list):
+        """Envoie un résumé à tous les destinataires"""
+        for envoyer_resume in list(self._abonnes):
+            await self._publier(envoyer_resume, guild, membres)
+
+    def _debit(self, guild_id: int, maintenant: float) -> int:
+        """Nombre d'arrivées dans la fenêtre glissante"""
+        arrivees = self._arrivees.setdefault(guild_id, deque())
+        while arrivees and maintenant - arrivees[0] > self.fenetre:
+            arrivees.popleft()
+        return len(arrivees)
+
+    def en_afflux(self, guild_id: int) -> bool:
+        """Indique si le serveur est actuellement en mode afflux"""
+        return guild_id in self._taches
+
+    def ajouter(self, membre) -> bool:
+        """
+        Enregistre une arrivée
+
+        À appeler une seule fois par arrivée, quel que soit le nombre de cogs
+        concernés (via ContexteEvenement.partage) : chaque appel compte dans le débit.
+
+        Args:
+            membre: Membre qui vient de rejoindre
+
+        Returns:
+            bool: True si l'arrivée est mise en attente du prochain résumé
+                  (l'appelant n'envoie alors pas de message individuel)
+        """
+        guild_id = membre.guild.id
+        maintenant = time.monotonic()
+        self._arrivees.setdefault(guild_id, deque()).append(maintenant)
+
+        if not self.en_afflux(guild_id):
+            if self._debit(guild_id, maintenant) < self.seuil:
+                return False
+
+            self.logger.warning(f"🌊 Afflux d'arrivées détecté sur {membre.guild.name} : messages regroupés")
+            self._taches[guild_id] = asyncio.create_task(self._boucle_resume(membre.guild))
+
+        self._en_attente.setdefault(guild_id, []).append(membre)
+        return True
+
+    async def _boucle_resume(self, guild):
+        """Envoie un résumé à chaque intervalle jusqu'au retour à un débit normal"""
+        guild_id = guild.id
+        try:
+            while True:
+                await asyncio.sleep(self.intervalle)
+
+                membres = self._en_attente.pop(guild_id, [])
+                if membres:
+                    await self._diffuser(guild, membres)
+
+                if self._debit(guild_id, time.monotonic()) < self.seuil_sortie:
+                    # ── 🔹 Sortie du mode afflux puis dernier résumé, sans attente entre les deux :
+                    # les arrivées reçues pendant l'envoi précédent ne restent pas en attente
+                    self._taches.pop(guild_id, None)
+                    membres = self._en_attente.pop(guild_id, [])
+                    self.logger.info(f"🌊 Fin de l'afflux sur {guild.name} : messages individuels rétablis")
+                    if membres:
+                        await self._diffuser(guild, membres)
+                    break
+        finally:
+            self._taches.pop(guild_id, None)
+
+    async def arreter(self):
+        """Annule les résumés planifiés et publie immédiatement les arrivées en attente (arrêt du bot)"""
+        for tache in self._taches.values():
+            tache.cancel()
+        self._taches.clear()
+
+        en_attente, self._en_attente = self._en_attente, {}
+        for membres in en_attente.values():
+            if membres:
+                await self._diffuser(membres[0].guild, membres)
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📋 Fonction 01 – formater_liste_membres
+# ║ Description : Liste de mentions tenant dans une description d'embed
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def formater_liste_membres(membres: List[object], limite: int = 4000) -> str:
+    """
+    Construit la liste des mentions, tronquée avec le nombre de membres restants
+
+    Args:
+        membres: Membres à lister
+        limite: Nombre maximum de caractères
+
+    Returns:
+        str: Mentions séparées par des espaces
+    """
+    morceaux = []
+    longueur = 0
+
+    for index, membre in enumerate(membres):
+        mention = membre.mention
+        reste = f" … et {len(membres) - index} autre(s)"
+        if longueur + len(mention) + 1 + len(reste) > limite:
+            morceaux.append(reste.strip())
+            break
+        morceaux.append(mention)
+        longueur += len(mention) + 1
+
+    return " ".join(morceaux)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ ✅ FIN DU FICHIER – Regroupement des arrivées massives
+# ╚═══════════════════════════════════════════════════════════════════════════════
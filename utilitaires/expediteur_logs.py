@@ -0,0 +1,428 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🦁 LA LOYAUTÉ - expediteur_logs.py
+# ║
+# ║ 📮 Bot Discord privé développé en Python
+# ║ 👨‍💻 Développé par Latury
+# ║ 📦 Version : 0.3.0
+# ║
+# ═══════════════════════════════════════════════════════════════════════════════
+
+"""
+🦁 LA LOYAUTÉ - Envoi groupé des logs Discord
+══════════════════════════════════════════════════════════════════════════════
+Regroupe les embeds de logs par salon : jusqu'à 10 embeds (6000 caractères au
+total) par message, envoyés dès qu'un lot est plein ou après un court délai.
+En mode webhook, les lots passent par un webhook dédié au salon de logs.
+Les lots non livrés sont conservés sur disque et renvoyés dans l'ordre.
+Les logs accompagnés d'un fichier (transcriptions) partent seuls, sans attendre.
+"""
+
+import asyncio
+import io
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+import discord
+
+import configuration as config
+from utilitaires.persistance import executer_sous_verrou
+from utilitaires.spool_logs import FICHIER_SPOOL, SpoolLogs
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📏 Constantes – Limites Discord par message
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+MAX_EMBEDS_MESSAGE = 10
+MAX_CARACTERES_MESSAGE = 6000
+
+# Clé de la configuration serveur contenant le webhook de logs {salon_id, id, token}
+CLE_WEBHOOK_LOGS = "logs_webhook"
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📦 Classe 01 – LotLogs
+# ║ Description : Embeds en attente pour un salon
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class LotLogs:
+    """Embeds en attente d'envoi dans un même salon"""
+
+    __slots__ = ("salon", "embeds", "taille", "minuteur")
+
+    def __init__(self, salon):
+        self.salon = salon
+        self.embeds: List[discord.Embed] = []
+        self.taille = 0
+        self.minuteur = None
+
+    def accepte(self, taille: int) -> bool:
+        """Indique si un embed de `taille` caractères tient encore dans le lot"""
+        return (
+            len(self.embeds) < MAX_EMBEDS_MESSAGE
+            and self.taille + taille <= MAX_CARACTERES_MESSAGE
+        )
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📮 Classe 02 – ExpediteurLogs
+# ║ Description : Envoi groupé par salon de logs
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class ExpediteurLogs:
+    """Regroupe les embeds de logs par salon pour réduire le nombre d'appels API"""
+
+    def __init__(
+        self,
+        logger,
+        delai: float = config.LOGS_DELAI_ENVOI,
+        envois_max: int = config.LOGS_ENVOIS_SIMULTANES,
+        config_manager=None,
+        mode_webhook: bool = config.LOGS_MODE_WEBHOOK,
+        resoudre_salon: Optional[Callable[[int], object]] = None
+    ):
+        """
+        Initialise l'expéditeur
+
+        Args:
+            logger: Instance du logger pour les logs
+            delai: Attente maximale (en secondes) avant l'envoi d'un lot incomplet
+            envois_max: Nombre de lots en cours d'envoi au-delà duquel les producteurs attendent
+            config_manager: GestionnaireConfiguration (cache des webhooks par serveur)
+            mode_webhook: Envoie les logs par webhook plutôt qu'au nom du bot
+            resoudre_salon: Retourne un salon depuis son ID (bot.get_channel), active la file disque
+        """
+        self.logger = logger
+        self.delai = delai
+        self.envois_max = envois_max
+        self.config_manager = config_manager
+        self.mode_webhook = mode_webhook and config_manager is not None
+
+        self._lots: Dict[int, LotLogs] = {}
+        self._verrous: Dict[int, asyncio.Lock] = {}
+        self._envois: Set[asyncio.Task] = set()
+
+        # ── 🔹 Mode webhook : session HTTP partagée et webhooks par salon
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._webhooks: Dict[int, discord.Webhook] = {}
+        self._salons_sans_webhook: Set[int] = set()
+
+        # ── 🔹 File disque des lots non livrés et tâche de renvoi
+        self.resoudre_salon = resoudre_salon
+        self.spool = SpoolLogs(FICHIER_SPOOL, config.LOGS_SPOOL_TAILLE_MAX) if resoudre_salon else None
+        self._tache_relecture: Optional[asyncio.Task] = None
+
+        # ── 🔹 Salons ayant des logs sur disque : leurs nouveaux lots attendent le renvoi de l'arriéré
+        self._salons_en_retard: Set[int] = set(self.spool.salons_en_attente()) if self.spool else set()
+
+    def ajouter(self, salon, embed: discord.Embed, immediat: bool = False):
+        """
+        Ajoute un embed au lot du salon (envoi immédiat si le lot est plein)
+
+        Args:
+            salon: Salon de logs (TextChannel ou Thread)
+            embed: Embed à envoyer
+            immediat: Envoie le lot sans attendre le délai (logs prioritaires)
+        """
+        taille = len(embed)
+        lot = self._lots.get(salon.id)
+
+        # ── 🔹 Le lot courant ne peut pas accueillir l'embed : il part tel quel
+        if lot is not None and not lot.accepte(taille):
+            self._vider(salon.id)
+            lot = None
+
+        if lot is None:
+            lot = self._lots[salon.id] = LotLogs(salon)
+
+        lot.embeds.append(embed)
+        lot.taille += taille
+
+        if immediat or len(lot.embeds) >= MAX_EMBEDS_MESSAGE:
+            self._vider(salon.id)
+        elif lot.minuteur is None:
+            lot.minuteur = asyncio.get_running_loop().call_later(self.delai, self._vider, salon.id)
+
+    def _vider(self, salon_id: int):
+        """Retire le lot d'un salon et planifie son envoi"""
+        lot = self._lots.pop(salon_id, None)
+        if lot is None:
+            return
+
+        if lot.minuteur is not None:
+            lot.minuteur.cancel()
+
+        tache = asyncio.create_task(self._envoyer(lot))
+        self._envois.add(tache)
+        tache.add_done_callback(self._envois.discard)
+
+    async def _envoyer(self, lot: LotLogs):
+        """Envoie un lot (les lots d'un même salon partent dans l'ordre)"""
+        async with self._verrou(lot.salon.id):
+            # ── 🔹 Arriéré encore sur disque et salon toujours inaccessible : le lot le rejoint, dans l'ordre
+            if not await self._rattraper(lot.salon):
+                await self.mettre_en_attente(lot.salon.id, lot.embeds)
+                return
+
+            try:
+                await self._transmettre(lot.salon, lot.embeds)
+            except Exception as e:
+                if isinstance(e, discord.Forbidden):
+                    self.logger.error(f"❌ Permissions manquantes pour envoyer dans le salon de logs")
+                else:
+                    self.logger.error(f"❌ Erreur lors de l'envoi de {len(lot.embeds)} log(s) : {e}")
+                await self.mettre_en_attente(lot.salon.id, lot.embeds)
+
+    async def _transmettre(self, salon, embeds: List[discord.Embed], fichier: Optional[Tuple[str, bytes]] = None):
+        """Envoie des embeds (et un fichier) dans un salon, webhook si possible ; lève l'erreur d'envoi"""
+        if not (self.mode_webhook and await self._envoyer_webhook(salon, embeds, fichier)):
+            await salon.send(embeds=embeds, **_options_fichier(fichier))
+
+    async def envoyer_fichier(self, salon, embed: discord.Embed, nom_fichier: str, donnees: bytes):
+        """
+        Envoie immédiatement un embed accompagné d'un fichier (hors regroupement)
+
+        Args:
+            salon: Salon de logs (TextChannel ou Thread)
+            embed: Embed du log
+            nom_fichier: Nom du fichier joint
+            donnees: Contenu du fichier joint
+        """
+        async with self._verrou(salon.id):
+            if not await self._rattraper(salon):
+                self.logger.warning(f"⚠️ Fichier de log {nom_fichier} non conservé : salon {salon.id} inaccessible")
+                await self.mettre_en_attente(salon.id, [embed])
+                return
+
+            try:
+                await self._transmettre(salon, [embed], (nom_fichier, donnees))
+            except Exception as e:
+                # Seul l'embed est conservé sur disque (le fichier est perdu)
+                self.logger.error(f"❌ Erreur lors de l'envoi du fichier de log {nom_fichier} : {e}")
+                await self.mettre_en_attente(salon.id, [embed])
+
+    def _verrou(self, salon_id: int) -> asyncio.Lock:
+        """Verrou garantissant l'ordre des envois d'un salon"""
+        return self._verrous.setdefault(salon_id, asyncio.Lock())
+
+    # ── 🔹 Mode webhook ────────────────────────────────────────────────────────
+
+    async def _envoyer_webhook(
+        self,
+        salon,
+        embeds: List[discord.Embed],
+        fichier: Optional[Tuple[str, bytes]] = None
+    ) -> bool:
+        """
+        Envoie des embeds par le webhook du salon
+
+        Returns:
+            bool: False si aucun webhook n'est utilisable (envoi classique à faire)
+        """
+        webhook = await self._obtenir_webhook(salon)
+        if webhook is None:
+            return False
+
+        options = _options_fichier(fichier)
+        if isinstance(salon, discord.Thread):
+            options["thread"] = salon
+        try:
+            await webhook.send(embeds=embeds, **options)
+        except discord.NotFound:
+            # Webhook supprimé depuis Discord : recréé au prochain lot
+            self.logger.warning("⚠️ Webhook de logs introuvable, il sera recréé")
+            self._oublier_webhook(salon)
+            return False
+
+        return True
+
+    async def _obtenir_webhook(self, salon) -> Optional[discord.Webhook]:
+        """Retourne le webhook du salon, créé et mis en cache dans la configuration au besoin"""
+        parent = salon.parent if isinstance(salon, discord.Thread) else salon
+        if parent is None or parent.id in self._salons_sans_webhook:
+            return None
+
+        webhook = self._webhooks.get(parent.id)
+        if webhook is not None:
+            return webhook
+
+        guild_id = parent.guild.id
+        donnees = self.config_manager.obtenir_configuration(guild_id).get(CLE_WEBHOOK_LOGS)
+
+        if not donnees or donnees.get("salon_id") != parent.id:
+            try:
+                cree = await parent.create_webhook(
+                    name=f"{config.NOM_BOT} • Logs",
+                    reason="Envoi des logs du bot"
+                )
+            except discord.Forbidden:
+                self.logger.warning(
+                    f"⚠️ Permission « Gérer les webhooks » manquante sur #{parent.name} : logs envoyés par le bot"
+                )
+                self._salons_sans_webhook.add(parent.id)
+                return None
+
+            donnees = {"salon_id": parent.id, "id": cree.id, "token": cree.token}
+            self.config_manager.definir(guild_id, CLE_WEBHOOK_LOGS, donnees)
+            self.logger.info(f"🪝 Webhook de logs créé sur #{parent.name}")
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+
+        webhook = discord.Webhook.partial(donnees["id"], donnees["token"], session=self._session)
+        self._webhooks[parent.id] = webhook
+        return webhook
+
+    def _oublier_webhook(self, salon):
+        """Retire un webhook invalide du cache et de la configuration"""
+        parent = salon.parent if isinstance(salon, discord.Thread) else salon
+        if parent is None:
+            return
+
+        self._webhooks.pop(parent.id, None)
+        self.config_manager.definir(parent.guild.id, CLE_WEBHOOK_LOGS, None)
+
+    # ── 🔹 File disque et renvoi ───────────────────────────────────────────────
+
+    async def mettre_en_attente(self, salon_id: int, embeds: List[discord.Embed]):
+        """Conserve sur disque des embeds non livrés (renvoyés plus tard dans l'ordre)"""
+        if self.spool is None:
+            return
+
+        try:
+            abandonnes = await executer_sous_verrou(
+                self.spool.chemin, self.spool.ajouter, salon_id, [embed.to_dict() for embed in embeds]
+            )
+        except Exception as e:
+            self.logger.error(f"❌ Impossible de conserver {len(embeds)} log(s) non livré(s) : {e}")
+            return
+
+        self._salons_en_retard.add(salon_id)
+        self.logger.warning(f"📥 {len(embeds)} log(s) mis en attente pour le salon {salon_id}")
+        if abandonnes:
+            self.logger.warning(f"⚠️ File disque des logs pleine : {abandonnes} ancien(s) log(s) abandonné(s)")
+
+    def demarrer_relecture(self):
+        """Lance la tâche de renvoi des logs en attente sur disque"""
+        if self.spool is not None and self._tache_relecture is None:
+            self._tache_relecture = asyncio.create_task(self._boucle_relecture(), name="relecture_logs")
+
+    async def _boucle_relecture(self):
+        """Tente périodiquement de renvoyer les logs en attente"""
+        while True:
+            await asyncio.sleep(config.LOGS_SPOOL_INTERVALLE)
+            if self.spool.taille:
+                try:
+                    await self.relire()
+                except Exception as e:
+                    self.logger.error(f"❌ Erreur lors du renvoi des logs en attente : {e}")
+
+    async def relire(self):
+        """Renvoie les logs en attente, salon par salon, dans l'ordre d'origine"""
+        salons = await executer_sous_verrou(self.spool.chemin, self.spool.salons_en_attente)
+
+        for salon_id in salons:
+            salon = self.resoudre_salon(salon_id)
+            if salon is None:
+                continue
+
+            async with self._verrou(salon_id):
+                await self._relire_salon(salon)
+
+    async def _rattraper(self, salon) -> bool:
+        """
+        Renvoie l'arriéré disque d'un salon avant un envoi direct (verrou du salon déjà pris)
+
+        Returns:
+            bool: True si plus aucun log du salon n'attend sur disque
+        """
+        if salon.id not in self._salons_en_retard:
+            return True
+        return await self._relire_salon(salon)
+
+    async def _relire_salon(self, salon) -> bool:
+        """
+        Renvoie les logs en attente d'un salon dans l'ordre d'origine (verrou du salon déjà pris)
+
+        Returns:
+            bool: True si l'arriéré du salon est entièrement renvoyé
+        """
+        salon_id = salon.id
+        renvoyes = 0
+        vide = False
+
+        while True:
+            lignes = await executer_sous_verrou(
+                self.spool.chemin, self.spool.lire, salon_id, MAX_EMBEDS_MESSAGE
+            )
+            if not lignes:
+                vide = True
+                self._salons_en_retard.discard(salon_id)
+                break
+
+            # ── 🔹 Lot respectant les limites Discord (10 embeds, 6000 caractères)
+            lot = LotLogs(salon)
+            identifiants = []
+            for identifiant, donnees in lignes:
+                embed = discord.Embed.from_dict(donnees)
+                if lot.embeds and not lot.accepte(len(embed)):
+                    break
+                lot.embeds.append(embed)
+                lot.taille += len(embed)
+                identifiants.append(identifiant)
+
+            try:
+                await self._transmettre(salon, lot.embeds)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Salon {salon_id} toujours inaccessible : {e}")
+                break
+
+            await executer_sous_verrou(self.spool.chemin, self.spool.supprimer, identifiants)
+            renvoyes += len(identifiants)
+
+        if renvoyes:
+            self.logger.info(f"📤 {renvoyes} log(s) en attente renvoyé(s) dans le salon {salon_id}")
+        return vide
+
+    # ── 🔹 Contre-pression et arrêt ────────────────────────────────────────────
+
+    async def attendre_capacite(self):
+        """Attend que le nombre de lots en cours d'envoi repasse sous la limite"""
+        while len(self._envois) >= self.envois_max:
+            await asyncio.wait(list(self._envois), return_when=asyncio.FIRST_COMPLETED)
+
+    async def vider_tout(self):
+        """Envoie immédiatement tous les lots en attente (arrêt du bot)"""
+        for salon_id in list(self._lots):
+            self._vider(salon_id)
+
+        if self._envois:
+            await asyncio.gather(*list(self._envois), return_exceptions=True)
+
+    async def fermer(self):
+        """Envoie les lots en attente puis ferme la session HTTP et la file disque"""
+        if self._tache_relecture is not None:
+            self._tache_relecture.cancel()
+            self._tache_relecture = None
+
+        await self.vider_tout()
+
+        if self.spool is not None:
+            await executer_sous_verrou(self.spool.chemin, self.spool.fermer)
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📎 Fonction 01 – _options_fichier
+# ║ Description : Pièce jointe recréée à chaque tentative d'envoi
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def _options_fichier(fichier: Optional[Tuple[str, bytes]]) -> dict:
+    """Arguments d'envoi pour un fichier (nom, contenu) ; un discord.File ne sert qu'une fois"""
+    if fichier is None:
+        return {}
+    nom_fichier, donnees = fichier
+    return {"file": discord.File(io.BytesIO(donnees), filename=nom_fichier)}
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ ✅ FIN DU FICHIER – Envoi groupé des logs Discord
+# ╚═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,165 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🦁 LA LOYAUTÉ - fenetre_modifications.py
+# ║
+# ║ ✏️ Bot Discord privé développé en Python
+# ║ 👨‍💻 Développé par Latury
+# ║ 📦 Version : 0.3.0
+# ║
+# ═══════════════════════════════════════════════════════════════════════════════
+
+"""
+🦁 LA LOYAUTÉ - Regroupement des modifications de messages
+══════════════════════════════════════════════════════════════════════════════
+Les modifications successives d'un même message pendant une fenêtre sont
+publiées en un seul log : première version, dernière version et nombre d'éditions.
+Même regroupement pour les messages hors cache (contenus lus dans la mémoire des messages)
+"""
+
+from typing import Awaitable, Callable, Optional
+
+import configuration as config
+from utilitaires.fenetre_regroupement import FenetreRegroupement
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ ✏️ Classe 01 – ModificationsEnAttente
+# ║ Description : Modifications d'un message en cours de regroupement
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class ModificationsEnAttente:
+    """Première version, dernière version et nombre de modifications d'un message"""
+
+    __slots__ = ("avant", "apres", "nombre", "contexte")
+
+    def __init__(self, avant, apres, contexte=None):
+        self.avant = avant
+        self.apres = apres
+        self.nombre = 1
+        self.contexte = contexte
+
+    @staticmethod
+    def fusionner(
+        attente: Optional["ModificationsEnAttente"], avant, apres, contexte=None
+    ) -> "ModificationsEnAttente":
+        """Première modification : nouvel état ; suivantes : seule la dernière version est conservée"""
+        if attente is None:
+            return ModificationsEnAttente(avant, apres, contexte)
+
+        attente.apres = apres
+        attente.nombre += 1
+        if contexte is not None:
+            attente.contexte = contexte
+        return attente
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ ✏️ Classe 02 – FenetreModifications
+# ║ Description : Fenêtre de regroupement par ID de message
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class FenetreModifications:
+    """Publie un seul log par message à la fermeture de sa fenêtre de modifications"""
+
+    def __init__(
+        self,
+        publier: Callable[[object, object, int], Awaitable[None]],
+        logger,
+        delai: float = None
+    ):
+        """
+        Initialise la fenêtre de regroupement
+
+        Args:
+            publier: Coroutine appelée avec (avant, après, nombre de modifications)
+            logger: Instance du logger pour les logs
+            delai: Durée (en secondes) de la fenêtre ouverte par la première modification
+        """
+        self.publier = publier
+        self._fenetre = FenetreRegroupement(
+            ModificationsEnAttente.fusionner,
+            self._publier,
+            logger,
+            delai or config.LOGS_FENETRE_MODIFICATIONS,
+            "des modifications d'un message"
+        )
+
+    def ajouter(self, avant, apres):
+        """
+        Enregistre une modification (sans attendre)
+
+        Args:
+            avant: Message avant la modification
+            apres: Message après la modification
+        """
+        self._fenetre.ajouter(apres.id, avant, apres)
+
+    async def _publier(self, attente: ModificationsEnAttente):
+        """Publie le log regroupé"""
+        # Modifications annulées (retour au contenu d'origine) : rien à publier
+        if attente.avant.content == attente.apres.content:
+            return
+
+        await self.publier(attente.avant, attente.apres, attente.nombre)
+
+    async def arreter(self):
+        """Publie immédiatement les fenêtres ouvertes (déchargement du cog)"""
+        await self._fenetre.arreter()
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🧠 Classe 03 – FenetreModificationsMemorisees
+# ║ Description : Fenêtre de regroupement des modifications hors cache
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class FenetreModificationsMemorisees:
+    """Publie un seul log par message hors cache à la fermeture de sa fenêtre de modifications"""
+
+    def __init__(
+        self,
+        publier: Callable[[object, object, str, str, int], Awaitable[None]],
+        logger,
+        delai: float = None
+    ):
+        """
+        Initialise la fenêtre de regroupement
+
+        Args:
+            publier: Coroutine appelée avec (guild, enregistrement, avant, après, nombre de modifications)
+            logger: Instance du logger pour les logs
+            delai: Durée (en secondes) de la fenêtre ouverte par la première modification
+        """
+        self.publier = publier
+        self._fenetre = FenetreRegroupement(
+            ModificationsEnAttente.fusionner,
+            self._publier,
+            logger,
+            delai or config.LOGS_FENETRE_MODIFICATIONS,
+            "des modifications d'un message hors cache"
+        )
+
+    def ajouter(self, guild, enregistrement, avant: str, apres: str):
+        """
+        Enregistre une modification (sans attendre)
+
+        Args:
+            guild: Serveur du message
+            enregistrement: Message conservé par la mémoire des messages
+            avant: Contenu précédent
+            apres: Nouveau contenu
+        """
+        self._fenetre.ajouter(enregistrement.message_id, avant, apres, (guild, enregistrement))
+
+    async def _publier(self, attente: ModificationsEnAttente):
+        """Publie le log regroupé"""
+        # Modifications annulées (retour au contenu d'origine) : rien à publier
+        if attente.avant == attente.apres:
+            return
+
+        guild, enregistrement = attente.contexte
+        await self.publier(guild, enregistrement, attente.avant, attente.apres, attente.nombre)
+
+    async def arreter(self):
+        """Publie immédiatement les fenêtres ouvertes (déchargement du cog)"""
+        await self._fenetre.arreter()
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ ✅ FIN DU FICHIER – Regroupement des modifications de messages
+# ╚═══════════════════════════════════════════════════════════════════════════════
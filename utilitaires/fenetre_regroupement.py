@@ -0,0 +1,106 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🦁 LA LOYAUTÉ - fenetre_regroupement.py
+# ║
+# ║ ⏳ Bot Discord privé développé en Python
+# ║ 👨‍💻 Développé par Latury
+# ║ 📦 Version : 0.3.0
+# ║
+# ═══════════════════════════════════════════════════════════════════════════════
+
+"""
+🦁 LA LOYAUTÉ - Fenêtre de regroupement par clé
+══════════════════════════════════════════════════════════════════════════════
+Le premier événement d'une clé ouvre une fenêtre ; les suivants sont fusionnés
+dans son état, publié une seule fois à la fermeture de la fenêtre
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ ⏳ Classe 01 – FenetreRegroupement
+# ║ Description : Regroupement temporisé d'événements par clé
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class FenetreRegroupement:
+    """Fusionne les événements d'une même clé et publie un seul état par fenêtre"""
+
+    def __init__(
+        self,
+        fusionner: Callable[..., Any],
+        publier: Callable[[Any], Awaitable[None]],
+        logger,
+        delai: float,
+        libelle: str = "regroupé"
+    ):
+        """
+        Initialise la fenêtre de regroupement
+
+        Args:
+            fusionner: Fonction (état ou None, *arguments) → nouvel état
+            publier: Coroutine appelée avec l'état à la fermeture de la fenêtre
+            logger: Instance du logger pour les logs
+            delai: Durée (en secondes) de la fenêtre ouverte par le premier événement
+            libelle: Objet du log, repris dans les messages d'erreur
+        """
+        self.fusionner = fusionner
+        self.publier = publier
+        self.logger = logger
+        self.delai = delai
+        self.libelle = libelle
+
+        # ── 🔹 Fenêtres ouvertes : clé → [état, minuteur]
+        self._en_attente: Dict[Hashable, list] = {}
+        self._taches = set()
+
+    def ajouter(self, cle: Hashable, *arguments):
+        """
+        Enregistre un événement (sans attendre)
+
+        Args:
+            cle: Clé de regroupement (ex. ID du message)
+            *arguments: Transmis à la fonction de fusion
+        """
+        entree = self._en_attente.get(cle)
+
+        # ── 🔹 Événement suivant : fusionné dans l'état de la fenêtre ouverte
+        if entree is not None:
+            entree[0] = self.fusionner(entree[0], *arguments)
+            return
+
+        # ── 🔹 Premier événement : ouverture de la fenêtre
+        minuteur = asyncio.get_running_loop().call_later(self.delai, self._fermer, cle)
+        self._en_attente[cle] = [self.fusionner(None, *arguments), minuteur]
+
+    def _fermer(self, cle: Hashable):
+        """Ferme la fenêtre d'une clé et planifie la publication de son état"""
+        entree = self._en_attente.pop(cle, None)
+        if entree is None:
+            return
+
+        etat, minuteur = entree
+        minuteur.cancel()
+
+        tache = asyncio.create_task(self._publier(etat))
+        self._taches.add(tache)
+        tache.add_done_callback(self._taches.discard)
+
+    async def _publier(self, etat: Optional[Any]):
+        """Publie un état ; une erreur n'interrompt pas les autres fenêtres"""
+        try:
+            await self.publier(etat)
+        except Exception as e:
+            self.logger.error(f"❌ Erreur lors du log {self.libelle} : {e}")
+
+    async def arreter(self):
+        """Publie immédiatement les fenêtres ouvertes (déchargement du cog)"""
+        for cle in list(self._en_attente):
+            self._fermer(cle)
+
+        if self._taches:
+            await asyncio.gather(*list(self._taches), return_exceptions=True)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ ✅ FIN DU FICHIER – Fenêtre de regroupement par clé
+# ╚═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,136 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🦁 LA LOYAUTÉ - fenetre_roles.py
+# ║
+# ║ 🎭 Bot Discord privé développé en Python
+# ║ 👨‍💻 Développé par Latury
+# ║ 📦 Version : 0.3.0
+# ║
+# ═══════════════════════════════════════════════════════════════════════════════
+
+"""
+🦁 LA LOYAUTÉ - Regroupement des changements de rôles
+══════════════════════════════════════════════════════════════════════════════
+Différence des rôles calculée par ensembles d'IDs, et changements successifs
+d'un même membre pendant une fenêtre publiés en un seul log
+"""
+
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import configuration as config
+from utilitaires.fenetre_regroupement import FenetreRegroupement
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🔍 Fonction 01 – difference_roles
+# ║ Description : Rôles ajoutés et retirés entre deux états d'un membre
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def difference_roles(avant, apres) -> Tuple[List[object], List[object]]:
+    """
+    Compare les rôles de deux états d'un membre par ensembles d'IDs
+
+    Args:
+        avant: Membre avant la mise à jour
+        apres: Membre après la mise à jour
+
+    Returns:
+        tuple: (rôles ajoutés, rôles retirés), dans l'ordre de la hiérarchie
+    """
+    ids_avant = {role.id for role in avant.roles}
+    ids_apres = {role.id for role in apres.roles}
+
+    if ids_avant == ids_apres:
+        return [], []
+
+    ajoutes = [role for role in apres.roles if role.id not in ids_avant]
+    retires = [role for role in avant.roles if role.id not in ids_apres]
+    return ajoutes, retires
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🎭 Classe 01 – RolesEnAttente
+# ║ Description : Changements de rôles d'un membre en cours de regroupement
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class RolesEnAttente:
+    """Bilan net des rôles ajoutés et retirés d'un membre"""
+
+    __slots__ = ("membre", "ajoutes", "retires")
+
+    def __init__(self, membre):
+        self.membre = membre
+        self.ajoutes: Dict[int, object] = {}
+        self.retires: Dict[int, object] = {}
+
+    @staticmethod
+    def fusionner(
+        attente: Optional["RolesEnAttente"], membre, ajoutes: List[object], retires: List[object]
+    ) -> "RolesEnAttente":
+        """Ajoute un changement ; un rôle ajouté puis retiré (ou l'inverse) s'annule"""
+        if attente is None:
+            attente = RolesEnAttente(membre)
+
+        attente.membre = membre
+        for role in ajoutes:
+            if attente.retires.pop(role.id, None) is None:
+                attente.ajoutes[role.id] = role
+        for role in retires:
+            if attente.ajoutes.pop(role.id, None) is None:
+                attente.retires[role.id] = role
+        return attente
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🎭 Classe 02 – FenetreRoles
+# ║ Description : Fenêtre de regroupement par membre
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class FenetreRoles:
+    """Publie un seul log par membre à la fermeture de sa fenêtre de changements de rôles"""
+
+    def __init__(
+        self,
+        publier: Callable[[object, List[object], List[object]], Awaitable[None]],
+        logger,
+        delai: float = None
+    ):
+        """
+        Initialise la fenêtre de regroupement
+
+        Args:
+            publier: Coroutine appelée avec (membre, rôles ajoutés, rôles retirés)
+            logger: Instance du logger pour les logs
+            delai: Durée (en secondes) de la fenêtre ouverte par le premier changement
+        """
+        self.publier = publier
+        self._fenetre = FenetreRegroupement(
+            RolesEnAttente.fusionner,
+            self._publier,
+            logger,
+            delai or config.LOGS_FENETRE_ROLES,
+            "des changements de rôles"
+        )
+
+    def ajouter(self, membre, ajoutes: List[object], retires: List[object]):
+        """
+        Enregistre un changement de rôles (sans attendre)
+
+        Args:
+            membre: Membre après la mise à jour
+            ajoutes: Rôles ajoutés
+            retires: Rôles retirés
+        """
+        self._fenetre.ajouter((membre.guild.id, membre.id), membre, ajoutes, retires)
+
+    async def _publier(self, attente: RolesEnAttente):
+        """Publie le bilan net ; rien si les changements se sont annulés"""
+        if not attente.ajoutes and not attente.retires:
+            return
+
+        await self.publier(attente.membre, list(attente.ajoutes.values()), list(attente.retires.values()))
+
+    async def arreter(self):
+        """Publie immédiatement les fenêtres ouvertes (déchargement du cog)"""
+        await self._fenetre.arreter()
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ ✅ FIN DU FICHIER – Regroupement des changements de rôles
+# ╚═══════════════════════════════════════════════════════════════════════════════
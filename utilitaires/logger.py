@@ -23,11 +23,55 @@
 ══════════════════════════════════════════════════════════════════════════════
 """
 
+import asyncio
+import atexit
+import gzip
+import json
 import logging
+import mmap
 import os
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+import queue
+import re
+import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 import configuration as config
+from .persistance import lire_json
+
+# ── 🔹 Mode asynchrone : une file partagée par tous les loggers, un seul thread d'écriture
+_handler_file: Optional[QueueHandler] = None
+_ecouteur: Optional[QueueListener] = None
+
+# ── 🔹 Compression des sauvegardes de rotation et écriture de l'index des plages
+# (un seul thread, créé au premier besoin, hors du thread d'écriture des logs)
+_compresseur: Optional[ThreadPoolExecutor] = None
+_compresseur_arrete = False
+
+# ── 🔹 Index des fichiers fermés {chemin: (taille, date de modification)} et fichiers en cours d'écriture
+_verrou_index = threading.Lock()
+_index_logs: Dict[str, Tuple[int, float]] = {}
+_index_valide = False
+_fichiers_actifs = set()
+
+# ── 🔹 Plages horaires des fichiers {nom: [premier, dernier enregistrement]} (dernier = None : en cours)
+FICHIER_PLAGES = "index_logs.json"
+_verrou_plages = threading.Lock()
+_plages: Optional[Dict[str, List[Optional[float]]]] = None
+_ecriture_plages_planifiee = False
+
+# ── 🔹 Sauvegarde de rotation : la_loyaute_<date>.log.<N>
+_MOTIF_SAUVEGARDE = re.compile(r"^(.+)\.(\d+)$")
+
+# ── 🔹 Taille des blocs lus depuis la fin des fichiers (lecture des dernières lignes)
+TAILLE_BLOC_LECTURE = 64 * 1024
+
+# ── 🔹 Champs stables des lignes JSON (None si absents de l'enregistrement)
+CHAMPS_STRUCTURES = ("event", "guild_id", "channel_id", "user_id", "latency_ms")
 
 # ╔══════════════════════════════════════════════════════════════════════════════
 # ║ 📁 Fonction 01 – Création du dossier de logs
@@ -71,10 +115,37 @@ class FormateurCouleur(logging.Formatter):
         # ── 🔹 Récupération de la couleur
         couleur = self.COULEURS.get(record.levelno, self.RESET)
 
-        # ── 🔹 Formatage du message
+        # ── 🔹 Formatage d'une copie (l'enregistrement est partagé avec le fichier)
+        record = logging.makeLogRecord(record.__dict__)
         record.levelname = f"{couleur}{record.levelname}{self.RESET}"
         return super().format(record)
 
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🧾 Fonction 02b – Formateur JSON-lines
+# ║ Description : Une ligne JSON compacte par enregistrement, champs stables
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class FormateurJson(logging.Formatter):
+    """Formateur JSON-lines (séparateurs compacts, attendus par requete_logs)"""
+
+    def format(self, record):
+        """Formate l'enregistrement en une ligne JSON"""
+        ligne = {
+            "ts": round(record.created, 3),
+            "niveau": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for champ in CHAMPS_STRUCTURES:
+            ligne[champ] = getattr(record, champ, None)
+
+        return json.dumps(ligne, ensure_ascii=False, separators=(",", ":"))
+
+
+def _filtre_texte(record) -> bool:
+    """Écarte des fichiers texte et de la console les enregistrements réservés au JSON"""
+    return not getattr(record, "json_seulement", False)
+
 # ╔══════════════════════════════════════════════════════════════════════════════
 # ║ 📝 Fonction 03 – Création du logger
 # ║ Description : Crée et configure un logger avec fichier et console
@@ -102,13 +173,29 @@ def creer_logger(nom: str, niveau: str = 'INFO') -> logging.Logger:
     if logger.handlers:
         return logger
 
-    # ── 🔹 Création du nom de fichier avec date
-    date_actuelle = datetime.now().strftime('%d-%m-%Y')
-    nom_fichier = os.path.join(config.DOSSIER_LOGS, f"la_loyaute_{date_actuelle}.log")
+    # ── 🔹 Mode asynchrone : dépôt dans la file partagée, écriture par le thread d'écoute
+    if config.LOGS_ASYNCHRONES:
+        logger.addHandler(_obtenir_handler_file(niveau))
+        logger.propagate = False
+        return logger
+
+    # ── 🔹 Mode direct : écriture sur le thread appelant
+    for handler in _creer_handlers(niveau):
+        logger.addHandler(handler)
 
-    # ── 🔹 Handler pour fichier (avec rotation)
-    handler_fichier = RotatingFileHandler(
-        nom_fichier,
+    return logger
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🧵 Fonction 03b – Handlers et écriture en thread dédié
+# ║ Description : Handlers fichier/console et QueueListener partagé
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def _creer_handlers(niveau: str) -> List[logging.Handler]:
+    """Crée les handlers fichier (avec rotation), console (colorée) et JSON-lines (optionnel)"""
+    # ── 🔹 Handler pour fichier daté (nouveau fichier à minuit, rotation à 10 MB)
+    handler_fichier = FichierRotatifJournalier(
+        config.DOSSIER_LOGS,
+        ".log",
         maxBytes=10*1024*1024,  # 10 MB
         backupCount=5,
         encoding='utf-8'
@@ -133,58 +220,480 @@ def creer_logger(nom: str, niveau: str = 'INFO') -> logging.Logger:
     )
     handler_console.setFormatter(formateur_console)
 
-    # ── 🔹 Ajout des handlers au logger
-    logger.addHandler(handler_fichier)
-    logger.addHandler(handler_console)
+    handler_fichier.addFilter(_filtre_texte)
+    handler_console.addFilter(_filtre_texte)
+    handlers = [handler_fichier, handler_console]
 
-    return logger
+    # ── 🔹 Handler JSON-lines (avec rotation)
+    if config.LOGS_JSON:
+        handler_json = FichierRotatifJournalier(
+            config.DOSSIER_LOGS,
+            ".jsonl",
+            maxBytes=10*1024*1024,  # 10 MB
+            backupCount=5,
+            encoding='utf-8'
+        )
+        handler_json.setLevel(logging.DEBUG)
+        handler_json.setFormatter(FormateurJson())
+        handlers.append(handler_json)
+
+    return handlers
+
+
+def _obtenir_handler_file(niveau: str) -> QueueHandler:
+    """Retourne le QueueHandler partagé (le thread d'écoute est démarré au premier appel)"""
+    global _handler_file, _ecouteur
+
+    if _handler_file is None:
+        file_logs = queue.SimpleQueue()
+        _handler_file = QueueHandler(file_logs)
+        _ecouteur = QueueListener(file_logs, *_creer_handlers(niveau), respect_handler_level=True)
+        _ecouteur.start()
+        atexit.register(arreter_logs)
+
+    return _handler_file
+
+
+def arreter_logs():
+    """Écrit les logs encore en file, arrête le thread d'écoute puis termine les compressions (arrêt du bot)"""
+    global _ecouteur
+
+    # ── 🔹 Plus de tâche de fond à partir d'ici : les derniers enregistrements écrivent l'index sur place
+    _arreter_compresseur()
+
+    if _ecouteur is not None:
+        ecouteur, _ecouteur = _ecouteur, None
+        ecouteur.stop()
+        for handler in ecouteur.handlers:
+            handler.close()
+
+
+def _arreter_compresseur():
+    """Termine les compressions en cours ; les tâches suivantes s'exécutent sur place"""
+    global _compresseur, _compresseur_arrete
+
+    _compresseur_arrete = True
+    if _compresseur is not None:
+        compresseur, _compresseur = _compresseur, None
+        compresseur.shutdown(wait=True)
+
+
+# ── 🔹 Mode synchrone : arrêt du thread de fond avant logging.shutdown (atexit : dernier inscrit, premier exécuté)
+atexit.register(_arreter_compresseur)
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🗜️ Fonction 03c – Rotation compressée
+# ║ Description : Sauvegardes .N.gz compressées hors du thread d'écriture
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class FichierRotatifCompresse(RotatingFileHandler):
+    """RotatingFileHandler dont les sauvegardes sont compressées (gzip) en arrière-plan"""
+
+    def __init__(self, nom_fichier: str, *args, **kwargs):
+        super().__init__(nom_fichier, *args, **kwargs)
+        _fichiers_actifs.add(self.baseFilename)
+
+        if config.LOGS_COMPRESSION:
+            self.namer = _nommer_compresse
+            self.rotator = _rotation_compressee
+
+    def doRollover(self):
+        """Rotation puis invalidation de l'index des fichiers"""
+        super().doRollover()
+        _invalider_index()
+
+
+def _nommer_compresse(nom: str) -> str:
+    """Nom d'une sauvegarde compressée (la_loyaute_<date>.log.1 → .log.1.gz)"""
+    return f"{nom}.gz"
+
+
+def _soumettre(fonction, *arguments):
+    """
+    Confie une tâche au thread de fond des fichiers de logs (créé au premier besoin)
+
+    Pendant l'arrêt, aucun thread n'est créé : la tâche s'exécute sur place.
+    """
+    global _compresseur, _compresseur_arrete
+
+    if not _compresseur_arrete:
+        try:
+            if _compresseur is None:
+                _compresseur = ThreadPoolExecutor(max_workers=1, thread_name_prefix="compression_logs")
+            _compresseur.submit(fonction, *arguments)
+            return
+        except RuntimeError:
+            # ── 🔹 Arrêt de l'interpréteur déjà engagé : plus aucune tâche planifiable
+            _compresseur_arrete = True
+
+    fonction(*arguments)
+
+
+def _rotation_compressee(source: str, destination: str):
+    """Renomme le fichier plein (instantané) et confie sa compression au thread dédié"""
+    non_compresse = destination[:-len(".gz")]
+    os.replace(source, non_compresse)
+    _soumettre(_compresser, non_compresse, destination)
+
+
+class FichierRotatifJournalier(FichierRotatifCompresse):
+    """
+    Fichier la_loyaute_<date><extension> : nouveau fichier à minuit, rotation
+    compressée à la taille maximale, plage horaire de chaque fichier indexée
+    """
+
+    def __init__(self, dossier: str, extension: str, *args, **kwargs):
+        self.dossier = dossier
+        self.extension = extension
+        self._minuit = _minuit_suivant()
+        self._premier: Optional[float] = None
+        self._dernier: Optional[float] = None
+        self._changement_jour = False
+        super().__init__(self._nom_du_jour(), *args, **kwargs)
+
+    def _nom_du_jour(self) -> str:
+        """Chemin du fichier du jour"""
+        return os.path.join(self.dossier, f"la_loyaute_{datetime.now().strftime('%d-%m-%Y')}{self.extension}")
+
+    def emit(self, record):
+        """Écrit l'enregistrement (après rotation éventuelle) et étend la plage du fichier"""
+        super().emit(record)
+
+        if self._premier is None:
+            self._premier = record.created
+            # ── 🔹 Une erreur d'index ne doit jamais interrompre le thread d'écriture des logs
+            try:
+                _noter_plage(os.path.basename(self.baseFilename), record.created, None)
+            except Exception:
+                self.handleError(record)
+        self._dernier = record.created
+
+    def shouldRollover(self, record) -> bool:
+        """Rotation au premier enregistrement après minuit, ou à la taille maximale"""
+        if record.created >= self._minuit:
+            self._changement_jour = True
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self):
+        """Changement de jour : nouveau fichier daté ; sinon rotation par taille"""
+        nom = os.path.basename(self.baseFilename)
+
+        if not self._changement_jour:
+            super().doRollover()
+            _decaler_plages(nom, self._premier, self._dernier, self.backupCount)
+            self._premier = None
+            return
+
+        # ── 🔹 Le fichier de la veille est fermé avec sa plage définitive
+        if self._premier is not None:
+            _noter_plage(nom, self._premier, self._dernier)
+
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        _fichiers_actifs.discard(self.baseFilename)
+        self.baseFilename = os.path.abspath(self._nom_du_jour())
+        _fichiers_actifs.add(self.baseFilename)
+
+        self._minuit = _minuit_suivant()
+        self._premier = None
+        self._changement_jour = False
+        if not self.delay:
+            self.stream = self._open()
+        _invalider_index()
+
+    def close(self):
+        """Fermeture : la plage du fichier courant est terminée"""
+        if self._premier is not None:
+            try:
+                _noter_plage(os.path.basename(self.baseFilename), self._premier, self._dernier)
+            except Exception as e:
+                print(f"⚠️ Erreur lors de l'écriture de l'index des logs : {e}")
+            self._premier = None
+        super().close()
+
+
+def _minuit_suivant() -> float:
+    """Horodatage du prochain minuit (heure locale)"""
+    demain = datetime.now().date() + timedelta(days=1)
+    return datetime(demain.year, demain.month, demain.day).timestamp()
+
+
+def _compresser(source: str, destination: str):
+    """Compresse une sauvegarde (fichier temporaire puis remplacement atomique)"""
+    temporaire = f"{destination}.tmp"
+    try:
+        with open(source, 'rb') as entree, gzip.open(temporaire, 'wb') as sortie:
+            shutil.copyfileobj(entree, sortie)
+        os.replace(temporaire, destination)
+        os.remove(source)
+    except Exception as e:
+        print(f"⚠️ Erreur lors de la compression de {source} : {e}")
+    finally:
+        _invalider_index()
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🕒 Fonction 03d – Plages horaires des fichiers
+# ║ Description : Premier et dernier enregistrement de chaque fichier (index_logs.json)
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def _chemin_plages() -> str:
+    """Chemin de l'index des plages horaires"""
+    return os.path.join(config.DOSSIER_LOGS, FICHIER_PLAGES)
+
+
+def _modifier_plages(modification):
+    """Applique une modification à l'index des plages en mémoire et planifie son écriture"""
+    global _plages, _ecriture_plages_planifiee
+
+    with _verrou_plages:
+        if _plages is None:
+            _plages = lire_plages()
+        modification(_plages)
+
+        # ── 🔹 Une seule écriture en attente : elle reprendra toutes les modifications suivantes
+        if _ecriture_plages_planifiee:
+            return
+        _ecriture_plages_planifiee = True
+
+    _soumettre(_ecrire_plages)
+
+
+def _ecrire_plages():
+    """
+    Écrit l'index des plages (thread de fond, jamais le thread d'écriture des logs)
+
+    Remplacement atomique sans fsync : l'index n'est qu'une aide à la recherche,
+    un fichier absent ou ancien est jugé sur sa date de modification.
+    """
+    global _ecriture_plages_planifiee
+
+    with _verrou_plages:
+        _ecriture_plages_planifiee = False
+        contenu = json.dumps(_plages, indent=4, ensure_ascii=False)
+
+    chemin = _chemin_plages()
+    try:
+        with open(f"{chemin}.tmp", 'w', encoding='utf-8') as fichier:
+            fichier.write(contenu)
+        os.replace(f"{chemin}.tmp", chemin)
+    except Exception as e:
+        print(f"⚠️ Erreur lors de l'écriture de l'index des logs : {e}")
+
+
+def _noter_plage(nom: str, premier: float, dernier: Optional[float]):
+    """Enregistre la plage d'un fichier (le début d'une plage existante est conservé)"""
+    def modification(plages):
+        existante = plages.get(nom)
+        debut = min(existante[0], premier) if existante and existante[0] else premier
+        plages[nom] = [debut, dernier]
+
+    _modifier_plages(modification)
+
+
+def _decaler_plages(nom: str, premier: Optional[float], dernier: Optional[float], sauvegardes: int):
+    """Rotation par taille : les plages de nom.N passent à nom.N+1, celle du fichier courant à nom.1"""
+    def modification(plages):
+        for numero in range(sauvegardes, 0, -1):
+            plage = plages.pop(f"{nom}.{numero}", None)
+            if plage is not None and numero < sauvegardes:
+                plages[f"{nom}.{numero + 1}"] = plage
+        plages.pop(nom, None)
+        if premier is not None:
+            plages[f"{nom}.1"] = [premier, dernier]
+
+    _modifier_plages(modification)
+
+
+def _oublier_plages(plages: Dict[str, List[Optional[float]]], presents: set):
+    """Retire les plages des fichiers qui n'existent plus"""
+    for nom in list(plages):
+        if nom not in presents:
+            del plages[nom]
+
+
+def lire_plages(dossier: str = None) -> Dict[str, List[Optional[float]]]:
+    """
+    Lit l'index des plages horaires (utilisable par un autre processus)
+
+    Returns:
+        dict: {nom de fichier: [premier, dernier enregistrement]}, dernier = None pour un fichier en cours
+    """
+    chemin = os.path.join(dossier or config.DOSSIER_LOGS, FICHIER_PLAGES)
+    try:
+        return lire_json(chemin)
+    except (OSError, ValueError):
+        return {}
+
+
+def fichier_pour_horodatage(horodatage: datetime, extension: str = ".log", dossier: str = None) -> Optional[str]:
+    """
+    Retrouve le fichier contenant les logs d'un instant, sans parcourir les fichiers
+
+    Args:
+        horodatage: Instant recherché
+        extension: .log (texte) ou .jsonl
+        dossier: Dossier des logs (config.DOSSIER_LOGS par défaut)
+
+    Returns:
+        Chemin du fichier (sans le suffixe .gz d'une sauvegarde compressée), ou None
+    """
+    dossier = dossier or config.DOSSIER_LOGS
+    instant = horodatage.timestamp()
+
+    for nom, (premier, dernier) in lire_plages(dossier).items():
+        base = _MOTIF_SAUVEGARDE.match(nom)
+        if not (base.group(1) if base else nom).endswith(extension):
+            continue
+        if premier <= instant <= (dernier if dernier is not None else time.time()):
+            chemin = os.path.join(dossier, nom)
+            if os.path.exists(chemin) or os.path.exists(f"{chemin}.gz"):
+                return chemin
+
+    # ── 🔹 Fichier absent de l'index : fichier daté du jour demandé
+    chemin = os.path.join(dossier, f"la_loyaute_{horodatage.strftime('%d-%m-%Y')}{extension}")
+    return chemin if os.path.exists(chemin) else None
+
+
+def fichier_log_courant(extension: str = ".log") -> str:
+    """Fichier en cours d'écriture (il peut dater d'avant le démarrage du jour), sinon fichier du jour"""
+    for chemin in list(_fichiers_actifs):
+        if chemin.endswith(extension):
+            return chemin
+    return os.path.join(config.DOSSIER_LOGS, f"la_loyaute_{datetime.now().strftime('%d-%m-%Y')}{extension}")
 
 # ╔══════════════════════════════════════════════════════════════════════════════
 # ║ 🗑️ Fonction 04 – Nettoyage des anciens logs
 # ║ Description : Supprime les fichiers de logs trop anciens
 # ╚══════════════════════════════════════════════════════════════════════════════
 
-def nettoyer_anciens_logs(jours: int = 30):
+def nettoyer_anciens_logs(jours: int = None, taille_max_mo: int = None) -> int:
     """
-    Supprime les fichiers de logs plus anciens que X jours
+    Supprime les fichiers de logs plus anciens que X jours, puis les plus
+    anciens tant que le dossier dépasse son budget (un seul parcours du dossier)
+
+    Les fichiers en cours d'écriture ne sont jamais supprimés.
 
     Args:
-        jours: Nombre de jours de rétention
+        jours: Nombre de jours de rétention (config.LOGS_RETENTION_JOURS par défaut)
+        taille_max_mo: Taille maximale du dossier en Mo (config.LOGS_TAILLE_MAX_MO par défaut)
+
+    Returns:
+        int: Nombre de fichiers supprimés
     """
-    if not os.path.exists(config.DOSSIER_LOGS):
-        return
+    jours = config.LOGS_RETENTION_JOURS if jours is None else jours
+    taille_max_mo = config.LOGS_TAILLE_MAX_MO if taille_max_mo is None else taille_max_mo
 
-    maintenant = datetime.now()
-    fichiers_supprimes = 0
+    if not os.path.exists(config.DOSSIER_LOGS):
+        return 0
 
-    # ── 🔹 Parcours des fichiers de logs
-    for fichier in os.listdir(config.DOSSIER_LOGS):
-        chemin_fichier = os.path.join(config.DOSSIER_LOGS, fichier)
+    # ── 🔹 Parcours unique du dossier (fichiers fermés, du plus ancien au plus récent)
+    fichiers = sorted(_scanner_dossier().items(), key=lambda element: element[1][1])
+    taille_totale = sum(taille for _, (taille, _) in fichiers) + _taille_actifs()
 
-        # ── 🔹 Vérification si c'est un fichier .log
-        if os.path.isfile(chemin_fichier) and fichier.endswith('.log'):
-            # ── 🔹 Récupération de la date de modification
-            temps_modification = datetime.fromtimestamp(os.path.getmtime(chemin_fichier))
-            age = (maintenant - temps_modification).days
+    limite_age = datetime.now().timestamp() - jours * 86400
+    budget = taille_max_mo * 1024 * 1024
+    conserves = {}
+    fichiers_supprimes = 0
 
-            # ── 🔹 Suppression si trop ancien
-            if age > jours:
-                try:
-                    os.remove(chemin_fichier)
-                    fichiers_supprimes += 1
-                except Exception as e:
-                    print(f"⚠️ Erreur lors de la suppression de {fichier} : {e}")
+    for chemin, (taille, modification) in fichiers:
+        # ── 🔹 Suppression si trop ancien ou si le budget est dépassé
+        if modification < limite_age or taille_totale > budget:
+            try:
+                os.remove(chemin)
+                fichiers_supprimes += 1
+                taille_totale -= taille
+                continue
+            except Exception as e:
+                print(f"⚠️ Erreur lors de la suppression de {os.path.basename(chemin)} : {e}")
+
+        conserves[chemin] = (taille, modification)
+
+    # ── 🔹 Le parcours sert aussi à rafraîchir l'index et à oublier les plages des fichiers supprimés
+    _remplacer_index(conserves)
+    if fichiers_supprimes > 0:
+        presents = {
+            os.path.basename(chemin[:-len(".gz")] if chemin.endswith(".gz") else chemin)
+            for chemin in list(conserves) + list(_fichiers_actifs)
+        }
+        _modifier_plages(lambda plages: _oublier_plages(plages, presents))
 
     if fichiers_supprimes > 0:
         print(f"🗑️ {fichiers_supprimes} ancien(s) fichier(s) de logs supprimé(s)")
 
+    return fichiers_supprimes
+
+
+async def boucle_retention(intervalle: float = None):
+    """Applique la rétention au démarrage puis périodiquement, hors de la boucle d'événements"""
+    intervalle = intervalle or config.LOGS_RETENTION_INTERVALLE
+    boucle = asyncio.get_running_loop()
+
+    while True:
+        try:
+            await boucle.run_in_executor(None, nettoyer_anciens_logs)
+        except Exception as e:
+            print(f"⚠️ Erreur lors de la rétention des logs : {e}")
+        await asyncio.sleep(intervalle)
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🗂️ Fonction 04b – Index des fichiers de logs
+# ║ Description : Tailles des fichiers fermés, reconstruit après rotation
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def _scanner_dossier() -> Dict[str, Tuple[int, float]]:
+    """Fichiers de logs fermés du dossier {chemin: (taille, date de modification)}"""
+    fichiers = {}
+    try:
+        with os.scandir(config.DOSSIER_LOGS) as entrees:
+            for entree in entrees:
+                if not entree.name.startswith("la_loyaute_") or entree.name.endswith(".tmp"):
+                    continue
+                chemin = os.path.abspath(entree.path)
+                if chemin in _fichiers_actifs or not entree.is_file():
+                    continue
+                infos = entree.stat()
+                fichiers[chemin] = (infos.st_size, infos.st_mtime)
+    except OSError:
+        pass
+    return fichiers
+
+
+def _remplacer_index(fichiers: Dict[str, Tuple[int, float]]):
+    """Remplace le contenu de l'index (après un parcours du dossier)"""
+    global _index_valide
+    with _verrou_index:
+        _index_logs.clear()
+        _index_logs.update(fichiers)
+        _index_valide = True
+
+
+def _invalider_index():
+    """Marque l'index à reconstruire (rotation, compression)"""
+    global _index_valide
+    with _verrou_index:
+        _index_valide = False
+
+
+def _taille_actifs() -> int:
+    """Taille des fichiers en cours d'écriture"""
+    taille = 0
+    for chemin in list(_fichiers_actifs):
+        try:
+            taille += os.path.getsize(chemin)
+        except OSError:
+            pass
+    return taille
+
 # ╔══════════════════════════════════════════════════════════════════════════════
 # ║ 📊 Fonction 05 – Statistiques des logs
 # ║ Description : Retourne des statistiques sur les fichiers de logs
 # ╚══════════════════════════════════════════════════════════════════════════════
 
 def obtenir_stats_logs() -> dict:
-    """Retourne des statistiques sur les fichiers de logs"""
+    """Retourne des statistiques sur les fichiers de logs (index des fichiers fermés)"""
     if not os.path.exists(config.DOSSIER_LOGS):
         return {
             'nombre_fichiers': 0,
@@ -192,21 +701,23 @@ def obtenir_stats_logs() -> dict:
             'fichier_actuel': 'Aucun'
         }
 
-    # ── 🔹 Comptage des fichiers et taille
-    fichiers = [f for f in os.listdir(config.DOSSIER_LOGS) if f.endswith('.log')]
-    nombre_fichiers = len(fichiers)
-    taille_totale = 0
+    # ── 🔹 Index reconstruit seulement après une rotation ou une compression
+    if not _index_valide:
+        _remplacer_index(_scanner_dossier())
 
-    for fichier in fichiers:
-        chemin = os.path.join(config.DOSSIER_LOGS, fichier)
-        taille_totale += os.path.getsize(chemin)
+    with _verrou_index:
+        fichiers_fermes = list(_index_logs.values())
+
+    # ── 🔹 Comptage des fichiers et taille (seuls les fichiers en cours d'écriture sont relus)
+    actifs = [chemin for chemin in _fichiers_actifs if os.path.exists(chemin)]
+    nombre_fichiers = len(fichiers_fermes) + len(actifs)
+    taille_totale = sum(taille for taille, _ in fichiers_fermes) + _taille_actifs()
 
     # ── 🔹 Conversion en MB
     taille_mb = round(taille_totale / (1024 * 1024), 2)
 
     # ── 🔹 Fichier actuel
-    date_actuelle = datetime.now().strftime('%d-%m-%Y')
-    fichier_actuel = f"la_loyaute_{date_actuelle}.log"
+    fichier_actuel = os.path.basename(fichier_log_courant())
 
     return {
         'nombre_fichiers': nombre_fichiers,
@@ -219,33 +730,223 @@ def obtenir_stats_logs() -> dict:
 # ║ Description : Lit les N dernières lignes d'un fichier de log
 # ╚══════════════════════════════════════════════════════════════════════════════
 
-def lire_dernieres_lignes(nombre_lignes: int = 50) -> list:
+def lire_dernieres_lignes(
+    nombre_lignes: int = 50,
+    fichier_log: str = None,
+    utiliser_mmap: bool = False,
+    horodatage: datetime = None
+) -> list:
     """
     Lit les dernières lignes du fichier de log actuel
 
+    Le fichier est lu par blocs depuis la fin (mémoire constante) ; s'il ne
+    contient pas assez de lignes, la lecture continue dans les sauvegardes
+    de rotation (.1, .2, ...).
+
     Args:
         nombre_lignes: Nombre de lignes à lire
+        fichier_log: Fichier à lire (fichier en cours d'écriture par défaut)
+        utiliser_mmap: Lit le fichier via mmap plutôt que par blocs
+        horodatage: Lit le fichier contenant cet instant (index des plages horaires)
 
     Returns:
-        list: Liste des dernières lignes
+        list: Liste des dernières lignes, de la plus ancienne à la plus récente
     """
-    # ── 🔹 Détermination du fichier actuel
-    date_actuelle = datetime.now().strftime('%d-%m-%Y')
-    fichier_log = os.path.join(config.DOSSIER_LOGS, f"la_loyaute_{date_actuelle}.log")
-
-    if not os.path.exists(fichier_log):
+    # ── 🔹 Détermination du fichier : instant demandé, sinon fichier en cours
+    if fichier_log is None and horodatage is not None:
+        fichier_log = fichier_pour_horodatage(horodatage)
+        if fichier_log is None:
+            return []
+    elif fichier_log is None:
+        fichier_log = fichier_log_courant()
+
+    if nombre_lignes <= 0:
         return []
 
-    # ── 🔹 Lecture des dernières lignes
+    # ── 🔹 Sauvegarde demandée directement (la_loyaute_<date>.log.N) : la suite est .N+1
+    sauvegarde = _MOTIF_SAUVEGARDE.match(fichier_log)
+    if sauvegarde:
+        fichier_log, numero = sauvegarde.group(1), int(sauvegarde.group(2))
+    else:
+        numero = 0
+
+    # ── 🔹 Lecture à rebours : fichier actuel puis sauvegardes .1, .2, ... (compressées ou non)
+    lignes = []
+    chemin = f"{fichier_log}.{numero}" if numero else fichier_log
     try:
-        with open(fichier_log, 'r', encoding='utf-8') as f:
-            lignes = f.readlines()
-            return lignes[-nombre_lignes:] if len(lignes) > nombre_lignes else lignes
+        while True:
+            if os.path.exists(chemin):
+                source = _lignes_a_rebours(chemin, utiliser_mmap)
+            elif os.path.exists(f"{chemin}.gz"):
+                source = _lignes_compressees_a_rebours(f"{chemin}.gz", nombre_lignes - len(lignes))
+            else:
+                break
+
+            for ligne in source:
+                lignes.append(ligne)
+                if len(lignes) >= nombre_lignes:
+                    return lignes[::-1]
+
+            numero += 1
+            chemin = f"{fichier_log}.{numero}"
     except Exception as e:
         print(f"❌ Erreur lors de la lecture du log : {e}")
-        return []
+
+    return lignes[::-1]
+
+
+def _lignes_a_rebours(chemin: str, utiliser_mmap: bool = False) -> Iterator[str]:
+    """Lignes d'un fichier de la dernière à la première (fin de ligne conservée)"""
+    with open(chemin, 'rb') as f:
+        taille = os.fstat(f.fileno()).st_size
+        if taille == 0:
+            return
+
+        # ── 🔹 mmap : recherche des fins de ligne directement dans la projection
+        if utiliser_mmap:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as projection:
+                fin = taille
+                while fin > 0:
+                    debut = projection.rfind(b'\n', 0, fin - 1) + 1
+                    yield projection[debut:fin].decode('utf-8', errors='replace')
+                    fin = debut
+            return
+
+        # ── 🔹 Blocs de taille fixe lus depuis la fin
+        # (tampon = début de ligne incomplet + bloc, fin = limite des lignes pas encore produites)
+        position = taille
+        tampon = b''
+        fin = 0
+        while True:
+            debut = tampon.rfind(b'\n', 0, fin - 1) + 1 if fin > 1 else 0
+            if debut > 0:
+                yield tampon[debut:fin].decode('utf-8', errors='replace')
+                fin = debut
+                continue
+
+            # Aucune fin de ligne dans le tampon : bloc précédent, ou première ligne du fichier
+            if position == 0:
+                if fin > 0:
+                    yield tampon[:fin].decode('utf-8', errors='replace')
+                return
+
+            lecture = min(TAILLE_BLOC_LECTURE, position)
+            position -= lecture
+            f.seek(position)
+            tampon = f.read(lecture) + tampon[:fin]
+            fin = len(tampon)
+
+def _lignes_compressees_a_rebours(chemin: str, nombre: int) -> Iterator[str]:
+    """Dernières lignes d'une sauvegarde gzip (lecture en flux, au plus `nombre` lignes gardées)"""
+    with gzip.open(chemin, 'rt', encoding='utf-8', errors='replace') as f:
+        dernieres = deque(f, maxlen=nombre)
+    yield from reversed(dernieres)
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 👀 Fonction 06b – Suivre un log
+# ║ Description : Nouvelles lignes au fil de l'eau (visionneuse en direct)
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+async def suivre_logs(fichier_log: str = None, intervalle: float = 1.0) -> AsyncIterator[str]:
+    """
+    Produit les lignes ajoutées au fichier de log, en suivant ses rotations
+
+    Args:
+        fichier_log: Fichier à suivre (par défaut le fichier en cours, y compris après minuit)
+        intervalle: Délai (en secondes) entre deux vérifications
+
+    Yields:
+        str: Chaque nouvelle ligne complète
+    """
+    fichier_courant = fichier_log is None
+    if fichier_courant:
+        fichier_log = fichier_log_courant()
+
+    # ── 🔹 Départ à la fin du fichier : seules les nouvelles lignes sont produites
+    position = os.path.getsize(fichier_log) if os.path.exists(fichier_log) else 0
+    identite = _identite_fichier(fichier_log)
+    reste = b''
+
+    while True:
+        await asyncio.sleep(intervalle)
+
+        # ── 🔹 Changement de jour : le fichier daté suivant est lu depuis le début
+        if fichier_courant and fichier_log_courant() != fichier_log:
+            fichier_log, identite = fichier_log_courant(), None
+
+        # ── 🔹 Rotation (fichier remplacé ou tronqué) : reprise au début du nouveau fichier
+        nouvelle_identite = _identite_fichier(fichier_log)
+        if nouvelle_identite is None:
+            continue
+        if nouvelle_identite != identite or os.path.getsize(fichier_log) < position:
+            identite, position, reste = nouvelle_identite, 0, b''
+
+        donnees, position = await asyncio.get_running_loop().run_in_executor(
+            None, _lire_depuis, fichier_log, position
+        )
+        if not donnees:
+            continue
+
+        *lignes, reste = (reste + donnees).split(b'\n')
+        for ligne in lignes:
+            yield (ligne + b'\n').decode('utf-8', errors='replace')
+
+
+def _identite_fichier(chemin: str):
+    """Identifiant du fichier sur le disque (change quand la rotation le remplace)"""
+    try:
+        infos = os.stat(chemin)
+    except OSError:
+        return None
+    return (infos.st_dev, infos.st_ino)
+
+
+def _lire_depuis(chemin: str, position: int):
+    """Lit la suite d'un fichier à partir d'une position (exécuté hors de la boucle)"""
+    with open(chemin, 'rb') as f:
+        f.seek(position)
+        donnees = f.read()
+    return donnees, position + len(donnees)
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🧾 Fonction 07 – Journaliser un événement
+# ║ Description : Ligne JSON structurée pour un événement Discord
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def journaliser_evenement(
+    logger: logging.Logger,
+    event: str,
+    guild_id: Optional[int] = None,
+    channel_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    latency_ms: Optional[float] = None,
+    message: str = ""
+):
+    """
+    Écrit un événement dans le fichier JSON-lines (sans effet si LOGS_JSON est désactivé)
+
+    Args:
+        logger: Logger du bot
+        event: Nom de l'événement (ex. message_delete)
+        guild_id: ID du serveur
+        channel_id: ID du salon
+        user_id: ID de l'utilisateur concerné
+        latency_ms: Durée de traitement en millisecondes
+        message: Texte libre complémentaire
+    """
+    if not config.LOGS_JSON:
+        return
+
+    logger.info(message or event, extra={
+        "event": event,
+        "guild_id": guild_id,
+        "channel_id": channel_id,
+        "user_id": user_id,
+        "latency_ms": latency_ms,
+        "json_seulement": True
+    })
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ║ ✅ FIN DU FICHIER – Système de logs professionnel complet
-# ║ 📦 6 fonctions de gestion et monitoring des logs
+# ║ 📦 11 fonctions de gestion et monitoring des logs
 # ╚═══════════════════════════════════════════════════════════════════════════════
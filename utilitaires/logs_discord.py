@@ -14,15 +14,18 @@
 Gestion avancée des logs dans un salon Discord dédié
 """
 
+import asyncio
 import discord
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Hashable, Tuple
 import configuration as config
 from utilitaires.helpers import creer_embed
+from utilitaires.afflux import formater_liste_membres
+from utilitaires.repartiteur_logs import PRIORITE_HAUTE, PRIORITE_MOYENNE, PRIORITE_BASSE
 
 # ╔══════════════════════════════════════════════════════════════════════════════
 # ║ 📝 FONCTION 01 – envoyer_log
-# ║ 🎯 Envoie un embed de log dans le salon configuré avec gestion des erreurs
+# ║ 🎯 Dépose un log dans la file de sa priorité et rend la main immédiatement
 # ╚══════════════════════════════════════════════════════════════════════════════
 
 async def envoyer_log(
@@ -32,11 +35,58 @@ async def envoyer_log(
     description: str = "",
     couleur: int = config.COULEUR_PRINCIPALE,
     champs: Optional[List[Dict[str, Any]]] = None,
-    thumbnail: Optional[str] = None
+    thumbnail: Optional[str] = None,
+    priorite: int = PRIORITE_MOYENNE,
+    cle_fusion: Optional[Hashable] = None,
+    fichier: Optional[Tuple[str, bytes]] = None
 ):
     """
     Envoie un log dans le salon de logs configuré
 
+    Le log est déposé dans le répartiteur du bot puis publié en tâche de fond :
+    l'appelant n'attend ni la construction de l'embed ni l'appel à Discord.
+
+    Args:
+        bot: Instance du bot
+        guild: Serveur Discord
+        titre: Titre du log
+        description: Description du log
+        couleur: Couleur de l'embed
+        champs: Liste de dictionnaires {name, value, inline}
+        thumbnail: URL de la miniature
+        priorite: PRIORITE_HAUTE, PRIORITE_MOYENNE ou PRIORITE_BASSE
+        cle_fusion: Clé permettant de remplacer un log identique en attente (file pleine)
+        fichier: Fichier joint (nom, contenu), envoyé avec l'embed hors regroupement
+    """
+    bot.repartiteur_logs.soumettre(
+        priorite,
+        publier_log,
+        bot, guild, titre, description, couleur, champs, thumbnail,
+        datetime.now(), priorite == PRIORITE_HAUTE,
+        cle_fusion=cle_fusion,
+        fichier=fichier
+    )
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📤 FONCTION 01b – publier_log
+# ║ 🎯 Construit l'embed et le confie à l'envoi groupé (appelé par le répartiteur)
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+async def publier_log(
+    bot,
+    guild: discord.Guild,
+    titre: str,
+    description: str,
+    couleur: int,
+    champs: Optional[List[Dict[str, Any]]],
+    thumbnail: Optional[str],
+    horodatage: datetime,
+    immediat: bool = False,
+    fichier: Optional[Tuple[str, bytes]] = None
+):
+    """
+    Publie un log dans le salon de logs configuré
+
     Args:
         bot: Instance du bot
         guild: Serveur Discord
@@ -45,6 +95,9 @@ async def envoyer_log(
         couleur: Couleur de l'embed
         champs: Liste de dictionnaires {name, value, inline}
         thumbnail: URL de la miniature
+        horodatage: Date de l'événement (et non de la publication)
+        immediat: Envoie sans attendre le regroupement (logs de modération)
+        fichier: Fichier joint (nom, contenu)
     """
     try:
         # ── 🔹 ÉTAPE 1 : Récupération du salon de logs via le gestionnaire
@@ -57,13 +110,13 @@ async def envoyer_log(
             return
 
         # ── 🔹 ÉTAPE 3 : Récupération du salon Discord
+        # (salon introuvable : le log est conservé sur disque et renvoyé plus tard)
         salon_logs = guild.get_channel(salon_id)
         if not salon_logs:
             bot.logger.warning(f"⚠️ Salon de logs (ID: {salon_id}) introuvable pour {guild.name}")
-            return
 
         # ── 🔹 ÉTAPE 4 : Vérification du type de salon
-        if not isinstance(salon_logs, (discord.TextChannel, discord.Thread)):
+        elif not isinstance(salon_logs, (discord.TextChannel, discord.Thread)):
             bot.logger.error(f"❌ Le salon de logs doit être un salon textuel")
             return
 
@@ -90,13 +143,16 @@ async def envoyer_log(
 
         # ── 🔹 ÉTAPE 8 : Footer personnalisé
         embed.set_footer(text=f"{guild.name} • Logs")
-        embed.timestamp = datetime.now()
+        embed.timestamp = horodatage
 
-        # ── 🔹 ÉTAPE 9 : Envoi
-        await salon_logs.send(embed=embed)
+        # ── 🔹 ÉTAPE 9 : Envoi groupé (jusqu'à 10 embeds par message)
+        if salon_logs is None:
+            await bot.expediteur_logs.mettre_en_attente(salon_id, [embed])
+        elif fichier is not None:
+            await bot.expediteur_logs.envoyer_fichier(salon_logs, embed, *fichier)
+        else:
+            bot.expediteur_logs.ajouter(salon_logs, embed, immediat=immediat)
 
-    except discord.Forbidden:
-        bot.logger.error(f"❌ Permissions manquantes pour envoyer dans le salon de logs")
     except Exception as e:
         bot.logger.error(f"❌ Erreur lors de l'envoi du log : {e}")
 
@@ -120,7 +176,8 @@ async def log_kick(bot, guild: discord.Guild, membre: discord.Member, moderateur
             {"name": "Modérateur", "value": moderateur.mention, "inline": True},
             {"name": "Raison", "value": raison, "inline": False}
         ],
-        thumbnail=thumbnail_url
+        thumbnail=thumbnail_url,
+        priorite=PRIORITE_HAUTE
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -148,7 +205,8 @@ async def log_ban(bot, guild: discord.Guild, membre: discord.Member, moderateur:
         description=f"**{membre}** a été banni du serveur",
         couleur=config.COULEUR_ERREUR,
         champs=champs,
-        thumbnail=thumbnail_url
+        thumbnail=thumbnail_url,
+        priorite=PRIORITE_HAUTE
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -171,7 +229,8 @@ async def log_unban(bot, guild: discord.Guild, utilisateur: discord.User, modera
             {"name": "Modérateur", "value": moderateur.mention, "inline": True},
             {"name": "Raison", "value": raison, "inline": False}
         ],
-        thumbnail=thumbnail_url
+        thumbnail=thumbnail_url,
+        priorite=PRIORITE_HAUTE
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -195,7 +254,8 @@ async def log_timeout(bot, guild: discord.Guild, membre: discord.Member, moderat
             {"name": "Modérateur", "value": moderateur.mention, "inline": True},
             {"name": "Raison", "value": raison, "inline": False}
         ],
-        thumbnail=thumbnail_url
+        thumbnail=thumbnail_url,
+        priorite=PRIORITE_HAUTE
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -220,7 +280,8 @@ async def log_warn(bot, guild: discord.Guild, membre: discord.Member, moderateur
             {"name": "Modérateur", "value": moderateur.mention, "inline": True},
             {"name": "Raison", "value": raison, "inline": False}
         ],
-        thumbnail=thumbnail_url
+        thumbnail=thumbnail_url,
+        priorite=PRIORITE_HAUTE
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -240,7 +301,8 @@ async def log_clear(bot, guild: discord.Guild, salon: discord.TextChannel, moder
             {"name": "Salon", "value": salon.mention, "inline": True},
             {"name": "Nombre", "value": str(nombre), "inline": True},
             {"name": "Modérateur", "value": moderateur.mention, "inline": True}
-        ]
+        ],
+        priorite=PRIORITE_HAUTE
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -267,7 +329,28 @@ async def log_member_join(bot, membre: discord.Member):
             {"name": "Compte créé", "value": f"Il y a {jours} jour(s)", "inline": True},
             {"name": "Membres totaux", "value": str(membre.guild.member_count), "inline": True}
         ],
-        thumbnail=thumbnail_url
+        thumbnail=thumbnail_url,
+        priorite=PRIORITE_MOYENNE
+    )
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🌊 FONCTION 08b – log_member_join_afflux
+# ║ 👥 Log groupé des arrivées pendant un afflux de membres
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+async def log_member_join_afflux(bot, guild: discord.Guild, membres: List[discord.Member]):
+    """Log un résumé des arrivées regroupées pendant un afflux"""
+    await envoyer_log(
+        bot=bot,
+        guild=guild,
+        titre=f"🌊 Afflux : {len(membres)} nouveaux membres",
+        description=formater_liste_membres(membres),
+        couleur=config.COULEUR_AVERTISSEMENT,
+        champs=[
+            {"name": "Arrivées regroupées", "value": str(len(membres)), "inline": True},
+            {"name": "Membres totaux", "value": str(guild.member_count), "inline": True}
+        ],
+        priorite=PRIORITE_MOYENNE
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -289,7 +372,8 @@ async def log_member_leave(bot, membre: discord.Member):
             {"name": "Membre", "value": f"{membre.mention}\n`{membre.id}`", "inline": True},
             {"name": "Membres restants", "value": str(membre.guild.member_count), "inline": True}
         ],
-        thumbnail=thumbnail_url
+        thumbnail=thumbnail_url,
+        priorite=PRIORITE_MOYENNE
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -341,7 +425,118 @@ async def log_message_delete(bot, message: discord.Message):
         description=f"Un message de **{message.author}** a été supprimé",
         couleur=config.COULEUR_ERREUR,
         champs=champs,
-        thumbnail=thumbnail_url
+        thumbnail=thumbnail_url,
+        priorite=PRIORITE_BASSE
+    )
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🧠 FONCTION 10b – log_message_delete_memorise
+# ║ 💬 Log la suppression d'un message absent du cache (contenu conservé par le bot)
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+async def log_message_delete_memorise(bot, guild: discord.Guild, enregistrement):
+    """Log la suppression d'un message à partir de la mémoire des messages (sans appel API)"""
+    # ── 🔹 Construction des champs
+    champs = [
+        {"name": "👤 Auteur", "value": f"<@{enregistrement.auteur_id}>\n`{enregistrement.auteur_id}`", "inline": True},
+        {"name": "📍 Salon", "value": f"<#{enregistrement.salon_id}>", "inline": True}
+    ]
+
+    # ── 🔹 Contenu du message (si présent)
+    contenu = enregistrement.contenu
+    if contenu:
+        if len(contenu) > 1024:
+            contenu = contenu[:1021] + "..."
+        champs.append({"name": "💬 Contenu", "value": contenu, "inline": False})
+
+    # ── 🔹 Pièces jointes (si présentes)
+    if enregistrement.pieces_jointes:
+        attachments_info = "\n".join([f"📎 [{nom}]({url})" for nom, url in enregistrement.pieces_jointes])
+        if len(attachments_info) > 1024:
+            attachments_info = attachments_info[:1021] + "..."
+        champs.append({"name": "📎 Pièces jointes", "value": attachments_info, "inline": False})
+
+    await envoyer_log(
+        bot=bot,
+        guild=guild,
+        titre="🗑️ Message supprimé",
+        description=f"Un message de **{enregistrement.auteur_nom}** a été supprimé",
+        couleur=config.COULEUR_ERREUR,
+        champs=champs,
+        priorite=PRIORITE_BASSE
+    )
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📜 FONCTION 10c – construire_transcription
+# ║ 📄 Fichier texte des messages supprimés en masse (exécuté hors boucle)
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def construire_transcription(nom_salon: str, nombre: int, messages: List[Tuple[int, str, int, str, Tuple[str, ...]]]) -> bytes:
+    """
+    Construit la transcription d'une suppression en masse
+
+    Args:
+        nom_salon: Nom du salon concerné
+        nombre: Nombre total de messages supprimés
+        messages: Tuples (message_id, auteur, auteur_id, contenu, urls des pièces jointes)
+
+    Returns:
+        bytes: Transcription UTF-8, du plus ancien au plus récent
+    """
+    lignes = [
+        f"Suppression en masse dans #{nom_salon}",
+        f"{len(messages)} message(s) retrouvé(s) sur {nombre}",
+        ""
+    ]
+
+    for message_id, auteur, auteur_id, contenu, urls in sorted(messages):
+        # L'ID Discord (snowflake) contient la date d'envoi du message
+        envoye = datetime.fromtimestamp(((message_id >> 22) + 1420070400000) / 1000, tz=timezone.utc)
+        lignes.append(f"[{envoye:%Y-%m-%d %H:%M:%S}] {auteur} ({auteur_id}) :")
+        lignes.extend(f"    {ligne}" for ligne in (contenu or "(aucun contenu)").splitlines())
+        lignes.extend(f"    📎 {url}" for url in urls)
+
+    return "\n".join(lignes).encode("utf-8")
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🧹 FONCTION 10d – log_bulk_delete
+# ║ 🗑️ Log unique d'une suppression en masse avec la transcription jointe
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+async def log_bulk_delete(
+    bot,
+    guild: discord.Guild,
+    salon_id: int,
+    nombre: int,
+    messages: List[Tuple[int, str, int, str, Tuple[str, ...]]]
+):
+    """Log une suppression en masse ; la transcription est construite dans un thread"""
+    salon = guild.get_channel(salon_id)
+    nom_salon = getattr(salon, 'name', str(salon_id))
+
+    champs = [
+        {"name": "📍 Salon", "value": f"<#{salon_id}>", "inline": True},
+        {"name": "🗑️ Messages", "value": str(nombre), "inline": True},
+        {"name": "💬 Contenu retrouvé", "value": f"{len(messages)}/{nombre}", "inline": True}
+    ]
+
+    # ── 🔹 Transcription construite hors de la boucle d'événements
+    fichier = None
+    if messages:
+        donnees = await asyncio.get_running_loop().run_in_executor(
+            None, construire_transcription, nom_salon, nombre, messages
+        )
+        fichier = (f"suppression_{salon_id}_{datetime.now():%Y%m%d_%H%M%S}.txt", donnees)
+
+    await envoyer_log(
+        bot=bot,
+        guild=guild,
+        titre="🧹 Suppression en masse",
+        description=f"**{nombre}** messages ont été supprimés dans <#{salon_id}>",
+        couleur=config.COULEUR_ERREUR,
+        champs=champs,
+        priorite=PRIORITE_MOYENNE,
+        fichier=fichier
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -349,8 +544,8 @@ async def log_message_delete(bot, message: discord.Message):
 # ║ 📝 Log la modification d'un message avec avant/après
 # ╚══════════════════════════════════════════════════════════════════════════════
 
-async def log_message_edit(bot, before: discord.Message, after: discord.Message):
-    """Log la modification d'un message"""
+async def log_message_edit(bot, before: discord.Message, after: discord.Message, modifications: int = 1):
+    """Log la modification d'un message (`modifications` : éditions regroupées, avant = première version)"""
     # ── 🔹 Ignorer les messages des bots
     if after.author.bot:
         return
@@ -376,6 +571,12 @@ async def log_message_edit(bot, before: discord.Message, after: discord.Message)
 
     champs.append({"name": "🔗 Lien", "value": f"[Aller au message]({after.jump_url})", "inline": True})
 
+    # ── 🔹 Nombre de modifications regroupées
+    description = f"**{after.author}** a modifié un message"
+    if modifications > 1:
+        description += f" ({modifications} fois)"
+        champs.append({"name": "🔁 Modifications", "value": str(modifications), "inline": True})
+
     # ── 🔹 Contenu avant
     before_content = before.content if before.content else "*Aucun contenu*"
     if len(before_content) > 1024:
@@ -394,10 +595,56 @@ async def log_message_edit(bot, before: discord.Message, after: discord.Message)
         bot=bot,
         guild=after.guild,
         titre="✏️ Message modifié",
-        description=f"**{after.author}** a modifié un message",
+        description=description,
+        couleur=config.COULEUR_AVERTISSEMENT,
+        champs=champs,
+        thumbnail=thumbnail_url,
+        priorite=PRIORITE_BASSE,
+        cle_fusion=("edition", after.id)
+    )
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🧠 FONCTION 11b – log_message_edit_memorise
+# ║ 📝 Log la modification d'un message absent du cache (contenu conservé par le bot)
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+async def log_message_edit_memorise(
+    bot, guild: discord.Guild, enregistrement, avant: str, apres: str, modifications: int = 1
+):
+    """Log la modification d'un message à partir de la mémoire des messages (sans appel API, avant = première version)"""
+    # ── 🔹 Ignorer si le contenu n'a pas changé
+    if avant == apres:
+        return
+
+    # ── 🔹 Construction des champs
+    champs = [
+        {"name": "👤 Auteur", "value": f"<@{enregistrement.auteur_id}>\n`{enregistrement.auteur_id}`", "inline": True},
+        {"name": "📍 Salon", "value": f"<#{enregistrement.salon_id}>", "inline": True},
+        {"name": "🔗 Lien", "value": f"[Aller au message]({enregistrement.lien})", "inline": True}
+    ]
+
+    # ── 🔹 Nombre de modifications regroupées
+    description = f"**{enregistrement.auteur_nom}** a modifié un message"
+    if modifications > 1:
+        description += f" ({modifications} fois)"
+        champs.append({"name": "🔁 Modifications", "value": str(modifications), "inline": True})
+
+    # ── 🔹 Contenus avant / après
+    for nom, contenu in (("📝 Avant", avant), ("✅ Après", apres)):
+        contenu = contenu if contenu else "*Aucun contenu*"
+        if len(contenu) > 1024:
+            contenu = contenu[:1021] + "..."
+        champs.append({"name": nom, "value": contenu, "inline": False})
+
+    await envoyer_log(
+        bot=bot,
+        guild=guild,
+        titre="✏️ Message modifié",
+        description=description,
         couleur=config.COULEUR_AVERTISSEMENT,
         champs=champs,
-        thumbnail=thumbnail_url
+        priorite=PRIORITE_BASSE,
+        cle_fusion=("edition", enregistrement.message_id)
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -405,12 +652,13 @@ async def log_message_edit(bot, before: discord.Message, after: discord.Message)
 # ║ 🔄 Log les changements de rôles d'un membre
 # ╚══════════════════════════════════════════════════════════════════════════════
 
-async def log_member_roles_update(bot, before: discord.Member, after: discord.Member):
-    """Log les changements de rôles d'un membre"""
-    # ── 🔹 Détection des rôles ajoutés/retirés
-    roles_added = [role for role in after.roles if role not in before.roles]
-    roles_removed = [role for role in before.roles if role not in after.roles]
-
+async def log_member_roles_update(
+    bot,
+    after: discord.Member,
+    roles_added: List[discord.Role],
+    roles_removed: List[discord.Role]
+):
+    """Log les changements de rôles d'un membre (différence déjà calculée, éventuellement regroupée)"""
     # ── 🔹 Si aucun changement de rôle, on ignore
     if not roles_added and not roles_removed:
         return
@@ -420,18 +668,19 @@ async def log_member_roles_update(bot, before: discord.Member, after: discord.Me
         {"name": "👤 Membre", "value": f"{after.mention}\n`{after.id}`", "inline": True}
     ]
 
-    # ── 🔹 Rôles ajoutés
-    if roles_added:
-        roles_text = ", ".join([role.mention for role in roles_added])
-        champs.append({"name": "➕ Rôle(s) ajouté(s)", "value": roles_text, "inline": False})
-
-    # ── 🔹 Rôles retirés
-    if roles_removed:
-        roles_text = ", ".join([role.mention for role in roles_removed])
-        champs.append({"name": "➖ Rôle(s) retiré(s)", "value": roles_text, "inline": False})
+    # ── 🔹 Rôles ajoutés puis retirés
+    for nom, roles in (("➕ Rôle(s) ajouté(s)", roles_added), ("➖ Rôle(s) retiré(s)", roles_removed)):
+        if roles:
+            roles_text = ", ".join([role.mention for role in roles])
+            if len(roles_text) > 1024:
+                roles_text = roles_text[:1000].rsplit(",", 1)[0] + f", … ({len(roles)} au total)"
+            champs.append({"name": nom, "value": roles_text, "inline": False})
 
     # ── 🔹 Choix du titre et de la couleur
-    if roles_added:
+    if roles_added and roles_removed:
+        titre = "🎭 Rôles modifiés"
+        couleur = config.COULEUR_AVERTISSEMENT
+    elif roles_added:
         titre = "🎭 Rôle ajouté"
         couleur = config.COULEUR_SUCCES
     else:
@@ -447,7 +696,8 @@ async def log_member_roles_update(bot, before: discord.Member, after: discord.Me
         description=f"Les rôles de **{after}** ont changé",
         couleur=couleur,
         champs=champs,
-        thumbnail=thumbnail_url
+        thumbnail=thumbnail_url,
+        priorite=PRIORITE_MOYENNE
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -482,7 +732,8 @@ async def log_channel_create(bot, channel):
         titre="🏗️ Salon créé",
         description=f"Un nouveau salon a été créé",
         couleur=config.COULEUR_SUCCES,
-        champs=champs
+        champs=champs,
+        priorite=PRIORITE_MOYENNE
     )
 
 # ╔══════════════════════════════════════════════════════════════════════════════
@@ -517,10 +768,11 @@ async def log_channel_delete(bot, channel):
         titre="🗑️ Salon supprimé",
         description=f"Un salon a été supprimé",
         couleur=config.COULEUR_ERREUR,
-        champs=champs
+        champs=champs,
+        priorite=PRIORITE_MOYENNE
     )
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# ║ ✅ FIN DU FICHIER – 14 types de logs Discord disponibles
+# ║ ✅ FIN DU FICHIER – 18 types de logs Discord disponibles
 # ║ 📦 Modération, membres, messages et salons entièrement couverts
 # ╚══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,257 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🦁 LA LOYAUTÉ - persistance.py
+# ║
+# ║ 💾 Bot Discord privé développé en Python
+# ║ 👨‍💻 Développé par Latury
+# ║ 📦 Version : 0.3.0
+# ║
+# ═══════════════════════════════════════════════════════════════════════════════
+
+"""
+🦁 LA LOYAUTÉ - Persistance asynchrone des fichiers de données
+══════════════════════════════════════════════════════════════════════════════
+Sérialisation et écriture disque exécutées hors de la boucle asyncio
+"""
+
+import asyncio
+import copy
+import json
+import os
+from typing import Any, Callable, Dict
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🔒 Fonction 01 – Verrou par fichier
+# ║ Description : Sérialise les écritures concurrentes d'un même fichier
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+_verrous_fichiers: Dict[str, asyncio.Lock] = {}
+
+
+def obtenir_verrou(chemin) -> asyncio.Lock:
+    """
+    Retourne le verrou associé à un fichier (créé à la demande)
+
+    Args:
+        chemin: Chemin du fichier
+
+    Returns:
+        asyncio.Lock: Verrou partagé par toutes les écritures de ce fichier
+    """
+    cle = os.path.abspath(str(chemin))
+    verrou = _verrous_fichiers.get(cle)
+    if verrou is None:
+        verrou = _verrous_fichiers[cle] = asyncio.Lock()
+    return verrou
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📄 Fonction 02 – Lecture / écriture JSON bloquantes
+# ║ Description : Opérations disque exécutées dans un thread
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def lire_json(chemin) -> Any:
+    """Lit un fichier JSON (bloquant)"""
+    with open(chemin, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def ecrire_json(chemin, donnees: Any):
+    """
+    Écrit un fichier JSON de manière atomique (bloquant)
+
+    Le contenu est écrit dans un fichier temporaire, synchronisé sur disque
+    puis renommé : un arrêt brutal laisse soit l'ancien fichier, soit le nouveau,
+    jamais un fichier tronqué.
+    """
+    chemin = str(chemin)
+    chemin_temporaire = chemin + ".tmp"
+
+    with open(chemin_temporaire, 'w', encoding='utf-8') as f:
+        json.dump(donnees, f, indent=4, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(chemin_temporaire, chemin)
+    synchroniser_dossier(os.path.dirname(chemin) or ".")
+
+
+def synchroniser_dossier(dossier: str):
+    """Synchronise l'entrée de répertoire après un renommage (sans effet sous Windows)"""
+    if os.name != 'posix':
+        return
+
+    descripteur = os.open(dossier, os.O_RDONLY)
+    try:
+        os.fsync(descripteur)
+    finally:
+        os.close(descripteur)
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ ⚡ Fonction 03 – Exécution hors boucle
+# ║ Description : Lance une fonction bloquante dans l'exécuteur par défaut
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+async def executer(fonction: Callable, *args) -> Any:
+    """
+    Exécute une fonction bloquante dans l'exécuteur de la boucle
+
+    Args:
+        fonction: Fonction bloquante à exécuter
+        *args: Arguments de la fonction
+
+    Returns:
+        Le résultat de la fonction
+    """
+    boucle = asyncio.get_running_loop()
+    return await boucle.run_in_executor(None, fonction, *args)
+
+
+async def executer_sous_verrou(chemin, fonction: Callable, *args) -> Any:
+    """
+    Exécute une fonction bloquante hors boucle en sérialisant les accès à un fichier
+
+    Args:
+        chemin: Fichier protégé par le verrou
+        fonction: Fonction bloquante à exécuter
+        *args: Arguments de la fonction
+
+    Returns:
+        Le résultat de la fonction
+    """
+    async with obtenir_verrou(chemin):
+        return await executer(fonction, *args)
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 💾 Fonction 04 – Lecture / écriture JSON asynchrones
+# ║ Description : API awaitable utilisée par les gestionnaires et les cogs
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+async def lire_json_async(chemin) -> Any:
+    """
+    Lit un fichier JSON hors de la boucle asyncio
+
+    Args:
+        chemin: Chemin du fichier
+
+    Returns:
+        Le contenu décodé du fichier
+    """
+    return await executer_sous_verrou(chemin, lire_json, chemin)
+
+
+async def ecrire_json_async(chemin, donnees: Any):
+    """
+    Écrit un fichier JSON hors de la boucle asyncio
+
+    Un instantané des données est pris avant de passer la main au thread,
+    les modifications faites pendant l'écriture ne corrompent donc pas le fichier.
+
+    Args:
+        chemin: Chemin du fichier
+        donnees: Données à sérialiser
+    """
+    instantane = copy.deepcopy(donnees)
+    await executer_sous_verrou(chemin, ecrire_json, chemin, instantane)
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📜 Classe 01 – Journal de modifications
+# ║ Description : Journal append-only (JSON lines) rejoué au démarrage
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class JournalModifications:
+    """Journal append-only de modifications, compacté dans un instantané"""
+
+    def __init__(self, chemin):
+        """
+        Initialise le journal
+
+        Args:
+            chemin: Chemin du fichier journal
+        """
+        self.chemin = str(chemin)
+        self.chemin_compaction = self.chemin + ".compaction"
+        self.nombre_entrees = 0
+        self._fichier = None
+
+    def ajouter(self, entree: dict):
+        """
+        Ajoute une entrée en fin de journal (une ligne, sans réécriture)
+
+        L'entrée est synchronisée sur disque avant le retour : une modification
+        acquittée survit à une coupure de courant. Les modifications de
+        configuration sont rares (commandes d'administration), une ligne fsyncée
+        par modification reste bien moins coûteuse que la réécriture du fichier.
+
+        Args:
+            entree: Modification sérialisable en JSON
+        """
+        if self._fichier is None:
+            nouveau = not os.path.exists(self.chemin)
+            self._fichier = open(self.chemin, 'a', encoding='utf-8')
+            if nouveau:
+                # ── 🔹 Entrée de répertoire du journal neuf (création, ou après une compaction)
+                synchroniser_dossier(os.path.dirname(self.chemin) or ".")
+
+        self._fichier.write(json.dumps(entree, ensure_ascii=False) + "\n")
+        self._fichier.flush()
+        os.fsync(self._fichier.fileno())
+        self.nombre_entrees += 1
+
+    def lire(self) -> list:
+        """
+        Lit les entrées à rejouer (compaction interrompue puis journal courant)
+
+        Une dernière ligne tronquée par un arrêt brutal est ignorée.
+
+        Returns:
+            list: Entrées dans l'ordre d'écriture
+        """
+        entrees = []
+        for chemin in (self.chemin_compaction, self.chemin):
+            if not os.path.exists(chemin):
+                continue
+
+            with open(chemin, 'r', encoding='utf-8') as f:
+                for ligne in f:
+                    try:
+                        entrees.append(json.loads(ligne))
+                    except json.JSONDecodeError:
+                        continue
+
+        self.nombre_entrees = len(entrees)
+        return entrees
+
+    def commencer_compaction(self) -> bool:
+        """
+        Met de côté le journal courant avant l'écriture d'un instantané
+
+        Les nouvelles modifications partent dans un journal neuf pendant que
+        l'instantané est écrit. Si une compaction précédente a échoué, le journal
+        courant est conservé tel quel (le rejeu est idempotent).
+
+        Returns:
+            bool: True si le journal a été mis de côté
+        """
+        if os.path.exists(self.chemin_compaction):
+            return False
+
+        self.fermer()
+        if os.path.exists(self.chemin):
+            os.replace(self.chemin, self.chemin_compaction)
+        self.nombre_entrees = 0
+        return True
+
+    def terminer_compaction(self):
+        """Supprime le journal mis de côté une fois l'instantané écrit (bloquant)"""
+        if os.path.exists(self.chemin_compaction):
+            os.remove(self.chemin_compaction)
+
+    def fermer(self):
+        """Ferme le fichier journal"""
+        if self._fichier is not None:
+            self._fichier.close()
+            self._fichier = None
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ ✅ FIN DU FICHIER – Persistance asynchrone
+# ╚═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,208 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🦁 LA LOYAUTÉ - repartiteur_logs.py
+# ║
+# ║ 🚦 Bot Discord privé développé en Python
+# ║ 👨‍💻 Développé par Latury
+# ║ 📦 Version : 0.3.0
+# ║
+# ═══════════════════════════════════════════════════════════════════════════════
+
+"""
+🦁 LA LOYAUTÉ - Répartiteur des logs Discord
+══════════════════════════════════════════════════════════════════════════════
+Files bornées par priorité traitées en tâche de fond : les listeners déposent
+leurs logs et rendent la main immédiatement
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import configuration as config
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🚦 Constantes – Priorités et politiques de saturation
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+PRIORITE_HAUTE = 0    # Modération (kick, ban, timeout, warn, clear)
+PRIORITE_MOYENNE = 1  # Membres et salons (arrivées, départs, rôles)
+PRIORITE_BASSE = 2    # Messages (suppressions, modifications)
+
+# File pleine : retirer le plus ancien, refuser le nouveau,
+# ou remplacer un log en attente de même clé (sinon retirer le plus ancien)
+POLITIQUE_ANCIEN = "ancien"
+POLITIQUE_NOUVEAU = "nouveau"
+POLITIQUE_FUSIONNER = "fusionner"
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📦 Classe 01 – VoieLogs
+# ║ Description : File bornée d'une priorité
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class VoieLogs:
+    """File bornée de logs d'une même priorité"""
+
+    def __init__(self, nom: str, taille: int, politique: str):
+        self.nom = nom
+        self.taille = taille
+        self.politique = politique
+        self.elements: deque = deque()
+        self.rejetes = 0
+        self.fusionnes = 0
+
+    def deposer(self, element: list, cle: Optional[Hashable]) -> bool:
+        """
+        Dépose un log en appliquant la politique de saturation
+
+        Returns:
+            bool: True si le log a été accepté (ajouté ou fusionné)
+        """
+        if len(self.elements) < self.taille:
+            self.elements.append(element)
+            return True
+
+        if self.politique == POLITIQUE_NOUVEAU:
+            self.rejetes += 1
+            return False
+
+        if self.politique == POLITIQUE_FUSIONNER and cle is not None:
+            for index, existant in enumerate(self.elements):
+                if existant[0] == cle:
+                    self.elements[index] = element
+                    self.fusionnes += 1
+                    return True
+
+        self.elements.popleft()
+        self.elements.append(element)
+        self.rejetes += 1
+        return True
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🚦 Classe 02 – RepartiteurLogs
+# ║ Description : Traitement des logs par ordre de priorité
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class RepartiteurLogs:
+    """Traite en tâche de fond les logs déposés, la priorité haute en premier"""
+
+    def __init__(self, logger, expediteur=None):
+        """
+        Initialise le répartiteur
+
+        Args:
+            logger: Instance du logger pour les logs
+            expediteur: ExpediteurLogs dont la capacité d'envoi limite le débit
+        """
+        self.logger = logger
+        self.expediteur = expediteur
+
+        self.voies = [
+            VoieLogs("haute", config.LOGS_FILE_HAUTE, config.LOGS_POLITIQUE_HAUTE),
+            VoieLogs("moyenne", config.LOGS_FILE_MOYENNE, config.LOGS_POLITIQUE_MOYENNE),
+            VoieLogs("basse", config.LOGS_FILE_BASSE, config.LOGS_POLITIQUE_BASSE),
+        ]
+
+        self._disponible = asyncio.Event()
+        self._tache: Optional[asyncio.Task] = None
+
+    # ── 🔹 Dépôt ────────────────────────────────────────────────────────────────
+
+    def soumettre(
+        self,
+        priorite: int,
+        fonction: Callable[..., Awaitable[Any]],
+        *args,
+        cle_fusion: Optional[Hashable] = None,
+        **kwargs
+    ) -> bool:
+        """
+        Dépose un log sans attendre son envoi
+
+        Args:
+            priorite: PRIORITE_HAUTE, PRIORITE_MOYENNE ou PRIORITE_BASSE
+            fonction: Coroutine qui publie le log
+            *args: Arguments de la coroutine
+            cle_fusion: Clé identifiant des logs remplaçables entre eux
+            **kwargs: Arguments nommés de la coroutine
+
+        Returns:
+            bool: False si le log a été refusé (file pleine)
+        """
+        voie = self.voies[priorite]
+        accepte = voie.deposer([cle_fusion, fonction, args, kwargs], cle_fusion)
+
+        if voie.rejetes and voie.rejetes % 100 == 1:
+            self.logger.warning(f"⚠️ File de logs {voie.nom} saturée : {voie.rejetes} log(s) abandonné(s)")
+
+        self._disponible.set()
+        return accepte
+
+    def _prochain(self) -> Optional[list]:
+        """Retire le prochain log, la voie la plus prioritaire d'abord"""
+        for voie in self.voies:
+            if voie.elements:
+                return voie.elements.popleft()
+        return None
+
+    # ── 🔹 Traitement ───────────────────────────────────────────────────────────
+
+    def demarrer(self):
+        """Lance la tâche de traitement"""
+        if self._tache is None:
+            self._tache = asyncio.create_task(self._boucle(), name="repartiteur_logs")
+
+    async def _boucle(self):
+        """Traite les logs déposés jusqu'à l'arrêt"""
+        while True:
+            element = self._prochain()
+            if element is None:
+                self._disponible.clear()
+                await self._disponible.wait()
+                continue
+
+            # ── 🔹 Contre-pression : les logs restent en file (bornée) tant que l'envoi est saturé
+            if self.expediteur is not None:
+                await self.expediteur.attendre_capacite()
+
+            await self._traiter(element)
+
+    async def _traiter(self, element: list):
+        """Exécute un log ; une erreur n'arrête pas le répartiteur"""
+        _, fonction, args, kwargs = element
+        try:
+            await fonction(*args, **kwargs)
+        except Exception as e:
+            self.logger.error(f"❌ Erreur lors du traitement d'un log : {e}")
+
+    async def arreter(self):
+        """Arrête la tâche puis traite les logs encore en file"""
+        if self._tache is not None:
+            self._tache.cancel()
+            try:
+                await self._tache
+            except asyncio.CancelledError:
+                pass
+            self._tache = None
+
+        element = self._prochain()
+        while element is not None:
+            await self._traiter(element)
+            element = self._prochain()
+
+    # ── 🔹 Métriques ────────────────────────────────────────────────────────────
+
+    def obtenir_metriques(self) -> Dict[str, Dict[str, int]]:
+        """Profondeur, rejets et fusions de chaque voie"""
+        return {
+            voie.nom: {
+                "profondeur": len(voie.elements),
+                "rejetes": voie.rejetes,
+                "fusionnes": voie.fusionnes
+            }
+            for voie in self.voies
+        }
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ ✅ FIN DU FICHIER – Répartiteur des logs Discord
+# ╚═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,197 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🦁 LA LOYAUTÉ - requete_logs.py
+# ║
+# ║ 🔎 Bot Discord privé développé en Python
+# ║ 👨‍💻 Développé par Latury
+# ║ 📦 Version : 0.3.0
+# ║
+# ═══════════════════════════════════════════════════════════════════════════════
+
+"""
+🦁 LA LOYAUTÉ - Recherche dans les logs JSON-lines
+══════════════════════════════════════════════════════════════════════════════
+Parcourt les fichiers .jsonl (rotations comprises, compressées ou non) ligne par ligne : les
+fichiers hors période sont ignorés et les lignes sont filtrées sur leur texte
+avant d'être décodées, sans jamais charger un fichier entier en mémoire
+
+Exemple :
+    python -m utilitaires.requete_logs --event message_delete --guild 123 --depuis 2026-10-13
+"""
+
+import argparse
+import gzip
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import configuration as config
+from utilitaires.logger import lire_plages
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📁 Fonction 01 – fichiers_json
+# ║ Description : Fichiers JSON-lines du dossier de logs, du plus ancien au plus récent
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def fichiers_json(dossier: str = None, depuis: Optional[float] = None, jusqua: Optional[float] = None) -> List[str]:
+    """
+    Liste les fichiers JSON-lines (fichier courant et rotations) couvrant une période
+
+    La plage horaire de chaque fichier est lue dans l'index tenu par le logger ;
+    un fichier absent de l'index est jugé sur sa date de dernière modification.
+
+    Args:
+        dossier: Dossier des logs (config.DOSSIER_LOGS par défaut)
+        depuis: Horodatage de début ; les fichiers terminés avant sont ignorés
+        jusqua: Horodatage de fin ; les fichiers commencés après sont ignorés
+
+    Returns:
+        list: Chemins triés du plus ancien au plus récent
+    """
+    dossier = dossier or config.DOSSIER_LOGS
+    if not os.path.isdir(dossier):
+        return []
+
+    plages = lire_plages(dossier)
+    fichiers = []
+    for nom in os.listdir(dossier):
+        if ".jsonl" not in nom or nom.endswith(".tmp"):
+            continue
+
+        chemin = os.path.join(dossier, nom)
+        plage = plages.get(nom[:-len(".gz")] if nom.endswith(".gz") else nom)
+        if plage is not None:
+            premier, dernier = plage
+        else:
+            premier = dernier = os.path.getmtime(chemin)
+
+        # ── 🔹 Fichier entièrement hors de la période : aucune ligne utile
+        if depuis is not None and dernier is not None and dernier < depuis:
+            continue
+        if jusqua is not None and plage is not None and premier > jusqua:
+            continue
+
+        fichiers.append((premier, chemin))
+
+    return [chemin for _, chemin in sorted(fichiers)]
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 🔎 Fonction 02 – rechercher_logs
+# ║ Description : Lignes correspondant aux critères, en flux
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def rechercher_logs(
+    event: Optional[str] = None,
+    guild_id: Optional[int] = None,
+    channel_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    depuis: Optional[datetime] = None,
+    jusqua: Optional[datetime] = None,
+    contient: Optional[str] = None,
+    limite: Optional[int] = None,
+    dossier: str = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Recherche des lignes de logs JSON (générateur)
+
+    Args:
+        event: Nom de l'événement (ex. message_delete)
+        guild_id: ID du serveur
+        channel_id: ID du salon
+        user_id: ID de l'utilisateur
+        depuis: Début de la période
+        jusqua: Fin de la période
+        contient: Texte recherché dans le message
+        limite: Nombre maximum de résultats
+
+    Yields:
+        dict: Lignes décodées, dans l'ordre d'écriture
+    """
+    debut = depuis.timestamp() if depuis else None
+    fin = jusqua.timestamp() if jusqua else None
+
+    # ── 🔹 Critères exacts, et leur forme textuelle pour le filtrage avant décodage
+    criteres = {
+        champ: valeur for champ, valeur in (
+            ("event", event), ("guild_id", guild_id), ("channel_id", channel_id), ("user_id", user_id)
+        ) if valeur is not None
+    }
+    fragments = [
+        f'"{champ}":{json.dumps(valeur, ensure_ascii=False)}' for champ, valeur in criteres.items()
+    ]
+    if contient:
+        fragments.append(json.dumps(contient, ensure_ascii=False)[1:-1])
+
+    trouves = 0
+    for chemin in fichiers_json(dossier, debut, fin):
+        try:
+            ouvrir = gzip.open if chemin.endswith(".gz") else open
+            with ouvrir(chemin, "rt", encoding="utf-8") as fichier:
+                for ligne in fichier:
+                    # ── 🔹 Filtrage sur le texte brut (aucun décodage JSON)
+                    if any(fragment not in ligne for fragment in fragments):
+                        continue
+
+                    try:
+                        entree = json.loads(ligne)
+                    except ValueError:
+                        continue
+
+                    # ── 🔹 Vérification exacte
+                    if any(entree.get(champ) != valeur for champ, valeur in criteres.items()):
+                        continue
+                    if debut is not None and entree.get("ts", 0) < debut:
+                        continue
+                    if fin is not None and entree.get("ts", 0) > fin:
+                        continue
+                    if contient and contient not in entree.get("message", ""):
+                        continue
+
+                    yield entree
+
+                    trouves += 1
+                    if limite is not None and trouves >= limite:
+                        return
+        except OSError as e:
+            print(f"⚠️ Lecture impossible de {chemin} : {e}")
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 💻 Fonction 03 – main
+# ║ Description : Outil en ligne de commande
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+def main(arguments: Optional[List[str]] = None):
+    """Affiche les lignes correspondant aux critères de la ligne de commande"""
+    analyseur = argparse.ArgumentParser(description="Recherche dans les logs JSON-lines de La Loyauté")
+    analyseur.add_argument("--event", help="Nom de l'événement (ex. message_delete)")
+    analyseur.add_argument("--guild", type=int, help="ID du serveur")
+    analyseur.add_argument("--channel", type=int, help="ID du salon")
+    analyseur.add_argument("--user", type=int, help="ID de l'utilisateur")
+    analyseur.add_argument("--depuis", type=datetime.fromisoformat, help="Début (AAAA-MM-JJ[THH:MM])")
+    analyseur.add_argument("--jusqua", type=datetime.fromisoformat, help="Fin (AAAA-MM-JJ[THH:MM])")
+    analyseur.add_argument("--contient", help="Texte recherché dans le message")
+    analyseur.add_argument("--limite", type=int, help="Nombre maximum de résultats")
+    analyseur.add_argument("--dossier", help="Dossier des logs")
+    options = analyseur.parse_args(arguments)
+
+    for entree in rechercher_logs(
+        event=options.event,
+        guild_id=options.guild,
+        channel_id=options.channel,
+        user_id=options.user,
+        depuis=options.depuis,
+        jusqua=options.jusqua,
+        contient=options.contient,
+        limite=options.limite,
+        dossier=options.dossier
+    ):
+        print(json.dumps(entree, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ ✅ FIN DU FICHIER – Recherche dans les logs JSON-lines
+# ╚═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,130 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║
+# ║ 🦁 LA LOYAUTÉ - spool_logs.py
+# ║
+# ║ 📥 Bot Discord privé développé en Python
+# ║ 👨‍💻 Développé par Latury
+# ║ 📦 Version : 0.3.0
+# ║
+# ═══════════════════════════════════════════════════════════════════════════════
+
+"""
+🦁 LA LOYAUTÉ - File disque des logs Discord non livrés
+══════════════════════════════════════════════════════════════════════════════
+Les embeds qui n'ont pas pu être envoyés (panne Discord, salon inaccessible)
+sont conservés dans SQLite puis renvoyés dans l'ordre par l'expéditeur
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, List, Tuple
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📁 Constantes
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+FICHIER_SPOOL = "donnees/spool_logs.db"
+
+# ╔══════════════════════════════════════════════════════════════════════════════
+# ║ 📥 Classe 01 – SpoolLogs
+# ║ Description : File SQLite bornée (méthodes bloquantes, à exécuter hors boucle)
+# ╚══════════════════════════════════════════════════════════════════════════════
+
+class SpoolLogs:
+    """File d'attente disque des embeds de logs non livrés"""
+
+    def __init__(self, chemin: str, taille_max: int):
+        """
+        Initialise la file disque
+
+        Args:
+            chemin: Chemin de la base SQLite
+            taille_max: Nombre maximum d'embeds conservés (les plus anciens sont abandonnés)
+        """
+        self.chemin = chemin
+        self.taille_max = taille_max
+
+        dossier = os.path.dirname(chemin)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+
+        self.connexion = sqlite3.connect(chemin, check_same_thread=False)
+        self.connexion.execute("PRAGMA journal_mode=WAL")
+        self.connexion.execute(
+            """
+            CREATE TABLE IF NOT EXISTS spool (
+                id        INTEGER PRIMARY KEY AUTOINCREMENT,
+                salon_id  INTEGER NOT NULL,
+                embed     TEXT NOT NULL,
+                cree      REAL NOT NULL
+            )
+            """
+        )
+        self.connexion.commit()
+
+        self.taille = self.connexion.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+
+    def ajouter(self, salon_id: int, embeds: List[Dict]) -> int:
+        """
+        Ajoute des embeds (dictionnaires) en fin de file
+
+        Returns:
+            int: Nombre d'anciens embeds abandonnés pour respecter la taille maximale
+        """
+        maintenant = time.time()
+        abandonnes = 0
+        with self.connexion:
+            self.connexion.executemany(
+                "INSERT INTO spool (salon_id, embed, cree) VALUES (?, ?, ?)",
+                [(salon_id, json.dumps(embed, ensure_ascii=False), maintenant) for embed in embeds]
+            )
+            taille = self.taille + len(embeds)
+
+            if taille > self.taille_max:
+                abandonnes = self.connexion.execute(
+                    "DELETE FROM spool WHERE id IN (SELECT id FROM spool ORDER BY id LIMIT ?)",
+                    (taille - self.taille_max,)
+                ).rowcount
+                # ── 🔹 Taille relue dans la transaction de l'élagage (aucune dérive possible)
+                taille = self.connexion.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+
+        # ── 🔹 Taille mise à jour seulement une fois la transaction validée
+        self.taille = taille
+        return abandonnes
+
+    def salons_en_attente(self) -> List[int]:
+        """Salons ayant des embeds en attente, le plus ancien en premier"""
+        return [
+            salon_id for salon_id, in self.connexion.execute(
+                "SELECT salon_id FROM spool GROUP BY salon_id ORDER BY MIN(id)"
+            )
+        ]
+
+    def lire(self, salon_id: int, limite: int) -> List[Tuple[int, Dict]]:
+        """Lit les plus anciens embeds d'un salon : [(id, embed)]"""
+        return [
+            (identifiant, json.loads(embed))
+            for identifiant, embed in self.connexion.execute(
+                "SELECT id, embed FROM spool WHERE salon_id = ? ORDER BY id LIMIT ?",
+                (salon_id, limite)
+            )
+        ]
+
+    def supprimer(self, identifiants: List[int]):
+        """Retire les embeds renvoyés avec succès"""
+        with self.connexion:
+            # ── 🔹 Lignes réellement supprimées (certaines ont pu être élaguées entre-temps)
+            supprimes = self.connexion.executemany(
+                "DELETE FROM spool WHERE id = ?", [(i,) for i in identifiants]
+            ).rowcount
+        self.taille -= supprimes
+
+    def fermer(self):
+        """Ferme la connexion SQLite"""
+        self.connexion.close()
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ║ ✅ FIN DU FICHIER – File disque des logs Discord non livrés
+# ╚═══════════════════════════════════════════════════════════════════════════════